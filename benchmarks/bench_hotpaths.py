@@ -0,0 +1,129 @@
+"""
+Per-frame hot path benchmarks
+
+Times Game.update, Game.draw, Ant.update, Snake.update, HUD.draw,
+GameSounds.update_music and Game.generate_background separately on a
+game built with the requested entity counts, then records how
+Game.update and Game.draw scale as the ant count grows.
+
+Usage:
+    python benchmarks/bench_hotpaths.py --output bench.json
+    python benchmarks/bench_hotpaths.py --ants 500 --scaling 10,100,1000
+    python benchmarks/compare.py old.json bench.json
+"""
+
+import argparse
+import time
+from harness import build_game, time_calls, percentiles, environment, write_json
+from background import generate_background_array
+
+def bench_ant_update(game, ticks):
+    """Latency of individual Ant.update calls over several ticks"""
+    samples = []
+    cursor_pos = game.get_cursor_pos()
+    for _ in range(ticks):
+        game.clock.tick()
+        obstacles = game.rocks + game.plants + game.bushes
+        for ant in list(game.ants):
+            start = time.perf_counter()
+            ant.update(cursor_pos, game.snake.position, obstacles,
+                       game.resource_grid, game.colony_grid)
+            samples.append((time.perf_counter() - start) * 1000)
+            game.ant_grid.update(ant)
+    return percentiles(samples)
+
+def bench_swarm_update(game, repeat):
+    """Latency of one batched AntSwarm.update over all ants"""
+    cursor_pos = game.get_cursor_pos()
+
+    def tick():
+        game.clock.tick()
+        game.ants.update(cursor_pos, game.snake.position, game.resource_grid,
+                         game.colony_grid, game.ant_grid)
+    return time_calls(tick, repeat)
+
+def bench_update_music(game, repeat):
+    """update_music cost on the game thread (synthesis runs on the producer)"""
+    sounds = game.sounds
+    if sounds.music_generator is None:
+        return {'skipped': 'audio mixer unavailable'}
+    sounds.is_playing = True
+    try:
+        return time_calls(lambda: sounds.update_music(game.game_state), repeat)
+    finally:
+        sounds.is_playing = False
+        if sounds.producer is not None:
+            sounds.producer.stop()
+            sounds.producer = None
+
+def bench_hotpaths(args):
+    game = build_game(ants=args.ants, colonies=args.colonies, rocks=args.rocks,
+                      plants=args.plants, bushes=args.bushes, webs=args.webs,
+                      seed=args.seed, swarm=args.swarm)
+    results = {}
+    results['Game.update'] = time_calls(game.step, args.repeat)
+    results['Game.draw'] = time_calls(game.draw, args.repeat)
+
+    game = build_game(ants=args.ants, colonies=args.colonies, rocks=args.rocks,
+                      plants=args.plants, bushes=args.bushes, webs=args.webs,
+                      seed=args.seed, swarm=args.swarm)
+    if args.swarm:
+        results['AntSwarm.update'] = bench_swarm_update(game, args.repeat)
+    else:
+        results['Ant.update'] = bench_ant_update(game, max(1, args.repeat // 10))
+
+    cursor_pos = game.get_cursor_pos()
+    results['Snake.update'] = time_calls(
+        lambda: game.snake.update(cursor_pos, game.ants, game.colonies), args.repeat)
+    results['HUD.draw'] = time_calls(
+        lambda: game.hud.draw(game.screen, game.colonies, game.ants, (0, 0)), args.repeat)
+    results['GameSounds.update_music'] = bench_update_music(game, args.repeat)
+    results['Game.generate_background'] = time_calls(game.generate_background, 5, warmup=1)
+    results['generate_background_array'] = time_calls(
+        lambda: generate_background_array(game.width, game.height), 3, warmup=0)
+    return results
+
+def bench_scaling(args):
+    """Game.update and Game.draw latency as the ant count grows"""
+    curve = []
+    for ants in args.scaling:
+        game = build_game(ants=ants, colonies=args.colonies, rocks=args.rocks,
+                          plants=args.plants, bushes=args.bushes, webs=args.webs,
+                          seed=args.seed, swarm=args.swarm)
+        repeat = max(5, args.repeat * 100 // max(ants, 100))
+        point = {'ants': ants}
+        point['Game.update'] = time_calls(game.step, repeat, warmup=1)
+        point['Game.draw'] = time_calls(game.draw, repeat, warmup=1)
+        curve.append(point)
+        print(f"{ants:>6} ants: update p50 {point['Game.update']['p50_ms']:.2f}ms, "
+              f"draw p50 {point['Game.draw']['p50_ms']:.2f}ms")
+    return curve
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-frame hot paths")
+    parser.add_argument('--ants', type=int, default=200, help="Ants for the hot path timings")
+    parser.add_argument('--colonies', type=int, default=3)
+    parser.add_argument('--rocks', type=int, default=25)
+    parser.add_argument('--plants', type=int, default=25)
+    parser.add_argument('--bushes', type=int, default=25)
+    parser.add_argument('--webs', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=100, help="Timed calls per hot path")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--swarm', action='store_true', help="Use the vectorized ant swarm")
+    parser.add_argument('--scaling', default='10,100,1000,10000',
+                        help="Comma separated ant counts for the scaling curve ('' to skip)")
+    parser.add_argument('--output', default='-', help="JSON output path ('-' for stdout)")
+    args = parser.parse_args()
+    args.scaling = [int(n) for n in args.scaling.split(',') if n]
+
+    result = {
+        'benchmark': 'hotpaths',
+        'environment': environment(),
+        'config': {key: value for key, value in vars(args).items() if key != 'output'},
+        'hotpaths': bench_hotpaths(args),
+        'scaling': bench_scaling(args)
+    }
+    write_json(result, args.output)
+
+if __name__ == "__main__":
+    main()
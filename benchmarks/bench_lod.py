@@ -0,0 +1,96 @@
+"""
+Deposit rates and cost of the ant level-of-detail scheduler
+
+Runs the same seeded games with the scheduler on and with every ant
+fully updated every tick (see src/lod.py), and compares how much the
+colonies gathered and how long the ants took to update. Colonies are
+kept from spending, so their stores count every deposit. Individual
+runs drift apart as soon as one ant decides a tick later, so the check
+is on the total over several seeds: it exits non-zero if the deposits
+with the scheduler differ from the full runs by more than the tolerance.
+
+Usage:
+    python benchmarks/bench_lod.py --ants 400 --seeds 4 --output lod.json
+"""
+
+import argparse
+import sys
+import time
+from harness import build_game, environment, write_json
+from profiler import Profiler
+
+# Largest accepted relative difference in total deposits; seed-to-seed
+# noise between two full runs is a few percent at the default sizes
+TOLERANCE = 0.05
+
+def deposits(game):
+    return sum(colony.resources['minerals'] + colony.resources['plants']
+               for colony in game.colonies)
+
+def run(seed, ants, ticks, lod):
+    """Simulate one game, returning what it deposited and the ant update times"""
+    game = build_game(ants=ants, colonies=2, seed=seed, headless=True, lod=lod)
+    profiler = Profiler(enabled=True)
+    profiler.WINDOW = None  # Keep every sample
+    game.profiler = profiler
+    for colony in game.colonies:
+        colony.max_ants = 0  # No spending on new ants
+    start_deposits = deposits(game)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        game.step()
+    wall_ms = (time.perf_counter() - start) * 1000
+    result = {
+        'deposited': deposits(game) - start_deposits,
+        'ants_left': len(game.ants),
+        'wall_ms': wall_ms,
+        'ants_ms': sum(profiler.samples.get('update.ants', []))
+    }
+    if game.lod:
+        updates = game.lod.full_updates + game.lod.glides
+        result['full_update_share'] = game.lod.full_updates / updates if updates else 1.0
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ant scheduler with full updates")
+    parser.add_argument('--ants', type=int, default=400)
+    parser.add_argument('--ticks', type=int, default=2400, help="Updates per run (60 per second)")
+    parser.add_argument('--seeds', type=int, default=4)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help="Largest accepted relative difference in total deposits")
+    parser.add_argument('--output', default='-', help="JSON output path ('-' for stdout)")
+    args = parser.parse_args()
+
+    runs = {'full': [], 'lod': []}
+    for seed in range(1, args.seeds + 1):
+        for mode in runs:
+            runs[mode].append(run(seed, args.ants, args.ticks, lod=(mode == 'lod')))
+        full, lod = runs['full'][-1], runs['lod'][-1]
+        print(f"seed {seed}: deposited {full['deposited']} full, {lod['deposited']} lod; "
+              f"ants {full['ants_ms']:.0f}ms full, {lod['ants_ms']:.0f}ms lod")
+
+    totals = {mode: {key: sum(result[key] for result in results)
+                     for key in ('deposited', 'wall_ms', 'ants_ms')}
+              for mode, results in runs.items()}
+    difference = (totals['lod']['deposited'] - totals['full']['deposited']) / max(totals['full']['deposited'], 1)
+    speedup = totals['full']['ants_ms'] / max(totals['lod']['ants_ms'], 1e-9)
+    passed = abs(difference) <= args.tolerance
+    print(f"Deposits {difference:+.1%} (tolerance {args.tolerance:.0%}): {'ok' if passed else 'EXCEEDED'}")
+    print(f"Ant updates {speedup:.2f}x faster")
+
+    write_json({
+        'benchmark': 'lod',
+        'environment': environment(),
+        'config': {'ants': args.ants, 'ticks': args.ticks, 'seeds': args.seeds,
+                   'tolerance': args.tolerance},
+        'runs': runs,
+        'totals': totals,
+        'deposit_difference': difference,
+        'ant_update_speedup': speedup,
+        'passed': passed
+    }, args.output)
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
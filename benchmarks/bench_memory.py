@@ -0,0 +1,87 @@
+"""
+Resident memory per entity
+
+Allocates N ants (as Ant objects and in the vectorized AntSwarm) plus
+rocks, plants, bushes and webs under tracemalloc and reports the bytes
+each one costs. Exits non-zero if an ant costs more than the target,
+so it can guard against the footprint creeping back up.
+
+Usage:
+    python benchmarks/bench_memory.py --ants 20000 --output memory.json
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from harness import build_game, environment, write_json
+from entities import Ant, SpiderWeb
+from resources import Rock, Plant, Bush
+from swarm import AntSwarm
+
+# Budget per resident ant; tens of thousands of ants should stay in the low MBs.
+# A slotted Ant measures about 400 bytes, most of it the per-ant resources dict
+TARGET_BYTES_PER_ANT = 420
+
+def measure(factory, count):
+    """Average traced bytes per object created by factory()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The holding list is not part of the entities' own cost
+    list_bytes = sys.getsizeof(objects)
+    del objects
+    return (after - before - list_bytes) / count
+
+def measure_swarm(game, count):
+    """Average traced bytes per ant stored in an AntSwarm"""
+    template = Ant((100.0, 100.0), game)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    swarm = AntSwarm(game)
+    for _ in range(count):
+        swarm.append(template)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del swarm
+    return (after - before) / count
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory per entity")
+    parser.add_argument('--ants', type=int, default=20000)
+    parser.add_argument('--resources', type=int, default=2000)
+    parser.add_argument('--target', type=float, default=TARGET_BYTES_PER_ANT,
+                        help="Maximum bytes per Ant before failing")
+    parser.add_argument('--output', default='-', help="JSON output path ('-' for stdout)")
+    args = parser.parse_args()
+
+    game = build_game(ants=0, colonies=1, headless=True)
+    position = (100.0, 100.0)
+    per_object = {
+        'Ant': measure(lambda: Ant(position, game), args.ants),
+        'AntSwarm row': measure_swarm(game, args.ants),
+        'Rock': measure(lambda: Rock(position), args.resources),
+        'Plant': measure(lambda: Plant(position, game), args.resources),
+        'Bush': measure(lambda: Bush(position), args.resources),
+        'SpiderWeb': measure(lambda: SpiderWeb(position, game), args.resources)
+    }
+    for name, size in per_object.items():
+        print(f"{name:<14}{size:10.1f} bytes")
+
+    passed = per_object['Ant'] <= args.target
+    print(f"Ant target {args.target:.0f} bytes: {'ok' if passed else 'EXCEEDED'}")
+    write_json({
+        'benchmark': 'memory',
+        'environment': environment(),
+        'config': {'ants': args.ants, 'resources': args.resources, 'target': args.target},
+        'bytes_per_object': per_object,
+        'passed': passed
+    }, args.output)
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
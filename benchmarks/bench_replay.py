@@ -0,0 +1,73 @@
+"""
+Frame times of a recorded play session
+
+Replays an input recording made with `python src/main.py --record PATH`
+through the full game loop as fast as it will run, with the profiler
+keeping every sample, and reports the latency of each profiled span and
+the final simulation state. The recording fixes the seed, the frame
+lengths, every event and the cursor, so two builds replaying the same
+file do exactly the same work and their results can be diffed with
+compare.py. A change in the final state means the build no longer
+simulates the session the same way.
+
+--no-render skips drawing to time the simulation alone. Colonies only
+place their clickable indicators when drawn, so clicks on them are
+missed and the final state will differ from a rendered replay; compare
+--no-render results only with each other.
+
+Usage:
+    python src/main.py --record session.rec
+    python benchmarks/bench_replay.py session.rec --output replay.json
+    python benchmarks/compare.py before.json replay.json
+"""
+
+import argparse
+import time
+from harness import percentiles, environment, write_json
+from clock import SimulationClock
+from game import Game
+from headless import summarize
+from profiler import Profiler
+from replay import InputReplay
+
+def bench_replay(replay, render=True):
+    """Play the recording once, returning span timings and the final state"""
+    profiler = Profiler(enabled=True)
+    profiler.WINDOW = None  # Keep every sample, not just the overlay's window
+    game = Game(clock=SimulationClock(replay.tick_ms), swarm=replay.swarm,
+                profiler=profiler, seed=replay.seed, world_size=replay.world)
+    game.intro_state = 'game_running'
+    game.render_enabled = render
+    game.input = replay
+
+    start = time.perf_counter()
+    game.run()
+    wall_ms = (time.perf_counter() - start) * 1000
+    return {
+        'wall_ms': wall_ms,
+        'spans': {name: percentiles(list(samples)) for name, samples in profiler.samples.items()},
+        'final': summarize(game)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session and time its frames")
+    parser.add_argument('recording', help="File written by main.py --record")
+    parser.add_argument('--no-render', action='store_true', help="Only time the simulation (see above)")
+    parser.add_argument('--output', default='-', help="JSON output path ('-' for stdout)")
+    args = parser.parse_args()
+
+    replay = InputReplay.load(args.recording)
+    print(f"Replaying {len(replay)} frames ({replay.duration_ms / 1000:.0f}s of play)")
+    result = {
+        'benchmark': 'replay',
+        'environment': environment(),
+        'config': {'recording': args.recording, 'frames': len(replay), 'seed': replay.seed,
+                   'swarm': replay.swarm, 'world': list(replay.world),
+                   'render': not args.no_render},
+        'replay': bench_replay(replay, render=not args.no_render)
+    }
+    print(f"Replayed in {result['replay']['wall_ms'] / 1000:.1f}s")
+    write_json(result, args.output)
+
+if __name__ == "__main__":
+    main()
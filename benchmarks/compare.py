@@ -0,0 +1,51 @@
+"""
+Compare two benchmark JSON results
+
+Prints the p50 and mean latency of every timing present in both files
+and the relative change, so results from two commits can be diffed.
+
+Usage:
+    python benchmarks/compare.py before.json after.json
+"""
+
+import argparse
+import json
+
+def flatten(result, prefix=''):
+    """Map 'section/name' -> stats for every timing dict in a result"""
+    timings = {}
+    if isinstance(result, dict):
+        if 'p50_ms' in result:
+            timings[prefix] = result
+            return timings
+        for key, value in result.items():
+            if key in ('environment', 'config'):
+                continue
+            timings.update(flatten(value, f"{prefix}/{key}" if prefix else key))
+    elif isinstance(result, list):
+        for item in result:
+            label = item.get('ants', '?') if isinstance(item, dict) else '?'
+            timings.update(flatten(item, f"{prefix}[{label}]"))
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two benchmark JSON files")
+    parser.add_argument('before')
+    parser.add_argument('after')
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = flatten(json.load(f))
+    with open(args.after) as f:
+        after = flatten(json.load(f))
+
+    print(f"{'timing':<52} {'p50 before':>11} {'p50 after':>11} {'change':>8}")
+    for name in sorted(set(before) & set(after)):
+        old, new = before[name]['p50_ms'], after[name]['p50_ms']
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"{name:<52} {old:>9.3f}ms {new:>9.3f}ms {change:>+7.1f}%")
+    for name in sorted(set(before) ^ set(after)):
+        print(f"{name:<52} only in {'before' if name in before else 'after'}")
+
+if __name__ == "__main__":
+    main()
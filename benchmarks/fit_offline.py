@@ -0,0 +1,147 @@
+"""
+Fit the offline progress rates to full simulation runs
+
+advance_offline (src/offline.py) credits each colony a fixed yield per
+ant-second instead of simulating its ants. This runs seeded headless
+games with expansion off and measures what their ants gathered per
+ant-second by day and by night, and how often the snake caught one.
+Those measurements are the first guess; the day rates are then scaled
+until offline runs over the same days gather the same totals as the full
+runs, since a colony's ant count (and so its yield) compounds with what
+it has gathered. Prints the fitted values for constants.Offline and how
+far the current ones are off.
+
+Rerun after changing anything that affects how fast ants gather.
+
+Usage:
+    python benchmarks/fit_offline.py --days 3 --seeds 1 2 --output offline.json
+"""
+
+import argparse
+from harness import environment, write_json
+from constants import DAY_NIGHT, Economy, Offline
+from headless import create_headless_game, summarize
+from offline import advance_offline
+
+RATES = ('MINERALS_PER_ANT_S', 'PLANTS_PER_ANT_S', 'NIGHT_YIELD', 'SNAKE_KILLS_PER_ANT_HOUR')
+
+def gathered(start, end):
+    """Minerals and plants gathered between two summaries, counting what new ants cost"""
+    spawned = end['ants'] - start['ants'] + end['snake_kills'] - start['snake_kills']
+    return (end['minerals'] - start['minerals'] + spawned * Economy.Costs.ANT_MINERALS,
+            end['plants'] - start['plants'] + spawned * Economy.Costs.ANT_PLANTS)
+
+def full_run(seed, days, lod):
+    """Simulate a game frame by frame, tallying yields by time of day"""
+    game = create_headless_game(seed, lod=lod)
+    start = summarize(game)
+    tally = {phase: {'minerals': 0, 'plants': 0, 'ant_ms': 0, 'kills': 0}
+             for phase in ('day', 'night')}
+    end_time = days * DAY_NIGHT['CYCLE_DURATION']
+    while game.clock.get_ticks() < end_time and game.running:
+        before = summarize(game)
+        game.step()
+        after = summarize(game)
+        minerals, plants = gathered(before, after)
+        phase = tally[game.current_time_of_day]
+        phase['minerals'] += minerals
+        phase['plants'] += plants
+        phase['ant_ms'] += before['ants'] * game.tick_ms
+        phase['kills'] += after['snake_kills'] - before['snake_kills']
+    end = summarize(game)
+    return {'seed': seed, 'tally': tally, 'summary': end, 'gathered': gathered(start, end)}
+
+def offline_run(seed, days, rates):
+    """Advance a fresh game over the same days with the coarse model"""
+    saved = {name: getattr(Offline, name) for name in RATES}
+    for name, value in rates.items():
+        setattr(Offline, name, value)
+    try:
+        game = create_headless_game(seed)
+        start = summarize(game)
+        advance_offline(game, days * DAY_NIGHT['CYCLE_DURATION'])
+        end = summarize(game)
+    finally:
+        for name, value in saved.items():
+            setattr(Offline, name, value)
+    return {'seed': seed, 'summary': end, 'gathered': gathered(start, end)}
+
+def measured_rates(runs):
+    """Per-ant yields pooled over every full run"""
+    totals = {phase: {key: sum(run['tally'][phase][key] for run in runs)
+                      for key in ('minerals', 'plants', 'ant_ms', 'kills')}
+              for phase in ('day', 'night')}
+    day, night = totals['day'], totals['night']
+    day_seconds = max(day['ant_ms'], 1) / 1000
+    night_seconds = max(night['ant_ms'], 1) / 1000
+    day_yield = (day['minerals'] + day['plants']) / day_seconds
+    night_yield = (night['minerals'] + night['plants']) / night_seconds
+    return {
+        'MINERALS_PER_ANT_S': day['minerals'] / day_seconds,
+        'PLANTS_PER_ANT_S': day['plants'] / day_seconds,
+        'NIGHT_YIELD': night_yield / day_yield if day_yield else 0.0,
+        'SNAKE_KILLS_PER_ANT_HOUR': day['kills'] / day_seconds * 3600
+    }
+
+def errors(full_runs, offline_runs):
+    """Relative error of the offline totals against the full ones, per resource"""
+    result = {}
+    for index, resource in enumerate(('minerals', 'plants')):
+        full = sum(run['gathered'][index] for run in full_runs)
+        offline = sum(run['gathered'][index] for run in offline_runs)
+        result[resource] = (offline - full) / max(full, 1)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit constants.Offline to full headless runs")
+    parser.add_argument('--days', type=float, default=3.0, help="Day/night cycles per run")
+    parser.add_argument('--seeds', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--no-lod', action='store_true',
+                        help="Fit against full runs with every ant updated every tick")
+    parser.add_argument('--iterations', type=int, default=8,
+                        help="Most rounds of scaling the day rates to match the totals")
+    parser.add_argument('--output', default='-', help="JSON output path ('-' for stdout)")
+    args = parser.parse_args()
+
+    full_runs = []
+    for seed in args.seeds:
+        full_runs.append(full_run(seed, args.days, lod=not args.no_lod))
+        minerals, plants = full_runs[-1]['gathered']
+        print(f"seed {seed}: gathered {minerals} minerals, {plants} plants in full run")
+
+    current = {name: getattr(Offline, name) for name in RATES}
+    current_errors = errors(full_runs, [offline_run(seed, args.days, current) for seed in args.seeds])
+
+    rates = measured_rates(full_runs)
+    for _ in range(args.iterations):
+        fitted_errors = errors(full_runs, [offline_run(seed, args.days, rates) for seed in args.seeds])
+        if max(abs(error) for error in fitted_errors.values()) < 0.01:
+            break
+        rates['MINERALS_PER_ANT_S'] /= 1 + fitted_errors['minerals']
+        rates['PLANTS_PER_ANT_S'] /= 1 + fitted_errors['plants']
+    offline_runs = [offline_run(seed, args.days, rates) for seed in args.seeds]
+    fitted_errors = errors(full_runs, offline_runs)
+    per_seed = [errors([full], [offline]) for full, offline in zip(full_runs, offline_runs)]
+
+    print(f"Current rates: minerals {current_errors['minerals']:+.1%}, "
+          f"plants {current_errors['plants']:+.1%}")
+    print(f"Fitted rates: minerals {fitted_errors['minerals']:+.1%}, "
+          f"plants {fitted_errors['plants']:+.1%}")
+    for seed, seed_errors in zip(args.seeds, per_seed):
+        print(f"  seed {seed}: minerals {seed_errors['minerals']:+.1%}, "
+              f"plants {seed_errors['plants']:+.1%}")
+    for name in RATES:
+        print(f"    {name} = {rates[name]:.2f}")
+
+    write_json({
+        'benchmark': 'fit_offline',
+        'environment': environment(),
+        'config': {'days': args.days, 'seeds': args.seeds, 'lod': not args.no_lod},
+        'full_runs': [{key: run[key] for key in ('seed', 'tally', 'summary', 'gathered')}
+                      for run in full_runs],
+        'current': {'rates': current, 'errors': current_errors},
+        'fitted': {'rates': rates, 'errors': fitted_errors, 'per_seed': per_seed}
+    }, args.output)
+
+if __name__ == "__main__":
+    main()
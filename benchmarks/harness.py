@@ -0,0 +1,120 @@
+"""
+Shared helpers for the benchmark scripts
+
+Sets up a display-less pygame, puts src/ on the import path, builds Game
+instances with chosen entity counts and times callables into latency
+percentiles.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+from pathlib import Path
+
+# Render to an off-screen surface and keep the mixer quiet
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import numpy as np
+import pygame
+
+pygame.init()
+
+from game import Game
+from entities import Colony, Ant, SpiderWeb
+from resources import Rock, Plant, Bush
+
+def build_game(ants=100, colonies=1, rocks=25, plants=25, bushes=25, webs=0,
+               seed=1, headless=False, swarm=False, lod=True):
+    """Create a running game with exactly the requested entity counts"""
+    game = Game(headless=headless, swarm=swarm, seed=seed, lod=lod)
+    game.intro_state = 'game_running'
+    width, height = game.width, game.height
+    rng = game.rng.simulation
+
+    def anywhere(margin=20):
+        return (rng.uniform(margin, width - margin), rng.uniform(margin, height - margin))
+
+    game.rocks = [Rock(anywhere(), rng) for _ in range(rocks)]
+    game.plants = [Plant(anywhere(), game, rng) for _ in range(plants)]
+    game.bushes = [Bush(anywhere(), rng) for _ in range(bushes)]
+    for plant in game.plants:
+        plant.is_growing = False
+        plant.growth_scale = 1.0
+
+    game.colonies = []
+    for i in range(colonies):
+        colony = Colony(anywhere(40), game, is_main=(i == 0))
+        game.colonies.append(colony)
+
+    game.ants.clear()
+    for i in range(ants):
+        ant = Ant(anywhere(), game)
+        ant.home_colony = game.colonies[i % colonies] if colonies else None
+        game.ants.append(ant)
+    for colony in game.colonies:
+        colony.ant_count = sum(1 for ant in game.ants if ant.home_colony is colony)
+        colony.max_ants = max(colony.max_ants, colony.ant_count)
+
+    game.webs = [SpiderWeb(anywhere(), game) for _ in range(webs)]
+    game.sync_spatial_indexes()
+    return game
+
+def percentiles(samples_ms):
+    """Summary statistics for a list of per-call timings in milliseconds"""
+    values = np.asarray(samples_ms, dtype=float)
+    if len(values) == 0:
+        return {'calls': 0}
+    return {
+        'calls': int(len(values)),
+        'mean_ms': float(values.mean()),
+        'min_ms': float(values.min()),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p90_ms': float(np.percentile(values, 90)),
+        'p99_ms': float(np.percentile(values, 99)),
+        'max_ms': float(values.max())
+    }
+
+def time_calls(fn, repeat=50, warmup=3):
+    """Call fn repeatedly and return latency percentiles"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+def environment():
+    """Metadata identifying where and on what a result was produced"""
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                         cwd=ROOT, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'platform': platform.platform()
+    }
+
+def write_json(result, path):
+    """Write a result to path, or print it when path is '-'"""
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if path == '-':
+        print(text)
+    else:
+        Path(path).write_text(text + '\n')
+        print(f"Wrote {path}")
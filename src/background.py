@@ -0,0 +1,125 @@
+import numpy as np
+import noise
+import pygame
+from constants import Background
+from utils import cache_path
+
+# Forest floor colors (earthier tones)
+FLOOR_COLORS = {
+    'dark': (65, 42, 25),     # Dark earth
+    'base': (82, 53, 31),     # Medium earth
+    'light': (98, 63, 37),    # Light earth
+    'detail': (73, 47, 28)    # Detail earth
+}
+
+CACHE_VERSION = 1  # Bump when the generator output changes
+
+def _tile_noise(width, height, tile_size, noise_scale, origin, repeat):
+    """Per-tile base and line noise, shaped (tiles_x, tiles_y)"""
+    repeat_x, repeat_y = repeat
+    xs = np.arange(origin[0] - origin[0] % tile_size, origin[0] + width, tile_size)
+    ys = np.arange(origin[1] - origin[1] % tile_size, origin[1] + height, tile_size)
+    base = np.empty((len(xs), len(ys)))
+    lines = np.empty((len(xs), len(ys)))
+    pnoise2 = noise.pnoise2
+    for i, x in enumerate(xs.tolist()):
+        for j, y in enumerate(ys.tolist()):
+            # Two different noise values for more texture
+            base[i, j] = pnoise2(x / noise_scale, y / noise_scale,
+                                 octaves=4, persistence=0.6, lacunarity=2.5,
+                                 repeatx=repeat_x, repeaty=repeat_y, base=42)
+            # Second noise for line pattern
+            lines[i, j] = pnoise2(x / 10, y / 10,
+                                  octaves=1, persistence=0.5, lacunarity=2.0,
+                                  repeatx=repeat_x, repeaty=repeat_y, base=17)
+    return base, lines
+
+def generate_background_array(width, height, tile_size=Background.TILE_SIZE,
+                              noise_scale=Background.NOISE_SCALE, seed=Background.SEED,
+                              origin=(0, 0), repeat=None):
+    """Build the forest floor texture as a (width, height, 3) uint8 array
+
+    Noise is sampled once per tile and expanded to pixels with NumPy, so
+    the per-pixel work (color bands, fine lines, detail speckles) is done
+    in a handful of array operations.
+
+    Args:
+        origin: World position of the top-left pixel, for chunked maps
+        repeat: Noise repeat period, defaults to (width, height)
+    """
+    if repeat is None:
+        repeat = (width, height)
+    base, lines = _tile_noise(width, height, tile_size, noise_scale, origin, repeat)
+
+    # Expand tiles to pixels and crop to the requested area
+    skip_x, skip_y = origin[0] % tile_size, origin[1] % tile_size
+    base = np.repeat(np.repeat(base, tile_size, axis=0), tile_size, axis=1)
+    lines = np.repeat(np.repeat(lines, tile_size, axis=0), tile_size, axis=1)
+    base = base[skip_x:skip_x + width, skip_y:skip_y + height]
+    lines = lines[skip_x:skip_x + width, skip_y:skip_y + height]
+
+    # Base color selection
+    pixels = np.empty((width, height, 3), dtype=np.int16)
+    pixels[:] = FLOOR_COLORS['base']
+    pixels[base > 0.2] = FLOOR_COLORS['light']
+    pixels[base < -0.2] = FLOOR_COLORS['dark']
+
+    # Fine line pattern
+    line_offset = (((lines + 1) / 2) * 4).astype(np.int64)  # Normalize to 0-4
+    pixel_y = np.arange(origin[1], origin[1] + height)[None, :]
+    on_line = (pixel_y + line_offset) % 4 == 0
+    pixels[on_line] -= 12
+
+    # Subtle noise variation on 10% of pixels
+    rng = np.random.RandomState(seed)
+    detail = rng.random_sample((width, height)) < 0.1
+    pixels[detail] += rng.randint(-5, 6, size=(int(detail.sum()), 3)).astype(np.int16)
+
+    return np.clip(pixels, 0, 255).astype(np.uint8)
+
+def _load_cached(key, shape, generate):
+    """Pixels from the cache file named key, generating and caching them on a miss"""
+    path = cache_path(key)
+    pixels = None
+    if path and path.exists():
+        try:
+            pixels = np.load(path)
+            if pixels.shape != shape:
+                pixels = None
+        except (OSError, ValueError) as e:
+            print(f"Error loading cached background: {e}")
+            pixels = None
+
+    if pixels is None:
+        pixels = generate()
+        if path:
+            try:
+                np.save(path, pixels)
+            except OSError as e:
+                print(f"Error caching background: {e}")
+    return pixels
+
+def load_background(width, height, tile_size=Background.TILE_SIZE,
+                    noise_scale=Background.NOISE_SCALE, seed=Background.SEED):
+    """Return the background surface, generating and caching it on first use"""
+    key = f"background_v{CACHE_VERSION}_{width}x{height}_t{tile_size}_s{noise_scale:g}_r{seed}.npy"
+    pixels = _load_cached(key, (width, height, 3),
+                          lambda: generate_background_array(width, height, tile_size, noise_scale, seed))
+    return pygame.surfarray.make_surface(pixels)
+
+def load_chunk(world_size, origin, size, tile_size=Background.TILE_SIZE,
+               noise_scale=Background.NOISE_SCALE, seed=Background.SEED):
+    """Surface of one terrain chunk of a large map (see world.Terrain)
+
+    The noise repeats over the whole world, so chunks line up seamlessly;
+    each chunk gets its own detail speckles, seeded from its origin.
+    """
+    (world_width, world_height), (x, y), (width, height) = world_size, origin, size
+    key = (f"chunk_v{CACHE_VERSION}_{world_width}x{world_height}_{x}_{y}_{width}x{height}"
+           f"_t{tile_size}_s{noise_scale:g}_r{seed}.npy")
+    chunk_seed = (seed * 1000003 + x * 7919 + y) % 2**32
+    pixels = _load_cached(key, (width, height, 3),
+                          lambda: generate_background_array(width, height, tile_size, noise_scale,
+                                                            chunk_seed, origin=origin,
+                                                            repeat=world_size))
+    return pygame.surfarray.make_surface(pixels)
@@ -0,0 +1,51 @@
+import pygame
+from constants import FPS
+
+class GameClock:
+    """Wall-clock timing for the interactive game, backed by pygame"""
+    def __init__(self):
+        self._clock = pygame.time.Clock()
+
+    def tick(self, framerate=0):
+        """Wait for the next frame and return the milliseconds it took"""
+        return self._clock.tick(framerate)
+
+    def get_time(self):
+        """Milliseconds elapsed during the previous tick"""
+        return self._clock.get_time()
+
+    def get_ticks(self):
+        """Milliseconds since pygame was initialized"""
+        return pygame.time.get_ticks()
+
+    def get_fps(self):
+        return self._clock.get_fps()
+
+class SimulationClock:
+    """Simulated clock that only advances when ticked
+
+    Mirrors the parts of pygame.time.Clock the game uses, but time moves
+    forward by a fixed step per tick instead of following the wall clock.
+    This lets the simulation run without a display, as fast as the CPU allows.
+    """
+    def __init__(self, step_ms=1000 / FPS, start_ms=0):
+        self.step_ms = step_ms
+        self.elapsed = start_ms
+        self.last_step = 0
+
+    def tick(self, framerate=0):
+        """Advance simulated time by one step (framerate is ignored)"""
+        self.elapsed += self.step_ms
+        self.last_step = self.step_ms
+        return self.step_ms
+
+    def get_time(self):
+        """Milliseconds simulated during the previous tick"""
+        return self.last_step
+
+    def get_ticks(self):
+        """Simulated milliseconds since the clock started"""
+        return int(self.elapsed)
+
+    def get_fps(self):
+        return 1000 / self.step_ms if self.step_ms else 0.0
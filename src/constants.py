@@ -166,6 +166,39 @@ class Behavior:
         'SNAKE_NIGHT_SPEED': 0.0  # Snake doesn't move at night
     }
 
+# Simulation Timing
+class Simulation:
+    TICK_MS = 1000 / FPS        # Simulated time per fixed update
+    BASE_TICK_MS = 1000 / FPS   # Tick length per-tick speeds were tuned for
+    MAX_FRAME_MS = 250          # Longest real frame banked (avoids catch-up spirals)
+    MAX_TICKS_PER_FRAME = 5     # Updates allowed per rendered frame at normal speed
+    AUTOSAVE_MS = 30000         # Simulated time between autosaves (main.py --save)
+
+# Offline Progress (coarse model for time spent away, see offline.py)
+class Offline:
+    TICK_MS = 1000                  # Simulated time per coarse tick
+    MAX_AWAY_MS = 12 * 3600 * 1000  # Longest absence credited
+    # Per-ant yields by day, fitted to full headless runs by benchmarks/fit_offline.py
+    MINERALS_PER_ANT_S = 0.52
+    PLANTS_PER_ANT_S = 0.62
+    NIGHT_YIELD = 0.04              # Ants huddle near their colony at night
+    SNAKE_KILLS_PER_ANT_HOUR = 7.6  # Daytime only; the snake sleeps at night
+
+# World Map (see world.py)
+class World:
+    WIDTH = WINDOW_WIDTH        # Default map size; main.py --world makes it larger
+    HEIGHT = WINDOW_HEIGHT
+    CHUNK_SIZE = 160            # Terrain chunk edge in pixels (a multiple of TILE_SIZE)
+    MAX_CACHED_CHUNKS = 40      # Chunk surfaces kept before the least recently seen is dropped
+    SCROLL_SPEED = 0.6          # Camera pixels per real millisecond
+    ACTIVE_MARGIN = 160         # Region around the view simulated at the normal level of detail
+    FAR_TICK_INTERVAL = 8       # Ants further out are fully updated once every this many ticks
+
+# Ant Level of Detail (see lod.py)
+class LOD:
+    NEAR_RADIUS = 2 * PERCEPTION_RADIUS  # Ants this close to a threat or web update every tick
+    INTERVAL = 4                         # Other ants are fully updated once every this many ticks
+
 # Animation Timings
 class Animation:
     # Intro Sequence
@@ -181,6 +214,7 @@ class Animation:
 class Background:
     TILE_SIZE = 4
     NOISE_SCALE = 25.0
+    SEED = 42  # Seeds the per-pixel detail speckles
 
 # UI Settings
 class UI:
@@ -3,10 +3,11 @@ import random
 import logging
 import math
 from resources import Rock, Plant, Bush
+from sprites import render_text
 from constants import (
     Economy, Behavior, COLONY_MIN_SIZE, COLONY_MAX_SIZE, 
     ANT_SIZE, UI, COLORS, RESOURCE_EFFECTS, PERCEPTION_RADIUS, VISUALS,
-    DAY_NIGHT, WINDOW_WIDTH, WINDOW_HEIGHT  # Added DAY_NIGHT and window dimensions
+    DAY_NIGHT  # Added DAY_NIGHT
 )
 import noise
 
@@ -19,9 +20,16 @@ COLOR_GLOW_YELLOW = (255, 255, 0) # Yellow glow
 COLOR_COLONY_OUTLINE = (173, 216, 230)  # Baby blue
 
 class Colony:
-    def __init__(self, position, ants, game, is_main=True):
+    # Colony animation is pre-rendered once per colony type. The gear turns
+    # 2 degrees a frame (its 8 teeth repeat every 22.5 frames) and the
+    # conveyor repeats every 8 frames, so 360 frames hold both cycles exactly
+    STRIP_FRAMES = 360
+    GEAR_STEP = 2
+    CONVEYOR_CYCLE = 8
+    animation_strips = {}  # is_main -> frames, indexed [light_phase][frame]
+
+    def __init__(self, position, game, is_main=True):
         self.position = position
-        self.sprite = pygame.Surface((COLONY_MIN_SIZE, COLONY_MIN_SIZE))
         self.is_main = is_main
         self.resources = {
             'minerals': Economy.COLONY_INITIAL_MINERALS if is_main else 0,
@@ -38,29 +46,26 @@ class Colony:
         self.ant_indicator_rect = None
         self.colony_indicator_rect = None
 
-        # Add factory animation properties
-        self.factory_noise = self.generate_factory_pattern()
-        self.gear_rotation = 0
-        self.conveyor_offset = 0
-        self.light_flash_timer = 0
-        self.working_parts = []  # Store animated machinery parts
-        self.generate_working_parts()
+        # Position in the shared factory animation strip
+        self.animation_frame = 0
+        self.light_phase = 0
 
         # Spawn initial ants if this is the main colony
         if is_main:
-            self.spawn_initial_ants(ants)
+            self.spawn_initial_ants()
 
-    def spawn_initial_ants(self, ants):
+    def spawn_initial_ants(self):
         """Spawn 2 initial ants for the main colony"""
+        rng = self.game.rng.simulation
         for _ in range(2):
             if self.ant_count < self.max_ants:
                 ant_position = (
-                    self.position[0] + random.randint(-10, 10),
-                    self.position[1] + random.randint(-10, 10)
+                    self.position[0] + rng.randint(-10, 10),
+                    self.position[1] + rng.randint(-10, 10)
                 )
                 new_ant = Ant(ant_position, self.game)
                 new_ant.home_colony = self
-                ants.append(new_ant)
+                self.game.add_ant(new_ant)
                 self.ant_count += 1
 
     def can_spawn_ant(self):
@@ -75,22 +80,23 @@ class Colony:
                 self.resources['plants'] >= Economy.Costs.NEW_COLONY_PLANTS and 
                 self.is_main)  # Only main colony can create new colonies
 
-    def spawn_ant(self, ants):
+    def spawn_ant(self):
         """Spawn a new ant if resources are available"""
+        rng = self.game.rng.simulation
         if self.can_spawn_ant():
             ant_position = (
-                self.position[0] + random.randint(-10, 10),
-                self.position[1] + random.randint(-10, 10)
+                self.position[0] + rng.randint(-10, 10),
+                self.position[1] + rng.randint(-10, 10)
             )
             new_ant = Ant(ant_position, self.game)
             new_ant.home_colony = self
-            ants.append(new_ant)
+            self.game.add_ant(new_ant)
             self.ant_count += 1
             self.resources['minerals'] -= Economy.Costs.ANT_MINERALS
             self.resources['plants'] -= Economy.Costs.ANT_PLANTS
             self.game.sounds.play_ant_spawn()
 
-    def update(self, current_time, ants):
+    def update(self, current_time):
         """Automatically decide when to spawn ants based on resources"""
         if current_time - self.spawn_timer >= self.spawn_interval:
             self.spawn_timer = current_time
@@ -100,11 +106,12 @@ class Colony:
                 # Higher priority to spawn when fewer ants
                 spawn_priority = (self.max_ants - self.ant_count) / self.max_ants
                 
-                if random.random() < spawn_priority:
-                    self.spawn_ant(ants)
+                if self.game.rng.simulation.random() < spawn_priority:
+                    self.spawn_ant()
                     logging.debug(f"Colony auto-spawned ant. Current count: {self.ant_count}/{self.max_ants}")
 
-    def generate_factory_pattern(self):
+    @staticmethod
+    def generate_factory_pattern(rng):
         """Generate a noise-based factory texture"""
         size = COLONY_MAX_SIZE
         pattern = pygame.Surface((size, size))
@@ -119,7 +126,7 @@ class Colony:
         
         # Add "circuit" lines
         for _ in range(5):
-            start = random.randint(0, size-1)
+            start = rng.randint(0, size-1)
             pygame.draw.line(pattern, (50, 50, 50), 
                            (0, start), (size, start), 1)
             pygame.draw.line(pattern, (50, 50, 50), 
@@ -127,13 +134,15 @@ class Colony:
         
         return pattern
 
-    def generate_working_parts(self):
+    @staticmethod
+    def generate_working_parts(rng):
         """Generate animated machinery parts"""
         size = COLONY_MAX_SIZE
         center = size // 2
+        working_parts = []
         
         # Add gears
-        self.working_parts.append({
+        working_parts.append({
             'type': 'gear',
             'pos': (center - 5, center - 5),
             'size': 6,
@@ -141,7 +150,7 @@ class Colony:
         })
         
         # Add conveyor belts
-        self.working_parts.append({
+        working_parts.append({
             'type': 'conveyor',
             'pos': (5, center),
             'width': size - 10,
@@ -151,44 +160,73 @@ class Colony:
         
         # Add blinking lights
         for _ in range(3):
-            self.working_parts.append({
+            working_parts.append({
                 'type': 'light',
-                'pos': (random.randint(2, size-2), random.randint(2, size-2)),
+                'pos': (rng.randint(2, size-2), rng.randint(2, size-2)),
                 'size': 2,
-                'state': random.random() < 0.5
+                'state': rng.random() < 0.5
             })
+        return working_parts
+
+    @classmethod
+    def animation_strip(cls, is_main):
+        """Frames shared by every colony of one type, built on first use"""
+        strip = cls.animation_strips.get(is_main)
+        if strip is None:
+            strip = cls.animation_strips[is_main] = cls.build_animation_strip(is_main)
+        return strip
+
+    @classmethod
+    def build_animation_strip(cls, is_main):
+        """Render every gear/conveyor frame for both light phases"""
+        size = COLONY_MAX_SIZE
+        # Fixed layout per type, so the strip is the same every run
+        rng = random.Random(1 if is_main else 2)
+        factory_noise = cls.generate_factory_pattern(rng)
+        working_parts = cls.generate_working_parts(rng)
 
-    def draw(self, surface):
+        strip = ([], [])
+        for light_phase, frames in enumerate(strip):
+            for frame in range(cls.STRIP_FRAMES):
+                colony_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                colony_surface.blit(factory_noise, (0, 0))
+                
+                for part in working_parts:
+                    if part['type'] == 'gear':
+                        cls.draw_gear(colony_surface, part, frame * cls.GEAR_STEP)
+                    elif part['type'] == 'conveyor':
+                        cls.draw_conveyor(colony_surface, part, frame % cls.CONVEYOR_CYCLE)
+                    elif part['type'] == 'light':
+                        cls.draw_light(colony_surface, part, part['state'] != bool(light_phase))
+                
+                # Draw outline for secondary colonies
+                if not is_main:
+                    pygame.draw.rect(colony_surface, COLORS['COLONY_OUTLINE'], 
+                                   (0, 0, size, size), 2)
+                frames.append(colony_surface)
+        return strip
+
+    def bounds(self):
+        """Screen area covered by the factory, resource bars and indicators"""
+        # Bars reach 24px either side; bars and indicators end below the factory
+        return pygame.Rect(self.position[0] - 25, self.position[1] - COLONY_MAX_SIZE // 2 - 1,
+                           51, COLONY_MAX_SIZE + 7)
+
+    def draw(self, surface, origin=(0, 0)):
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
         current_time = pygame.time.get_ticks()
         size = COLONY_MAX_SIZE
         
-        # Create colony surface with factory pattern
-        colony_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        colony_surface.blit(self.factory_noise, (0, 0))
-        
-        # Update and draw working parts
-        self.gear_rotation += 2
-        self.conveyor_offset = (self.conveyor_offset + 1) % 8
-        
-        for part in self.working_parts:
-            if part['type'] == 'gear':
-                self.draw_gear(colony_surface, part)
-            elif part['type'] == 'conveyor':
-                self.draw_conveyor(colony_surface, part)
-            elif part['type'] == 'light':
-                if current_time % 1000 < 500:  # Blink every half second
-                    part['state'] = not part['state']
-                self.draw_light(colony_surface, part)
-        
-        # Draw outline for secondary colonies
-        if not self.is_main:
-            pygame.draw.rect(colony_surface, COLORS['COLONY_OUTLINE'], 
-                           (0, 0, size, size), 2)
+        # Advance the machinery animation
+        self.animation_frame = (self.animation_frame + 1) % self.STRIP_FRAMES
+        if current_time % 1000 < 500:  # Blink every half second
+            self.light_phase ^= 1
         
         # Draw to main surface
-        surface.blit(colony_surface, 
-                    (self.position[0] - size // 2,
-                     self.position[1] - size // 2))
+        frames = self.animation_strip(self.is_main)[self.light_phase]
+        surface.blit(frames[self.animation_frame], 
+                    (screen_x - size // 2,
+                     screen_y - size // 2))
         
         # Update flash state
         if current_time - self.flash_timer > self.flash_interval:
@@ -196,18 +234,19 @@ class Colony:
             self.flash_state = not self.flash_state
         
         # Draw resource bars and indicators
-        self.draw_resource_bars(surface)
-        self.draw_indicators(surface)
+        self.draw_resource_bars(surface, origin)
+        self.draw_indicators(surface, origin)
 
-    def draw_gear(self, surface, gear):
-        """Draw a rotating gear"""
+    @staticmethod
+    def draw_gear(surface, gear, rotation):
+        """Draw a gear turned to rotation degrees"""
         center = (gear['pos'][0] + gear['size'], gear['pos'][1] + gear['size'])
         teeth = 8
         inner_radius = gear['size'] - 2
         outer_radius = gear['size']
         
         for i in range(teeth):
-            angle = self.gear_rotation + (i * 360 / teeth)
+            angle = rotation + (i * 360 / teeth)
             rad = math.radians(angle)
             
             # Draw gear tooth
@@ -217,27 +256,30 @@ class Colony:
                    center[1] + outer_radius * math.sin(rad))
             pygame.draw.line(surface, (100, 100, 100), start, end, 2)
 
-    def draw_conveyor(self, surface, conveyor):
-        """Draw an animated conveyor belt"""
+    @staticmethod
+    def draw_conveyor(surface, conveyor, offset):
+        """Draw a conveyor belt with its segments moved by offset"""
         rect = pygame.Rect(conveyor['pos'][0], conveyor['pos'][1],
                           conveyor['width'], conveyor['height'])
         pygame.draw.rect(surface, (80, 80, 80), rect)
         
         # Draw moving segments
         for x in range(conveyor['pos'][0], conveyor['pos'][0] + conveyor['width'], 4):
-            pos = (x + self.conveyor_offset) % (conveyor['width'] + 4)
+            pos = (x + offset) % (conveyor['width'] + 4)
             pygame.draw.line(surface, (60, 60, 60),
                            (pos, conveyor['pos'][1]),
                            (pos, conveyor['pos'][1] + conveyor['height']))
 
-    def draw_light(self, surface, light):
-        """Draw a blinking indicator light"""
-        color = (0, 255, 0) if light['state'] else (0, 100, 0)
+    @staticmethod
+    def draw_light(surface, light, state):
+        """Draw an indicator light, lit when state is true"""
+        color = (0, 255, 0) if state else (0, 100, 0)
         pygame.draw.circle(surface, color,
                          light['pos'], light['size'])
 
-    def draw_resource_bars(self, surface):
+    def draw_resource_bars(self, surface, origin=(0, 0)):
         """Draw minimal resource indicators near colony"""
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
         # Small dots or thin bars below colony
         bar_width = 20
         bar_height = 2
@@ -246,32 +288,33 @@ class Colony:
         # Minerals bar (brown)
         mineral_percent = min(1, self.resources['minerals'] / UI.Bars.MAX_MINERAL_VALUE)
         pygame.draw.rect(surface, UI.Bars.BACKGROUND,
-                        (self.position[0] - bar_width - spacing, 
-                         self.position[1] + COLONY_MAX_SIZE//2 + 2,
+                        (screen_x - bar_width - spacing, 
+                         screen_y + COLONY_MAX_SIZE//2 + 2,
                          bar_width, bar_height))
         pygame.draw.rect(surface, UI.Bars.MINERAL,
-                        (self.position[0] - bar_width - spacing,
-                         self.position[1] + COLONY_MAX_SIZE//2 + 2,
+                        (screen_x - bar_width - spacing,
+                         screen_y + COLONY_MAX_SIZE//2 + 2,
                          bar_width * mineral_percent, bar_height))
         
         # Plants bar (green)
         plant_percent = min(1, self.resources['plants'] / UI.Bars.MAX_PLANT_VALUE)
         pygame.draw.rect(surface, UI.Bars.BACKGROUND,
-                        (self.position[0] + spacing,
-                         self.position[1] + COLONY_MAX_SIZE//2 + 2,
+                        (screen_x + spacing,
+                         screen_y + COLONY_MAX_SIZE//2 + 2,
                          bar_width, bar_height))
         pygame.draw.rect(surface, UI.Bars.PLANT,
-                        (self.position[0] + spacing,
-                         self.position[1] + COLONY_MAX_SIZE//2 + 2,
+                        (screen_x + spacing,
+                         screen_y + COLONY_MAX_SIZE//2 + 2,
                          bar_width * plant_percent, bar_height))
 
-    def draw_indicators(self, surface):
+    def draw_indicators(self, surface, origin=(0, 0)):
         """Draw ant spawn and colony creation indicators"""
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
         # Draw ant spawn indicator
         if self.can_spawn_ant():
             self.ant_indicator_rect = pygame.Rect(
-                self.position[0] - UI.Indicators.SIZE // 2,
-                self.position[1] + UI.Indicators.VERTICAL_OFFSET,
+                screen_x - UI.Indicators.SIZE // 2,
+                screen_y + UI.Indicators.VERTICAL_OFFSET,
                 UI.Indicators.SIZE,
                 UI.Indicators.SIZE
             )
@@ -282,8 +325,8 @@ class Colony:
         # Draw colony creation indicator
         if self.can_create_colony():
             self.colony_indicator_rect = pygame.Rect(
-                self.position[0] + UI.Indicators.SIZE + UI.Indicators.SPACING,
-                self.position[1] + UI.Indicators.VERTICAL_OFFSET,
+                screen_x + UI.Indicators.SIZE + UI.Indicators.SPACING,
+                screen_y + UI.Indicators.VERTICAL_OFFSET,
                 UI.Indicators.SIZE,
                 UI.Indicators.SIZE
             )
@@ -300,20 +343,26 @@ class Colony:
         return None
 
 class Ant:
+    # Ants can number in the tens of thousands: keep instances slot-based
+    # and share everything that is the same for every ant on the class
+    __slots__ = ('position', 'resources', 'speed', 'perception_radius',
+                 'jump_height', 'jump_count', 'is_jumping', 'direction',
+                 'home_colony', 'state', 'target_resource', 'scuttle_offset',
+                 'game', 'web_slow_timer')
+
+    carry_capacity = 10
+    edge_buffer = 20  # Distance from edge to trigger turn around
+
     def __init__(self, position, game):
+        rng = game.rng.simulation
         self.position = position
-        self.sprite = pygame.Surface((ANT_SIZE, ANT_SIZE))
         self.resources = {'minerals': 0, 'plants': 0}
-        self.carry_capacity = 10
         self.speed = 1.0  # Slower speed for better control
         self.perception_radius = PERCEPTION_RADIUS
         self.jump_height = 0
         self.jump_count = 0
         self.is_jumping = False
-        self.direction = [random.choice([-1, 1]), random.choice([-1, 1])]
-        self.window_width = 480  # Game window width
-        self.window_height = 800  # Game window height
-        self.edge_buffer = 20  # Distance from edge to trigger turn around
+        self.direction = [rng.choice([-1, 1]), rng.choice([-1, 1])]
         self.home_colony = None  # Reference to the colony this ant belongs to
         self.state = 'exploring'  # States: 'exploring', 'collecting', 'returning'
         self.target_resource = None
@@ -321,10 +370,18 @@ class Ant:
         self.game = game  # Store game reference
         self.web_slow_timer = 0  # Timer for web slowdown effect
 
-    def draw(self, surface):
+    def bounds(self):
+        """Screen area draw() can touch, including jump, scuttle and particles"""
+        reach = ANT_SIZE + 2
+        top = self.position[1] - self.jump_height - 2 - reach
+        return pygame.Rect(self.position[0] - reach, top, reach * 2 + 1, reach * 2 + 6)
+
+    def draw(self, surface, origin=(0, 0)):
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
+        rng = self.game.rng.cosmetic
         try:
             # Calculate position with jump offset and scuttle animation
-            draw_y = self.position[1] - self.jump_height + math.sin(self.scuttle_offset) * 2
+            draw_y = screen_y - self.jump_height + math.sin(self.scuttle_offset) * 2
             
             # Update scuttle animation
             self.scuttle_offset += 0.2
@@ -338,31 +395,31 @@ class Ant:
                 
                 if self.resources['minerals'] > 0:
                     # Draw mineral sparkles
-                    if random.random() < RESOURCE_EFFECTS['PARTICLE_CHANCE']['MINERAL']:
+                    if rng.random() < RESOURCE_EFFECTS['PARTICLE_CHANCE']['MINERAL']:
                         sparkle_color = VISUALS['ENTITIES']['ANT']['CARRYING']['MINERAL']['SPARKLE']
                         for _ in range(RESOURCE_EFFECTS['PARTICLES_PER_SPAWN']):
                             particle_pos = (
-                                self.position[0] + random.randint(-ANT_SIZE, ANT_SIZE),
-                                draw_y + random.randint(-ANT_SIZE, ANT_SIZE)
+                                screen_x + rng.randint(-ANT_SIZE, ANT_SIZE),
+                                draw_y + rng.randint(-ANT_SIZE, ANT_SIZE)
                             )
                             pygame.draw.circle(surface, sparkle_color, 
                                             particle_pos, RESOURCE_EFFECTS['PARTICLE_SIZE']['MINERAL'])
                 else:  # Plants
                     # Draw plant particles
-                    if random.random() < RESOURCE_EFFECTS['PARTICLE_CHANCE']['PLANT']:
+                    if rng.random() < RESOURCE_EFFECTS['PARTICLE_CHANCE']['PLANT']:
                         particle_color = VISUALS['ENTITIES']['ANT']['CARRYING']['PLANT']['PARTICLE']
                         for _ in range(RESOURCE_EFFECTS['PARTICLES_PER_SPAWN']):
                             particle_pos = (
-                                self.position[0] + random.randint(-ANT_SIZE, ANT_SIZE),
-                                draw_y + random.randint(-ANT_SIZE, ANT_SIZE)
+                                screen_x + rng.randint(-ANT_SIZE, ANT_SIZE),
+                                draw_y + rng.randint(-ANT_SIZE, ANT_SIZE)
                             )
                             min_size, max_size = RESOURCE_EFFECTS['PARTICLE_SIZE']['PLANT']
-                            particle_size = random.randint(min_size, max_size)
+                            particle_size = rng.randint(min_size, max_size)
                             pygame.draw.circle(surface, particle_color, particle_pos, particle_size)
             
             # Draw the ant
             ant_rect = pygame.Rect(
-                self.position[0] - ANT_SIZE // 2,
+                screen_x - ANT_SIZE // 2,
                 draw_y - ANT_SIZE // 2,
                 ANT_SIZE,
                 ANT_SIZE
@@ -373,14 +430,14 @@ class Ant:
             print(f"Error in ant draw method: {e}")
             # Fallback to basic ant drawing
             pygame.draw.rect(surface, COLORS['ANT'], 
-                           (self.position[0] - ANT_SIZE//2, 
-                            self.position[1] - ANT_SIZE//2,
+                           (screen_x - ANT_SIZE//2, 
+                            screen_y - ANT_SIZE//2,
                             ANT_SIZE, ANT_SIZE))
 
     def update(self, cursor_pos, snake_pos, obstacles, resources, colonies):
         # Update web effect
         if self.web_slow_timer > 0:
-            self.web_slow_timer -= self.game.clock.get_time()
+            self.web_slow_timer -= self.game.dt
             # Ant moves at half speed while in web and jumps
             current_speed = self.speed * 0.5
             if not self.is_jumping:
@@ -404,8 +461,8 @@ class Ant:
         # Update jump animation
         self.update_jump()
 
-        # Move ant and handle boundaries
-        self.move(obstacles, current_speed)
+        # Move ant and handle boundaries (speeds are per base tick)
+        self.move(obstacles, current_speed * self.game.tick_scale)
 
         # Only continue with resource collection if no threats were detected
         if not threat_detected:
@@ -419,13 +476,15 @@ class Ant:
 
     def perceive_threat(self, threat_pos):
         """Check if a threat is within perception radius"""
+        if threat_pos is None:  # No cursor in headless runs
+            return False
         return math.hypot(self.position[0] - threat_pos[0],
                          self.position[1] - threat_pos[1]) < self.perception_radius
 
     def flee(self):
         """Choose a random direction when fleeing from threats"""
         # Generate random angle between 0 and 2π
-        flee_angle = random.uniform(0, 2 * math.pi)
+        flee_angle = self.game.rng.simulation.uniform(0, 2 * math.pi)
         
         # Convert angle to direction vector
         self.direction = [
@@ -452,7 +511,7 @@ class Ant:
         if self.is_jumping:
             if self.jump_count < 2:  # Two jumps as per documentation
                 self.jump_height = 5 * math.sin(self.jump_count * math.pi)
-                self.jump_count += 0.1
+                self.jump_count += 0.1 * self.game.tick_scale
             else:
                 self.is_jumping = False
                 self.jump_height = 0
@@ -464,7 +523,7 @@ class Ant:
         if self.position[0] <= self.edge_buffer:  # Near left edge
             self.direction[0] = abs(self.direction[0])  # Force movement right
             near_edge = True
-        elif self.position[0] >= self.window_width - self.edge_buffer:  # Near right edge
+        elif self.position[0] >= self.game.width - self.edge_buffer:  # Near right edge
             self.direction[0] = -abs(self.direction[0])  # Force movement left
             near_edge = True
 
@@ -472,7 +531,7 @@ class Ant:
         if self.position[1] <= self.edge_buffer:  # Near top edge
             self.direction[1] = abs(self.direction[1])  # Force movement down
             near_edge = True
-        elif self.position[1] >= self.window_height - self.edge_buffer:  # Near bottom edge
+        elif self.position[1] >= self.game.height - self.edge_buffer:  # Near bottom edge
             self.direction[1] = -abs(self.direction[1])  # Force movement up
             near_edge = True
 
@@ -493,34 +552,34 @@ class Ant:
 
         # Ensure the new position stays within bounds
         new_pos = (
-            max(0, min(new_pos[0], self.window_width)),
-            max(0, min(new_pos[1], self.window_height))
+            max(0, min(new_pos[0], self.game.width)),
+            max(0, min(new_pos[1], self.game.height))
         )
 
         self.position = new_pos
 
     def explore(self, resources):
-        """Look for resources while exploring"""
+        """Look for resources while exploring
+
+        Args:
+            resources: SpatialHash of rocks, plants and bushes
+        """
         if self.resources['minerals'] >= self.carry_capacity or self.resources['plants'] >= self.carry_capacity:
             self.state = 'returning'
             return
 
         # Check for nearby resources (including bushes)
-        for resource in resources:
-            distance = math.hypot(self.position[0] - resource.position[0],
-                                self.position[1] - resource.position[1])
-            
-            if distance < self.perception_radius:
-                self.target_resource = resource
-                self.state = 'collecting'
-                self.start_jump()
-                # Move towards resource
-                dx = resource.position[0] - self.position[0]
-                dy = resource.position[1] - self.position[1]
-                total = abs(dx) + abs(dy)
-                if total != 0:
-                    self.direction = [dx/total, dy/total]
-                break
+        resource, _ = resources.nearest(self.position, self.perception_radius)
+        if resource is not None:
+            self.target_resource = resource
+            self.state = 'collecting'
+            self.start_jump()
+            # Move towards resource
+            dx = resource.position[0] - self.position[0]
+            dy = resource.position[1] - self.position[1]
+            total = abs(dx) + abs(dy)
+            if total != 0:
+                self.direction = [dx/total, dy/total]
 
     def collect_resources(self):
         """Collect resources when near them"""
@@ -574,17 +633,16 @@ class Ant:
                 self.target_resource = None
 
     def return_to_colony(self, colonies):
-        """Return to nearest colony when carrying resources"""
+        """Return to nearest colony when carrying resources
+
+        Args:
+            colonies: SpatialHash of colonies
+        """
         if not colonies:
             return
 
         # Find nearest colony
-        nearest_colony = min(colonies, 
-                           key=lambda c: math.hypot(self.position[0] - c.position[0],
-                                                  self.position[1] - c.position[1]))
-        
-        distance = math.hypot(self.position[0] - nearest_colony.position[0],
-                            self.position[1] - nearest_colony.position[1])
+        nearest_colony, distance = colonies.nearest(self.position)
 
         # Move towards colony
         if distance > ANT_SIZE + COLONY_MIN_SIZE:
@@ -604,13 +662,14 @@ class Ant:
 
 class Snake:
     def __init__(self, position, game):
+        rng = game.rng.simulation
         self.position = position
         self.body = [position]  # Head is at index 0
         self.size = 4
         self.length = 15  # Initial length
         self.speed = 1  # Reduced from 2 to 1 for slower movement
         self.perception_radius = 10  # Reduced perception radius
-        self.direction = [random.choice([-1, 1]), random.choice([-1, 1])]
+        self.direction = [rng.choice([-1, 1]), rng.choice([-1, 1])]
         self.wave_offset = 0  # For wave animation
         self.game = game
         self.is_sleeping = False
@@ -621,31 +680,17 @@ class Snake:
         self.z_spawn_interval = 1000  # Spawn new Z every second
 
     def update(self, mouse_pos, ants, colonies):
+        rng = self.game.rng.simulation
         # Don't update position or chase ants if sleeping
         if self.is_sleeping:
             return False
         
         # Move towards nearest ant within perception radius (from head position)
-        nearest_ant = None
-        nearest_distance = float('inf')
-        
-        # Only check for ants near the snake's head
-        for ant in ants:
-            distance = math.hypot(self.position[0] - ant.position[0],
-                                self.position[1] - ant.position[1])
-            if distance < self.perception_radius and distance < nearest_distance:
-                # Check if ant is not in a colony
-                in_colony = False
-                for colony in colonies:
-                    colony_distance = math.hypot(ant.position[0] - colony.position[0],
-                                              ant.position[1] - colony.position[1])
-                    if colony_distance < COLONY_MIN_SIZE:
-                        in_colony = True
-                        break
-                
-                if not in_colony:
-                    nearest_ant = ant
-                    nearest_distance = distance
+        # that is not sheltering inside a colony
+        colony_grid = self.game.colony_grid
+        nearest_ant, nearest_distance = self.game.ant_grid.nearest(
+            self.position, self.perception_radius,
+            predicate=lambda ant: colony_grid.count(ant.position, COLONY_MIN_SIZE) == 0)
 
         # Update direction based on nearest ant or random movement
         if nearest_ant:
@@ -661,22 +706,24 @@ class Snake:
                 if nearest_ant.home_colony:
                     nearest_ant.home_colony.ant_count -= 1
                 ants.remove(nearest_ant)
+                self.game.ant_grid.remove(nearest_ant)
                 self.length += 1
                 logging.debug(f"Snake ate ant! Total eaten: {self.length - 15}")
                 self.game.sounds.play_snake_eat()
                 return True  # Return True when kill happens
         else:
             # Random movement if no ants nearby
-            if random.random() < 0.02:  # 2% chance to change direction
-                self.direction = [random.choice([-1, 1]), random.choice([-1, 1])]
+            if rng.random() < 0.02:  # 2% chance to change direction
+                self.direction = [rng.choice([-1, 1]), rng.choice([-1, 1])]
 
-        # Update position
-        new_x = self.position[0] + self.direction[0] * self.speed
-        new_y = self.position[1] + self.direction[1] * self.speed
+        # Update position (speed is per base tick)
+        step = self.speed * self.game.tick_scale
+        new_x = self.position[0] + self.direction[0] * step
+        new_y = self.position[1] + self.direction[1] * step
         
         # Keep snake in bounds
-        new_x = max(0, min(new_x, 480))
-        new_y = max(0, min(new_y, 800))
+        new_x = max(0, min(new_x, self.game.width))
+        new_y = max(0, min(new_y, self.game.height))
         
         # Update body positions
         self.body.insert(0, (new_x, new_y))
@@ -684,9 +731,26 @@ class Snake:
             self.body.pop()
         
         self.position = (new_x, new_y)
-        self.wave_offset += 0.2  # Update wave animation
+        self.wave_offset += 0.2 * self.game.tick_scale  # Update wave animation
 
-    def draw(self, surface, alpha=255):
+    def bounds(self):
+        """Screen area of the body (with its wave) or the coil and its Zs"""
+        points = self.sleep_coil if self.is_sleeping else self.body
+        xs = [x for x, _ in points] or [self.position[0]]
+        ys = [y for _, y in points] or [self.position[1]]
+        reach = self.size // 2 + 4  # Segment half size plus the wave
+        rect = pygame.Rect(min(xs) - reach, min(ys) - reach,
+                           max(xs) - min(xs) + reach * 2 + 1, max(ys) - min(ys) + reach * 2 + 1)
+        if self.is_sleeping:
+            # New Zs spawn at the head; live ones drift up to 12px a frame
+            rect.union_ip((self.position[0] - 14, self.position[1] - 2, 28, 22))
+            for z in self.sleep_zs:
+                rect.union_ip((z['pos'][0] - 14, z['pos'][1] - 14, 28, 34))
+        return rect
+
+    def draw(self, surface, alpha=255, origin=(0, 0)):
+        rng = self.game.rng.cosmetic
+        origin_x, origin_y = origin
         if self.is_sleeping:
             # Draw coiled sleeping snake first
             for i, pos in enumerate(self.sleep_coil):
@@ -694,8 +758,8 @@ class Snake:
                 pygame.draw.rect(segment_surface, VISUALS['ENTITIES']['SNAKE']['SLEEP'], 
                                (0, 0, self.size, self.size))
                 surface.blit(segment_surface, 
-                           (pos[0] - self.size // 2,
-                            pos[1] - self.size // 2))
+                           (pos[0] - origin_x - self.size // 2,
+                            pos[1] - origin_y - self.size // 2))
             
             # Update and draw sleeping Zs
             current_time = pygame.time.get_ticks()
@@ -704,14 +768,14 @@ class Snake:
             if current_time - self.z_spawn_timer > 500:  # Every 0.5 seconds
                 self.z_spawn_timer = current_time
                 # Use stored sleep center position
-                spawn_x = self.position[0] + random.uniform(-5, 5)  # Small random offset
+                spawn_x = self.position[0] + rng.uniform(-5, 5)  # Small random offset
                 spawn_y = self.position[1]  # Start from center of coil
                 
                 self.sleep_zs.append({
                     'pos': (spawn_x, spawn_y),
                     'size': 14,
                     'alpha': 255,
-                    'offset': random.uniform(-0.5, 0.5),
+                    'offset': rng.uniform(-0.5, 0.5),
                     'birth_time': current_time
                 })
             
@@ -728,15 +792,15 @@ class Snake:
                     size = 14 + math.sin(age * 0.01) * 2  # Slight size variation
                     alpha = max(0, 255 - (age / 800) * 255)  # Fade out
                     
-                    # Draw Z with shadow
-                    z_font = pygame.font.Font(None, int(size))
-                    shadow_surface = z_font.render("Z", True, (0, 0, 0))
-                    shadow_surface.set_alpha(alpha * 0.5)
-                    surface.blit(shadow_surface, (x - shadow_surface.get_width()//2 + 1, y + 1))
+                    # Draw Z with shadow; alpha is stepped so the cached renders are reused
+                    fade = int(alpha) // 16 * 16
+                    shadow_surface = render_text("Z", int(size), (0, 0, 0), alpha=fade // 2)
+                    surface.blit(shadow_surface, (x - origin_x - shadow_surface.get_width()//2 + 1,
+                                                  y - origin_y + 1))
                     
-                    z_surface = z_font.render("Z", True, VISUALS['ENTITIES']['SNAKE']['SLEEP_Z']['COLOR'])
-                    z_surface.set_alpha(alpha)
-                    surface.blit(z_surface, (x - z_surface.get_width()//2, y))
+                    z_surface = render_text("Z", int(size), VISUALS['ENTITIES']['SNAKE']['SLEEP_Z']['COLOR'],
+                                            alpha=fade)
+                    surface.blit(z_surface, (x - origin_x - z_surface.get_width()//2, y - origin_y))
                     
                     z['pos'] = (x, y)
                     z['alpha'] = alpha
@@ -751,8 +815,8 @@ class Snake:
                 pygame.draw.rect(segment_surface, COLORS['SNAKE'], 
                                (0, 0, self.size, self.size))
                 surface.blit(segment_surface, 
-                           (pos[0] - self.size // 2,
-                            pos[1] - self.size // 2 + wave_y))
+                           (pos[0] - origin_x - self.size // 2,
+                            pos[1] - origin_y - self.size // 2 + wave_y))
 
     def start_sleeping(self):
         """Coil the snake into sleeping position"""
@@ -821,6 +885,7 @@ class Spider:
         }
         
     def update(self, dt, plants, bushes, colonies, ants):
+        rng = self.game.rng.simulation
         if self.state == 'dying':
             self._update_death_animation(dt)
             return
@@ -830,7 +895,7 @@ class Spider:
             return
             
         # Check for daylight death
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.clock.get_ticks()
         cycle_time = (current_time - self.game.cycle_start_time) % DAY_NIGHT['CYCLE_DURATION']
         is_day = cycle_time < DAY_NIGHT['CYCLE_DURATION'] / 2
         
@@ -839,13 +904,13 @@ class Spider:
                 self.state = 'dying'
                 self.daylight_death_timer = 2000  # 2 seconds to die
                 self.speed *= 2  # Double speed for final run
-                self.flee_direction = [random.uniform(-1, 1), random.uniform(-1, 1)]
+                self.flee_direction = [rng.uniform(-1, 1), rng.uniform(-1, 1)]
                 return
                 
         # Update web placement
         if self.web_cooldown > 0:
             self.web_cooldown -= dt
-        elif random.random() < self.web_chance:
+        elif rng.random() < self.web_chance:
             self.game.webs.append(SpiderWeb(self.position, self.game))
             self.web_cooldown = 1000
             self.game.sounds.play_spider_web()
@@ -858,34 +923,32 @@ class Spider:
         self.leg_animation_offset += dt * 0.01
         
     def _update_wandering(self, dt, colonies):
+        rng = self.game.rng.simulation
         # Check for nearby colonies
-        for colony in colonies:
+        colony, distance = self.game.colony_grid.nearest(self.position, COLONY_MAX_SIZE * 2)
+        if colony is not None:
             dx = colony.position[0] - self.position[0]
             dy = colony.position[1] - self.position[1]
-            distance = math.sqrt(dx*dx + dy*dy)
             
-            if distance < COLONY_MAX_SIZE * 2:
-                # Count nearby ants
-                nearby_ants = sum(1 for ant in self.game.ants 
-                                if math.hypot(ant.position[0] - self.position[0],
-                                            ant.position[1] - self.position[1]) < 50)
-                
-                if nearby_ants >= 3:  # At least 3 ants needed to challenge spider
-                    if random.random() < 0.7:  # 70% chance to flee
-                        self.state = 'fleeing'
-                        self.flee_timer = 3000  # 3 seconds of fleeing
-                        # Flee direction away from colony
-                        self.flee_direction = [-dx/distance, -dy/distance]
-                        # Place more webs while fleeing
-                        self.web_chance = 0.1
-                    else:
-                        self.state = 'dying'
-                        self.game.sounds.play_spider_death()
-                    return
+            # Count nearby ants
+            nearby_ants = self.game.ant_grid.count(self.position, 50)
+            
+            if nearby_ants >= 3:  # At least 3 ants needed to challenge spider
+                if rng.random() < 0.7:  # 70% chance to flee
+                    self.state = 'fleeing'
+                    self.flee_timer = 3000  # 3 seconds of fleeing
+                    # Flee direction away from colony
+                    self.flee_direction = [-dx/distance, -dy/distance]
+                    # Place more webs while fleeing
+                    self.web_chance = 0.1
+                else:
+                    self.state = 'dying'
+                    self.game.sounds.play_spider_death()
+                return
                     
         # Random movement
-        if random.random() < 0.02:
-            angle = random.uniform(0, 2 * math.pi)
+        if rng.random() < 0.02:
+            angle = rng.uniform(0, 2 * math.pi)
             self.flee_direction = [math.cos(angle), math.sin(angle)]
             
         # Update position with boundary checking
@@ -896,15 +959,15 @@ class Spider:
         if new_x < self.edge_buffer:
             new_x = self.edge_buffer
             self.flee_direction[0] *= -1  # Reverse x direction
-        elif new_x > WINDOW_WIDTH - self.edge_buffer:
-            new_x = WINDOW_WIDTH - self.edge_buffer
+        elif new_x > self.game.width - self.edge_buffer:
+            new_x = self.game.width - self.edge_buffer
             self.flee_direction[0] *= -1  # Reverse x direction
             
         if new_y < self.edge_buffer:
             new_y = self.edge_buffer
             self.flee_direction[1] *= -1  # Reverse y direction
-        elif new_y > WINDOW_HEIGHT - self.edge_buffer:
-            new_y = WINDOW_HEIGHT - self.edge_buffer
+        elif new_y > self.game.height - self.edge_buffer:
+            new_y = self.game.height - self.edge_buffer
             self.flee_direction[1] *= -1  # Reverse y direction
         
         self.position = (new_x, new_y)
@@ -917,7 +980,7 @@ class Spider:
             return
             
         # Place more webs while fleeing, but not too many
-        if random.random() < 0.05:  # Reduced from 0.2
+        if self.game.rng.simulation.random() < 0.05:  # Reduced from 0.2
             self.game.webs.append(SpiderWeb(self.position, self.game))
             self.web_cooldown = 1500  # Added cooldown for fleeing webs
             self.game.sounds.play_spider_web()
@@ -930,15 +993,15 @@ class Spider:
         if new_x < self.edge_buffer:
             new_x = self.edge_buffer
             self.flee_direction[0] *= -1
-        elif new_x > WINDOW_WIDTH - self.edge_buffer:
-            new_x = WINDOW_WIDTH - self.edge_buffer
+        elif new_x > self.game.width - self.edge_buffer:
+            new_x = self.game.width - self.edge_buffer
             self.flee_direction[0] *= -1
             
         if new_y < self.edge_buffer:
             new_y = self.edge_buffer
             self.flee_direction[1] *= -1
-        elif new_y > WINDOW_HEIGHT - self.edge_buffer:
-            new_y = WINDOW_HEIGHT - self.edge_buffer
+        elif new_y > self.game.height - self.edge_buffer:
+            new_y = self.game.height - self.edge_buffer
             self.flee_direction[1] *= -1
         
         self.position = (new_x, new_y)
@@ -980,10 +1043,16 @@ class Spider:
         self.state = 'sleeping'
         return True
         
-    def draw(self, surface):
+    def bounds(self):
+        """Screen area of the spider, upright or flipped while dying"""
+        return pygame.Rect(self.position[0] - 9, self.position[1] - 17, 19, 25)
+
+    def draw(self, surface, origin=(0, 0)):
         if self.state == 'sleeping':
             return
 
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
+
         pixel_size = 2
         flip_y = 1
         
@@ -995,8 +1064,8 @@ class Spider:
         for row_idx, row in enumerate(self.spider_pattern):
             for col_idx, pixel in enumerate(row):
                 if pixel == 'X':
-                    x = self.position[0] + (col_idx - len(row)/2) * pixel_size
-                    y = self.position[1] + (row_idx * flip_y - len(self.spider_pattern)/2) * pixel_size
+                    x = screen_x + (col_idx - len(row)/2) * pixel_size
+                    y = screen_y + (row_idx * flip_y - len(self.spider_pattern)/2) * pixel_size
                     
                     color = self.colors['body']
                     if self.state == 'dying':
@@ -1009,45 +1078,49 @@ class Spider:
         if self.state != 'dying' or self.death_blinks % 2 == 0:
             eye_positions = [(2, 3), (5, 3)]  # Eye positions in pattern
             for ex, ey in eye_positions:
-                x = self.position[0] + (ex - len(row)/2) * pixel_size
-                y = self.position[1] + (ey * flip_y - len(self.spider_pattern)/2) * pixel_size
+                x = screen_x + (ex - len(row)/2) * pixel_size
+                y = screen_y + (ey * flip_y - len(self.spider_pattern)/2) * pixel_size
                 pygame.draw.rect(surface, self.colors['eyes'], (x, y, pixel_size, pixel_size))
 
 class SpiderWeb:
+    __slots__ = ('position', 'game', 'affected_ants', 'destroyed',
+                 'ant_jump_timer', 'wave_offset')
+
+    size = 16
+    wave_speed = 0.001  # Slightly slower for more gentle movement
+    wave_amplitude = 1.2  # Control the amount of movement
+    
+    # Web pattern (9x15 pixels)
+    web_pattern = [
+        "  X  X X X  X ",
+        "   X   X   X  ",
+        "  X X  X  X X ",
+        " X   X X X   X",
+        "X X X X X X X X",
+        " X   X X X   X",
+        "  X X  X  X X ",
+        "   X   X   X  ",
+        "  X  X X X  X "
+    ]
+    
+    colors = {
+        'primary': (200, 200, 200, 180),
+        'secondary': (150, 150, 150, 140)
+    }
+
     def __init__(self, position, game):
         self.position = position
         self.game = game
-        self.size = 16
         self.affected_ants = set()
         self.destroyed = False
         self.ant_jump_timer = {}
-        self.wave_offset = random.random() * 6.28  # Random starting phase
-        self.wave_speed = 0.001  # Slightly slower for more gentle movement
-        self.wave_amplitude = 1.2  # Control the amount of movement
-        
-        # Web pattern (9x15 pixels)
-        self.web_pattern = [
-            "  X  X X X  X ",
-            "   X   X   X  ",
-            "  X X  X  X X ",
-            " X   X X X   X",
-            "X X X X X X X X",
-            " X   X X X   X",
-            "  X X  X  X X ",
-            "   X   X   X  ",
-            "  X  X X X  X "
-        ]
-        
-        self.colors = {
-            'primary': (200, 200, 200, 180),
-            'secondary': (150, 150, 150, 140)
-        }
+        self.wave_offset = game.rng.simulation.random() * 6.28  # Random starting phase
         
     def affects_ant(self, ant):
         """Check if ant is caught in web and handle effects"""
         if ant in self.affected_ants:
             # Update jump timer for this ant
-            self.ant_jump_timer[ant] += self.game.clock.get_time()
+            self.ant_jump_timer[ant] += self.game.dt
             
             # Make ant jump while in web
             ant.start_jump()
@@ -1069,7 +1142,12 @@ class SpiderWeb:
             return True
         return False
         
-    def draw(self, surface):
+    def bounds(self):
+        """Screen area of the web pattern at the widest point of its wave"""
+        return pygame.Rect(self.position[0] - 19, self.position[1] - 14, 39, 29)
+
+    def draw(self, surface, origin=(0, 0)):
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
         current_time = pygame.time.get_ticks()
         pixel_size = 2
         
@@ -1093,8 +1171,8 @@ class SpiderWeb:
                     offset_x = wave_x * wave_intensity * (1 + dist_from_center/5) * math.sin(phase_shift)
                     offset_y = wave_y * wave_intensity * (1 + dist_from_center/5) * math.cos(phase_shift)
                     
-                    x = self.position[0] + (col_idx - len(row)/2) * pixel_size + offset_x
-                    y = self.position[1] + (row_idx - len(self.web_pattern)/2) * pixel_size + offset_y
+                    x = screen_x + (col_idx - len(row)/2) * pixel_size + offset_x
+                    y = screen_y + (row_idx - len(self.web_pattern)/2) * pixel_size + offset_y
                     
                     # Add slight alpha variation for shimmer effect
                     alpha_shift = int(20 * math.sin(current_time * 0.001 + phase_shift))
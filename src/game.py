@@ -1,16 +1,25 @@
 import pygame
-import random
 import logging
 import math
-import noise
 import numpy as np  # Add this import
 from entities import Colony, Ant, Snake, Spider, SpiderWeb, COLONY_MAX_SIZE, COLONY_MIN_SIZE
 from resources import Rock, Plant, Bush
-from ui import HUD, SettingsWindow, SettingsMenu, SettingsIcon
+from ui import HUD, HeadlessHUD, SettingsWindow, SettingsMenu, SettingsIcon
 from utils import load_assets
-from sounds import GameSounds
+from sounds import GameSounds, SilentGameSounds
+from clock import GameClock, SimulationClock
+from spatial import SpatialHash
+from swarm import AntSwarm
+from lod import AntScheduler
+from rng import RandomStreams
+from background import load_background
+from profiler import Profiler
+from replay import LiveInput
+from world import Camera, Terrain
+from sprites import render_text
+from render import DirtyRects, DayNightOverlay, CelestialSprites
 from constants import (
-    Economy, Animation, Background, WINDOW_WIDTH, WINDOW_HEIGHT, 
+    Economy, Animation, Background, Simulation, World, WINDOW_WIDTH, WINDOW_HEIGHT, 
     FPS, DAY_NIGHT, Behavior, COLORS, VISUALS, UI
 )
 from state import GameState  # Update import
@@ -18,7 +27,8 @@ from amuke_games_logo_code import AmukeGamesLogo  # Add this
 
 class GameState:
     """Manages game state and musical progression"""
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock
         self.intensity = 0.0        # 0.0 to 1.0
         self.danger_level = 0.0     # 0.0 to 1.0
         self.resource_abundance = 1.0  # 0.0 to 1.0
@@ -28,11 +38,17 @@ class GameState:
         # Musical state
         self.current_mood = 'peaceful'  # peaceful, ambient, floating, dreamy
         self.transition_requested = False
-        self.last_state_update = pygame.time.get_ticks()
+        self.last_state_update = self.get_ticks()
+        
+    def get_ticks(self):
+        """Current time from the game clock, falling back to pygame"""
+        if self.clock is not None:
+            return self.clock.get_ticks()
+        return pygame.time.get_ticks()
         
     def update(self, game_objects):
         """Update game state based on game objects"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
         
         if current_time - self.last_state_update < 1000:  # Update every second
             return
@@ -40,8 +56,11 @@ class GameState:
         self.last_state_update = current_time
         
         # Calculate intensity based on ant activity and threats
-        active_ants = sum(1 for ant in game_objects['ants'] if hasattr(ant, 'resources') and 
-                         (ant.resources['minerals'] > 0 or ant.resources['plants'] > 0))
+        if isinstance(game_objects['ants'], AntSwarm):
+            active_ants = game_objects['ants'].carrying_count()
+        else:
+            active_ants = sum(1 for ant in game_objects['ants'] if hasattr(ant, 'resources') and 
+                             (ant.resources['minerals'] > 0 or ant.resources['plants'] > 0))
         self.intensity = min(1.0, (active_ants / max(len(game_objects['ants']), 1)) * 0.5)
         
         # Calculate danger level
@@ -101,18 +120,59 @@ class GameState:
         )
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Muchas Cacas! Lite")
-        self.clock = pygame.time.Clock()
+    def __init__(self, headless=False, clock=None, swarm=False, profiler=None, seed=None,
+                 world_size=None, lod=True):
+        """Create the game
+
+        Args:
+            headless: Run the simulation without a display, mixer or HUD
+                surfaces, driven by a SimulationClock (see headless.py)
+            clock: Optional SimulationClock driving simulated time
+            swarm: Store ants in a vectorized AntSwarm instead of a list
+            profiler: Optional Profiler for frame instrumentation (off by default)
+            seed: Seed for the game's RandomStreams; the same seed replays
+                the same simulation (random when None)
+            world_size: (width, height) of the map, at least the window
+                size (World.WIDTH x World.HEIGHT by default, see world.py)
+            lod: Update ants away from threats at a lower tick rate (see
+                lod.py); AntSwarm ignores it, its update is already vectorized
+        """
+        self.headless = headless
+        self.rng = RandomStreams(seed)
+        self.swarm = swarm
+        width, height = world_size or (World.WIDTH, World.HEIGHT)
+        self.width = max(int(width), WINDOW_WIDTH)
+        self.height = max(int(height), WINDOW_HEIGHT)
+        # Resource counts scale with the map so density stays the same
+        self.world_scale = self.width * self.height / (WINDOW_WIDTH * WINDOW_HEIGHT)
+        self.camera = Camera((self.width, self.height))
+        self.camera.center_on((self.width // 2, self.height // 2))
+        
+        # Simulated time advances one fixed tick per update, whatever the
+        # frame rate; the frame clock only paces rendering
+        if clock is None:
+            clock = SimulationClock(Simulation.TICK_MS)
+        self.clock = clock
+        self.frame_clock = None if headless else GameClock()
+        self.tick_ms = clock.step_ms
+        self.dt = self.tick_ms  # Tick duration every entity consumes
+        self.tick_scale = self.tick_ms / Simulation.BASE_TICK_MS  # For per-tick speeds
+        self.time_scale = 1.0  # Simulated ms per real ms (>1 fast-forwards)
+        self.render_enabled = True
         self.running = True
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.autosaver = None  # snapshot.Autosaver when saving is enabled
+        self.input = LiveInput()  # Frame timing, events and cursor (see replay.py)
         
-        # Create animated logo instead of loading image
-        logo_width = 300
-        self.logo = AmukeGamesLogo(logo_width)
+        if headless:
+            self.screen = None
+            self.intro_state = 'game_running'  # No intro without a display
+        else:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            pygame.display.set_caption("Muchas Cacas! Lite")
+            self.intro_state = 'logo_fade_in'
         
-        # Intro sequence states and timings
-        self.intro_state = 'logo_fade_in'
+        # Intro sequence timings
         self.fade_start_time = pygame.time.get_ticks()
         self.fade_durations = {
             'logo_fade_in': Animation.LOGO_FADE_IN,
@@ -126,53 +186,79 @@ class Game:
         
         # Initialize game objects with alpha
         self.alpha = 0
-        self.assets = load_assets()
-        self.sounds = GameSounds()
-        self.hud = HUD()
+        self.sounds = SilentGameSounds() if headless else GameSounds(self.rng)
+        self.hud = HeadlessHUD() if headless else HUD()
         
         # Game state
         self.placing_colony = False
         self.colonies = []
-        self.ants = []
+        self.ants = AntSwarm(self) if swarm else []
+        self.lod = AntScheduler(self) if lod and not swarm else None
         self.rocks = []
         self.plants = []
         self.bushes = []
-        self.snake = Snake((random.randint(0, 480), random.randint(0, 800)), self)
+        rng = self.rng.simulation
+        self.snake = Snake((rng.randint(0, self.width), rng.randint(0, self.height)), self)
+        
+        # Spatial indexes for proximity queries, kept in sync every update
+        self.ant_grid = SpatialHash()
+        self.resource_grid = SpatialHash()
+        self.colony_grid = SpatialHash()
         
         # Resource spawn settings
-        self.resource_spawn_timer = pygame.time.get_ticks()
+        self.resource_spawn_timer = self.clock.get_ticks()
         self.resource_spawn_interval = Economy.Generation.RESOURCE_SPAWN_INTERVAL
         self.max_resources = {
-            'rocks': Economy.Generation.MAX_ROCKS,
-            'plants': Economy.Generation.MAX_PLANTS,
-            'bushes': Economy.Generation.MAX_BUSHES
+            'rocks': round(Economy.Generation.MAX_ROCKS * self.world_scale),
+            'plants': round(Economy.Generation.MAX_PLANTS * self.world_scale),
+            'bushes': round(Economy.Generation.MAX_BUSHES * self.world_scale)
         }
         
         # Background settings
         self.TILE_SIZE = Background.TILE_SIZE
         self.noise_scale = Background.NOISE_SCALE
         self.grass_patches = []
-        self.generate_grass_patches()
-        self.background = self.generate_background()
         
         # Initialize resources
         self.initialize_resources()
         
-        self.settings_window = SettingsWindow(WINDOW_WIDTH, WINDOW_HEIGHT)
-        
         # Initialize game state
-        self.game_state = GameState()
+        self.game_state = GameState(self.clock)
         
         # Day/Night cycle state
-        self.cycle_start_time = pygame.time.get_ticks()
+        self.cycle_start_time = self.clock.get_ticks()
         self.current_time_of_day = 'day'
-        self.day_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        self.night_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        self.night_overlay.fill(DAY_NIGHT['NIGHT_TINT'])
         
         # Snake sleep position (set when night begins)
         self.snake_sleep_position = None
         
+        self.spider = None  # Current spider
+        self.webs = []  # List of active spider webs
+        
+        if not headless:
+            self.init_presentation()
+
+    def init_presentation(self):
+        """Create everything that is only needed to draw and interact"""
+        # Create animated logo instead of loading image
+        logo_width = 300
+        self.logo = AmukeGamesLogo(logo_width)
+        self.assets = load_assets()
+        
+        self.generate_grass_patches()
+        # Maps larger than the window stream their terrain in chunks
+        self.terrain = None if self.camera.fixed else Terrain((self.width, self.height))
+        self.background = self.generate_background()
+        
+        # Only regions that changed are redrawn and pushed to the display
+        self.dirty = DirtyRects(self.screen.get_rect())
+        self.full_redraw = True
+        
+        self.settings_window = SettingsWindow(WINDOW_WIDTH, WINDOW_HEIGHT)
+        
+        self.sky_overlay = DayNightOverlay((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.celestial = CelestialSprites()
+        
         # Initialize UI elements
         self.settings_menu = SettingsMenu(self.screen, self.sounds)
         
@@ -180,34 +266,55 @@ class Game:
         self.pixel_icons = {
             'settings': SettingsIcon(32)  # Create settings icon
         }
-        
-        self.spider = None  # Current spider
-        self.webs = []  # List of active spider webs
+
+    def get_cursor_pos(self):
+        """World position of the cursor, which ants treat as a threat (None when headless)"""
+        if self.headless:
+            return None
+        return self.camera.to_world(self.input.cursor_pos())
+
+    def create_colony(self, position):
+        """Place the first colony for free, or a paid secondary colony"""
+        if not self.colonies:
+            colony = Colony(position, self, is_main=True)
+        else:
+            colony = Colony(position, self, is_main=False)
+            self.colonies[0].resources['minerals'] -= Economy.Costs.NEW_COLONY_MINERALS
+            self.colonies[0].resources['plants'] -= Economy.Costs.NEW_COLONY_PLANTS
+            self.sounds.play_colony_create()
+        self.colonies.append(colony)
+        self.colony_grid.insert(colony)
+        return colony
 
     def initialize_resources(self):
         """Initialize rocks, plants and bushes on the map"""
-        for _ in range(10):
-            self.rocks.append(Rock((
-                random.randint(20, self.screen.get_width() - 20),
-                random.randint(20, self.screen.get_height() - 20)
-            )))
-            self.plants.append(Plant((
-                random.randint(20, self.screen.get_width() - 20),
-                random.randint(20, self.screen.get_height() - 20)
-            )))
+        rng = self.rng.simulation
+        for _ in range(round(10 * self.world_scale)):
+            self.spawn_resource(self.rocks, Rock((
+                rng.randint(20, self.width - 20),
+                rng.randint(20, self.height - 20)
+            ), rng))
+            self.spawn_resource(self.plants, Plant((
+                rng.randint(20, self.width - 20),
+                rng.randint(20, self.height - 20)
+            ), self, rng))
             # Initialize with more bushes
             for _ in range(2):  # Double the amount of bushes
-                self.bushes.append(Bush((
-                    random.randint(20, self.screen.get_width() - 20),
-                    random.randint(20, self.screen.get_height() - 20)
-                )))
+                self.spawn_resource(self.bushes, Bush((
+                    rng.randint(20, self.width - 20),
+                    rng.randint(20, self.height - 20)
+                ), rng))
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input.events():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()  # Frame timing overlay
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                self.camera.handle_event(event)  # Arrow keys and WASD scroll the map
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = self.input.cursor_pos()
                 
                 # Check if settings icon was clicked
                 settings_icon_rect = pygame.Rect(WINDOW_WIDTH - 45, 15, 32, 32)
@@ -228,20 +335,15 @@ class Game:
                     continue
                 
                 if not self.colonies:  # First colony placement
-                    first_colony = Colony(mouse_pos, self.ants, self, is_main=True)
-                    self.colonies.append(first_colony)
+                    self.create_colony(self.camera.to_world(mouse_pos))
                 elif self.placing_colony:  # Place new colony
-                    new_colony = Colony(mouse_pos, self.ants, self, is_main=False)
-                    self.colonies.append(new_colony)
-                    self.colonies[0].resources['minerals'] -= 200
-                    self.colonies[0].resources['plants'] -= 400
-                    self.sounds.play_colony_create()
+                    self.create_colony(self.camera.to_world(mouse_pos))
                     self.placing_colony = False
                 else:  # Check for indicator clicks
                     for colony in self.colonies:
                         action = colony.handle_click(mouse_pos)
                         if action == 'spawn_ant':
-                            colony.spawn_ant(self.ants)
+                            colony.spawn_ant()
                             break
                         elif action == 'new_colony':
                             self.placing_colony = True
@@ -251,14 +353,34 @@ class Game:
             self.settings_menu.handle_event(event)
             
             # Handle settings icon hover
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.input.cursor_pos()
             if self.settings_menu.settings_button.collidepoint(mouse_pos):
                 self.pixel_icons['settings'].current_frame = 1  # Show hover state
             else:
                 self.pixel_icons['settings'].current_frame = 0  # Normal state
 
+    def step(self):
+        """Advance the simulation by one fixed tick"""
+        self.clock.tick()
+        with self.profiler.span('update'):
+            self.update()
+
+    def fast_forward(self, duration_ms):
+        """Simulate duration_ms of game time at once, without drawing"""
+        for _ in range(int(duration_ms // self.tick_ms)):
+            if not self.running:
+                break
+            self.step()
+
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
+        rng = self.rng.simulation
+        self.dt = self.tick_ms
+        self.tick_scale = self.dt / Simulation.BASE_TICK_MS
+        
+        phases = self.profiler.phases('update')
+        phases.next('spiders')
+        
         cycle_time = (current_time - self.cycle_start_time) % DAY_NIGHT['CYCLE_DURATION']
         
         # Calculate day/night state
@@ -268,8 +390,8 @@ class Game:
         if is_night:
             # Spider spawning at night
             if not self.spider and (self.plants or self.bushes) and self.snake.is_sleeping:
-                if random.random() < 0.1:  # 10% chance each update to spawn spider
-                    spawn_point = random.choice(self.plants + self.bushes)
+                if rng.random() < 0.1:  # 10% chance each update to spawn spider
+                    spawn_point = rng.choice(self.plants + self.bushes)
                     self.spider = Spider(spawn_point.position, self)
                     spawn_point.has_spider = True
         else:
@@ -279,17 +401,20 @@ class Game:
                     self.spider.state = 'dying'
                     self.spider.daylight_death_timer = 2000
                     self.spider.speed *= 2
-                    self.spider.flee_direction = [random.uniform(-1, 1), random.uniform(-1, 1)]
+                    self.spider.flee_direction = [rng.uniform(-1, 1), rng.uniform(-1, 1)]
 
         # Update spider if it exists
         if self.spider:
-            self.spider.update(self.clock.get_time(), self.plants, self.bushes,
+            self.spider.update(self.dt, self.plants, self.bushes,
                              self.colonies, self.ants)
             
             # Clean up dead spider
-            if self.spider.state == 'dying' and self.spider.death_blinks >= 3:
+            # (Spider.update may already have removed itself)
+            if self.spider and self.spider.state == 'dying' and self.spider.death_blinks >= 3:
                 self.spider = None  # Allow new spider to spawn next night
         
+        phases.next('webs')
+        
         # Calculate if it's mid-day (when sun is highest)
         is_mid_day = (cycle_time >= DAY_NIGHT['CYCLE_DURATION'] / 4 and 
                      cycle_time <= DAY_NIGHT['CYCLE_DURATION'] / 4 + 1000)
@@ -302,11 +427,16 @@ class Game:
         # Update webs and remove destroyed ones
         self.webs = [web for web in self.webs if not web.destroyed]
         
-        # Check for web effects on ants
-        for ant in self.ants:
-            for web in self.webs:
+        # Check for web effects on ants already caught or close to a web
+        for web in self.webs:
+            caught = [ant for ant in web.affected_ants if ant in self.ant_grid]
+            nearby = [ant for ant in self.ant_grid.query(web.position, web.size / 2)
+                      if ant not in web.affected_ants]
+            for ant in caught + nearby:
                 web.affects_ant(ant)
         
+        phases.next('day_night')
+        
         # Calculate day/night state
         is_transitioning = (
             cycle_time < DAY_NIGHT['DAWN_DURATION'] or  # Dawn
@@ -322,6 +452,8 @@ class Game:
         # Update entity behaviors based on time of day
         self.update_day_night_behaviors(is_night, is_transitioning)
         
+        phases.next('game_state')
+        
         # Update game state first
         self.game_state.update({
             'ants': self.ants,
@@ -335,6 +467,8 @@ class Game:
             'time': current_time
         })
         
+        phases.next('resources')
+        
         # Update resources
         self.update_resources(current_time)
         
@@ -345,42 +479,62 @@ class Game:
         # Get obstacles for collision detection
         obstacles = self.rocks + self.plants + self.bushes
         
+        phases.next('snake')
+        
         # Update snake and check for kills
-        killed = self.snake.update(pygame.mouse.get_pos(), self.ants, self.colonies)
+        cursor_pos = self.get_cursor_pos()
+        killed = self.snake.update(cursor_pos, self.ants, self.colonies)
         if killed:
             self.hud.increment_kills()
         
+        phases.next('ants')
+        
         # Update ants
-        for ant in self.ants:
-            ant.update(pygame.mouse.get_pos(), 
-                      self.snake.position, 
-                      obstacles,
-                      self.rocks + self.plants + self.bushes,  # All resources
-                      self.colonies)
+        if self.swarm:
+            self.ants.update(cursor_pos, self.snake.position, self.resource_grid,
+                             self.colony_grid, self.ant_grid)
+        elif self.lod:
+            self.lod.update(self.ants, cursor_pos, obstacles)
+        else:
+            for ant in self.ants:
+                ant.update(cursor_pos, 
+                          self.snake.position, 
+                          obstacles,
+                          self.resource_grid,  # All resources
+                          self.colony_grid)
+                self.ant_grid.update(ant)
 
+        phases.next('cleanup')
+        
         # Remove depleted resources
+        for resource in obstacles:
+            if (resource.minerals if isinstance(resource, Rock) else resource.resources) <= 0:
+                self.resource_grid.remove(resource)
         self.rocks = [rock for rock in self.rocks if rock.minerals > 0]
         self.plants = [plant for plant in self.plants if plant.resources > 0]
         self.bushes = [bush for bush in self.bushes if bush.resources > 0]
 
+        phases.next('colonies')
+        
         # Update colonies
         for colony in self.colonies:
-            colony.update(current_time, self.ants)
+            colony.update(current_time)
 
-        # Update HUD tooltips
-        self.hud.update(pygame.mouse.get_pos())
+        # Update HUD tooltips (in window coordinates, unlike cursor_pos)
+        self.hud.update(None if self.headless else self.input.cursor_pos())
 
+        phases.next('music')
+        
         # Update music system with game state object
         try:
             self.sounds.update_music(self.game_state)
         except Exception as e:
             print(f"Error updating music state: {e}")
-
-        # Update display
-        pygame.display.flip()
+        phases.end()
 
     def update_resources(self, current_time):
         """Spawn new resources periodically with improved balance"""
+        rng = self.rng.simulation
         if current_time - self.resource_spawn_timer >= self.resource_spawn_interval:
             self.resource_spawn_timer = current_time
             
@@ -403,129 +557,110 @@ class Game:
             
             # Spawn multiple resources at once if needed
             for _ in range(min(2, rocks_needed)):  # Max 2 rocks at once
-                if rocks_needed > 0 and random.random() < spawn_chances['rocks']:
+                if rocks_needed > 0 and rng.random() < spawn_chances['rocks']:
                     position = self.find_valid_resource_position()
-                    self.rocks.append(Rock(position))
+                    self.spawn_resource(self.rocks, Rock(position, rng))
             
             for _ in range(min(3, plants_needed)):  # Max 3 plants at once
-                if plants_needed > 0 and random.random() < spawn_chances['plants']:
+                if plants_needed > 0 and rng.random() < spawn_chances['plants']:
                     position = self.find_valid_resource_position()
-                    self.plants.append(Plant(position))
+                    self.spawn_resource(self.plants, Plant(position, self, rng))
             
             for _ in range(min(2, bushes_needed)):  # Max 2 bushes at once
-                if bushes_needed > 0 and random.random() < spawn_chances['bushes']:
+                if bushes_needed > 0 and rng.random() < spawn_chances['bushes']:
                     position = self.find_valid_resource_position()
-                    self.bushes.append(Bush(position))
+                    self.spawn_resource(self.bushes, Bush(position, rng))
+
+    def sync_spatial_indexes(self):
+        """Make every spatial index match its list
+
+        Entities are inserted and removed where they are added (add_ant,
+        spawn_resource, create_colony) and removed (snake kills, depleted
+        resources), and moving ants are re-bucketed as they update. This
+        full pass is only for bulk changes such as offline progress or
+        building a game by hand.
+        """
+        resources = self.rocks + self.plants + self.bushes
+        for grid, objects in ((self.ant_grid, self.ants),
+                              (self.colony_grid, self.colonies),
+                              (self.resource_grid, resources)):
+            grid.sync(objects)
+
+    def add_ant(self, ant):
+        """Add an ant to the game and the spatial index
+
+        Returns the ant as stored: an AntSwarm copies the ant into its
+        arrays and hands back its own view.
+        """
+        if self.swarm:
+            ant = self.ants.append(ant)
+        else:
+            self.ants.append(ant)
+        self.ant_grid.insert(ant)
+        return ant
+
+    def spawn_resource(self, resources, resource):
+        """Add a new resource to its list and the spatial index"""
+        resources.append(resource)
+        self.resource_grid.insert(resource)
 
     def find_valid_resource_position(self):
         """Find a valid position for a new resource"""
+        rng = self.rng.simulation
         attempts = 0
         min_distance = 30  # Minimum distance from other resources
         
         while attempts < 10:
             position = (
-                random.randint(20, self.screen.get_width() - 20),
-                random.randint(20, self.screen.get_height() - 20)
+                rng.randint(20, self.width - 20),
+                rng.randint(20, self.height - 20)
             )
             
             # Check distance from other resources
-            too_close = False
-            for resource in self.rocks + self.plants + self.bushes:
-                dx = position[0] - resource.position[0]
-                dy = position[1] - resource.position[1]
-                if (dx * dx + dy * dy) < min_distance * min_distance:
-                    too_close = True
-                    break
-            
-            if not too_close:
+            if self.resource_grid.count(position, min_distance) == 0:
                 return position
             
             attempts += 1
         
         # If no good position found after 10 attempts, just return a random position
         return (
-            random.randint(20, self.screen.get_width() - 20),
-            random.randint(20, self.screen.get_height() - 20)
+            rng.randint(20, self.width - 20),
+            rng.randint(20, self.height - 20)
         )
 
     def generate_grass_patches(self):
         """Generate positions for grass patches"""
-        width, height = self.screen.get_width(), self.screen.get_height()
-        for _ in range(100):  # Number of grass patches
+        rng = self.rng.cosmetic
+        width, height = self.width, self.height
+        for _ in range(round(100 * self.world_scale)):  # Number of grass patches
+            x, y = rng.randint(0, width), rng.randint(0, height)
+            offset = rng.random() * 6.28
+            size = rng.randint(2, 4)
             self.grass_patches.append({
-                'pos': (random.randint(0, width), random.randint(0, height)),
-                'offset': random.random() * 6.28,
-                'size': random.randint(2, 4)
+                'pos': (x, y),
+                'offset': offset,
+                'size': size,
+                'rect': pygame.Rect(x - 3, y - 7, size * 2 + 5, 9)  # Blades at full sway
             })
 
     def generate_background(self):
-        """Generate a textured forest floor background with fine lines"""
-        width, height = self.screen.get_width(), self.screen.get_height()
-        background = pygame.Surface((width, height))
-        
-        # Forest floor colors (earthier tones)
-        colors = {
-            'dark': (65, 42, 25),     # Dark earth
-            'base': (82, 53, 31),     # Medium earth
-            'light': (98, 63, 37),    # Light earth
-            'detail': (73, 47, 28)    # Detail earth
-        }
-        
-        # Generate base noise map
-        for y in range(0, height, self.TILE_SIZE):
-            for x in range(0, width, self.TILE_SIZE):
-                # Generate two different noise values for more texture
-                noise_val = noise.pnoise2(x/self.noise_scale, 
-                                        y/self.noise_scale, 
-                                        octaves=4,
-                                        persistence=0.6,
-                                        lacunarity=2.5,
-                                        repeatx=width, 
-                                        repeaty=height, 
-                                        base=42)
-                
-                # Second noise for line pattern
-                line_noise = noise.pnoise2(x/10, y/10, 
-                                         octaves=1,
-                                         persistence=0.5,
-                                         lacunarity=2.0,
-                                         repeatx=width,
-                                         repeaty=height,
-                                         base=17)
-                
-                # Create fine line pattern with noise
-                for px in range(self.TILE_SIZE):
-                    for py in range(self.TILE_SIZE):
-                        pixel_x = x + px
-                        pixel_y = y + py
-                        
-                        if pixel_x >= width or pixel_y >= height:
-                            continue
-                        
-                        # Base color selection
-                        if noise_val > 0.2:
-                            color = colors['light']
-                        elif noise_val < -0.2:
-                            color = colors['dark']
-                        else:
-                            color = colors['base']
-                        
-                        # Add line pattern
-                        line_val = (line_noise + 1) / 2  # Normalize to 0-1
-                        if (pixel_y + int(line_val * 4)) % 4 == 0:  # Create fine lines
-                            color = tuple(max(0, c - 12) for c in color)
-                        
-                        # Add subtle noise variation
-                        if random.random() < 0.1:  # 10% chance for noise detail
-                            color = tuple(max(0, min(255, c + random.randint(-5, 5))) 
-                                        for c in color)
-                        
-                        background.set_at((pixel_x, pixel_y), color)
-        
-        return background
+        """Generate a textured forest floor background with fine lines
+
+        On a large map this is the terrain under the camera, redrawn by
+        view_moved() whenever the camera scrolls.
+        """
+        if self.terrain is None:
+            return load_background(self.width, self.height, self.TILE_SIZE, self.noise_scale)
+        return self.terrain.compose(self.camera.rect, pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+
+    def view_moved(self):
+        """Redraw the terrain under the camera and the whole screen after a scroll"""
+        self.terrain.compose(self.camera.rect, self.background)
+        self.full_redraw = True
 
-    def draw_grass_patches(self, surface):
+    def draw_grass_patches(self, surface, patches, origin=(0, 0)):
         """Draw animated grass patches"""
+        rng = self.rng.cosmetic
         time = pygame.time.get_ticks() / 1000
         grass_colors = [
             (67, 100, 18),  # Dark green
@@ -533,15 +668,15 @@ class Game:
             (103, 148, 28)  # Light green
         ]
         
-        for patch in self.grass_patches:
-            x, y = patch['pos']
+        for patch in patches:
+            x, y = patch['pos'][0] - origin[0], patch['pos'][1] - origin[1]
             size = patch['size']
             sway = math.sin(time * 2 + patch['offset']) * 2
             
             # Draw each blade of grass in the patch
             for i in range(size):
-                color = random.choice(grass_colors)
-                blade_height = random.randint(3, 6)
+                color = rng.choice(grass_colors)
+                blade_height = rng.randint(3, 6)
                 
                 # Calculate swaying position
                 sway_offset = sway * (blade_height / 6)  # Taller grass sways more
@@ -554,15 +689,22 @@ class Game:
                                1)
 
     def draw(self):
-        """Draw game state"""
-        self.screen.fill((0, 0, 0))  # Black background
-        
+        """Draw game state
+
+        While the game runs only the regions that changed are redrawn
+        (see mark_dirty_regions); the whole screen is redrawn during
+        dawn and dusk, while a menu or the timing overlay is open, or when
+        most of it changed anyway. present() pushes the result.
+        """
         if self.intro_state.startswith('logo'):
+            self.dirty.force_full()
+            self.screen.fill((0, 0, 0))  # Black background
+            
             current_time = pygame.time.get_ticks()
             elapsed = current_time - self.fade_start_time
             
             # Update logo animation
-            dt = self.clock.get_time()  # Get time since last frame
+            dt = self.frame_clock.get_time()  # Get time since last frame
             self.logo.update(dt)
             
             # Draw logo with appropriate fade
@@ -585,28 +727,47 @@ class Game:
             self.screen.blit(fade_surface, (0, 0))
             
         else:
-            # Draw background
-            self.screen.blit(self.background, (0, 0))
+            day_night = self.day_night_state()
+            view = self.visible_entities()
+            self.mark_dirty_regions(day_night, view)
+            regions = self.dirty.regions()
+            origin = self.camera.origin
+            
+            phases = self.profiler.phases('draw')
+            phases.next('background')
+            
+            # Draw background (restoring just the dirty regions when possible)
+            if regions is None:
+                self.screen.blit(self.background, (0, 0))
+            else:
+                for rect in regions:
+                    self.screen.blit(self.background, rect, rect)
+            
+            phases.next('grass')
             
             # Draw animated grass patches
-            self.draw_grass_patches(self.screen)
+            self.draw_grass_patches(self.screen, view['grass'], origin)
+            
+            phases.next('resources')
             
             # Draw all game objects
-            for rock in self.rocks:
-                rock.draw(self.screen, 255)
-            for plant in self.plants:
-                plant.draw(self.screen, 255)
-            for bush in self.bushes:
-                bush.draw(self.screen, 255)
-            for colony in self.colonies:
-                colony.draw(self.screen)
-            for ant in self.ants:
-                ant.draw(self.screen)
-            self.snake.draw(self.screen, 255)
+            for rock in view['rocks']:
+                rock.draw(self.screen, 255, origin)
+            for plant in view['plants']:
+                plant.draw(self.screen, 255, origin)
+            for bush in view['bushes']:
+                bush.draw(self.screen, 255, origin)
+            
+            phases.next('entities')
+            for colony in view['colonies']:
+                colony.draw(self.screen, origin)
+            for ant in view['ants']:
+                ant.draw(self.screen, origin)
+            self.snake.draw(self.screen, 255, origin)
             
             # Draw colony preview when placing
             if self.placing_colony:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = self.input.cursor_pos()
                 preview_rect = pygame.Rect(
                     mouse_pos[0] - COLONY_MIN_SIZE // 2,
                     mouse_pos[1] - COLONY_MIN_SIZE // 2,
@@ -616,26 +777,97 @@ class Game:
                 preview_color = (*COLORS['COLONY'], 128)
                 pygame.draw.rect(self.screen, preview_color, preview_rect)
             
-            self.hud.draw(self.screen, self.colonies, self.ants)
+            phases.next('hud')
+            # The input source's cursor, so replays draw the same tooltips
+            mouse_pos = self.input.cursor_pos()
+            self.hud.draw(self.screen, self.colonies, self.ants, mouse_pos)
             
             # Draw settings menu and icon
-            self.settings_menu.draw()
+            self.settings_menu.draw(mouse_pos)
             settings_icon = self.pixel_icons['settings'].get_current_frame()
             self.screen.blit(settings_icon, self.settings_menu.settings_button)
             
+            phases.next('day_night')
+            
             # Draw day/night overlay
-            self.draw_day_night_effects()
+            self.draw_day_night_effects(day_night, regions)
+            
+            phases.next('spiders')
             
             # Draw webs
-            for web in self.webs:
-                web.draw(self.screen)
+            for web in view['webs']:
+                web.draw(self.screen, origin)
             
             # Draw spider
             if self.spider:
-                self.spider.draw(self.screen)
+                self.spider.draw(self.screen, origin)
+            phases.end()
             
-            # Update display
-            pygame.display.flip()
+            # Timing overlay (F3) goes on top of everything
+            self.profiler.draw_overlay(self.screen)
+
+    def visible_entities(self):
+        """Grass patches and entities the camera sees, by group
+
+        On a map that fits the window these are the full lists. Colonies
+        are always drawn, so their clickable indicators follow the view.
+        """
+        camera = self.camera
+        view = {group: camera.visible(items) for group, items in
+                (('rocks', self.rocks), ('plants', self.plants), ('bushes', self.bushes),
+                 ('ants', self.ants), ('webs', self.webs))}
+        view['colonies'] = self.colonies
+        if camera.fixed:
+            view['grass'] = self.grass_patches
+        else:
+            rect = camera.rect
+            view['grass'] = [patch for patch in self.grass_patches if rect.colliderect(patch['rect'])]
+        return view
+
+    def mark_dirty_regions(self, day_night, view):
+        """Mark the bounds of everything drawn this frame
+
+        Every entity animates (sway, shimmer, scuttle, machinery), so all
+        of them are marked; the background between them stays untouched.
+        Bounds are in world coordinates and moved into the view.
+        """
+        # Whole-screen redraws while the overlay tint changes or a panel is
+        # open, and for one frame after, to clear whatever they covered
+        full_redraw = (day_night['phase'] in ('dawn', 'dusk') or
+                       self.settings_menu.visible or self.profiler.overlay_visible)
+        if full_redraw or self.full_redraw:
+            self.dirty.force_full()
+        self.full_redraw = full_redraw
+        
+        dirty = self.dirty
+        dx, dy = -self.camera.x, -self.camera.y
+        dirty.extend(patch['rect'].move(dx, dy) for patch in view['grass'])
+        for group in ('rocks', 'plants', 'bushes', 'colonies', 'ants', 'webs'):
+            for item in view[group]:
+                dirty.mark(item.bounds().move(dx, dy))
+        dirty.mark(self.snake.bounds().move(dx, dy))
+        if self.spider and self.spider.state != 'sleeping':
+            dirty.mark(self.spider.bounds().move(dx, dy))
+        mouse_pos = self.input.cursor_pos()
+        if self.placing_colony:
+            dirty.mark(pygame.Rect(0, 0, COLONY_MIN_SIZE + 2, COLONY_MIN_SIZE + 2).move(
+                mouse_pos[0] - COLONY_MIN_SIZE // 2 - 1, mouse_pos[1] - COLONY_MIN_SIZE // 2 - 1))
+        dirty.mark(self.hud.bounds(mouse_pos))
+        dirty.mark(self.settings_menu.bounds(mouse_pos))
+        
+        celestial_x, celestial_y = day_night['celestial']
+        dirty.mark(pygame.Rect(celestial_x - 36, celestial_y - 36, 73, 73))
+        if day_night['hovered']:
+            # Tooltip above the sun or moon, as wide as the screen allows
+            dirty.mark(pygame.Rect(0, celestial_y - 70, WINDOW_WIDTH, 71))
+        if day_night['star']:
+            (star_x, star_y), star_size = day_night['star']
+            dirty.mark(pygame.Rect(star_x - star_size - 1, star_y - star_size - 1,
+                                   star_size * 2 + 3, star_size * 2 + 3))
+
+    def present(self):
+        """Show the frame: the dirty regions, or the whole screen"""
+        self.dirty.present()
 
     def update_intro_sequence(self):
         current_time = pygame.time.get_ticks()
@@ -670,7 +902,7 @@ class Game:
                     self.music_started = True
         
         # Update logo animation
-        dt = self.clock.get_time()
+        dt = self.frame_clock.get_time()
         self.logo.update(dt)
 
     def draw_intro_sequence(self):
@@ -694,10 +926,19 @@ class Game:
             # ... rest of game drawing code ...
 
     def run(self):
+        """Main loop: fixed-timestep updates, rendering once per frame
+
+        Real frame time is banked in an accumulator and spent in whole
+        simulation ticks, so game speed does not depend on the frame rate.
+        Under load several ticks run per frame; if even that cannot keep
+        up, the backlog is dropped rather than snowballing.
+        """
+        accumulator = 0.0
         while self.running:
+            frame_ms = self.input.tick(self.frame_clock)
             if self.intro_state != 'game_running':
                 # Handle quit events during intro
-                for event in pygame.event.get():
+                for event in self.input.events():
                     if event.type == pygame.QUIT:
                         self.running = False
                         return
@@ -705,16 +946,34 @@ class Game:
                 self.update_intro_sequence()
                 self.draw_intro_sequence()
             else:
-                self.handle_events()
-                self.update()
-                self.draw()
+                with self.profiler.span('handle_events'):
+                    self.handle_events()
+                    if self.camera.update(frame_ms):
+                        self.view_moved()
+                
+                accumulator += min(frame_ms, Simulation.MAX_FRAME_MS) * self.time_scale
+                max_ticks = Simulation.MAX_TICKS_PER_FRAME * max(1, math.ceil(self.time_scale))
+                ticks = 0
+                while accumulator >= self.tick_ms and ticks < max_ticks and self.running:
+                    self.step()
+                    accumulator -= self.tick_ms
+                    ticks += 1
+                if ticks == max_ticks:
+                    accumulator = min(accumulator, self.tick_ms)
+                
+                if self.render_enabled:
+                    with self.profiler.span('draw'):
+                        self.draw()
             
-            pygame.display.flip()
-            self.clock.tick(60)
+            # One display update per frame
+            self.present()
+            self.profiler.frame()
+            if self.autosaver is not None:
+                self.autosaver.update()
 
     def spawn_ant(self, position):
         new_ant = Ant(position, self)  # Pass self (game) to ant
-        self.ants.append(new_ant) 
+        self.add_ant(new_ant)
 
     def show_splash_screen(self):
         """Show splash screen with logo"""
@@ -819,27 +1078,30 @@ class Game:
         """Update entity behaviors based on time of day"""
         try:
             # Update ant behavior with special night actions
-            for ant in self.ants:
-                if is_night:
-                    ant.speed = Behavior.DAY_NIGHT['ANT_NIGHT_SPEED']
-                    ant.perception_radius = Behavior.DAY_NIGHT['ANT_NIGHT_PERCEPTION']
+            if self.swarm:
+                self.ants.apply_day_night(is_night)
+            else:
+                for ant in self.ants:
+                    if is_night:
+                        ant.speed = Behavior.DAY_NIGHT['ANT_NIGHT_SPEED']
+                        ant.perception_radius = Behavior.DAY_NIGHT['ANT_NIGHT_PERCEPTION']
                     
-                    # Special night behavior: ants stay closer to colony
-                    if hasattr(ant, 'home_colony') and ant.home_colony:
-                        distance_to_colony = math.hypot(
-                            ant.position[0] - ant.home_colony.position[0],
-                            ant.position[1] - ant.home_colony.position[1]
-                        )
-                        if distance_to_colony > DAY_NIGHT['NIGHT_VISIBILITY']:
-                            # Move back towards colony
-                            dx = ant.home_colony.position[0] - ant.position[0]
-                            dy = ant.home_colony.position[1] - ant.position[1]
-                            total = math.sqrt(dx*dx + dy*dy)
-                            if total > 0:
-                                ant.direction = [dx/total, dy/total]
-                else:
-                    ant.speed = Behavior.DAY_NIGHT['ANT_DAY_SPEED']
-                    ant.perception_radius = Behavior.DAY_NIGHT['ANT_DAY_PERCEPTION']
+                        # Special night behavior: ants stay closer to colony
+                        if hasattr(ant, 'home_colony') and ant.home_colony:
+                            distance_to_colony = math.hypot(
+                                ant.position[0] - ant.home_colony.position[0],
+                                ant.position[1] - ant.home_colony.position[1]
+                            )
+                            if distance_to_colony > DAY_NIGHT['NIGHT_VISIBILITY']:
+                                # Move back towards colony
+                                dx = ant.home_colony.position[0] - ant.position[0]
+                                dy = ant.home_colony.position[1] - ant.position[1]
+                                total = math.sqrt(dx*dx + dy*dy)
+                                if total > 0:
+                                    ant.direction = [dx/total, dy/total]
+                    else:
+                        ant.speed = Behavior.DAY_NIGHT['ANT_DAY_SPEED']
+                        ant.perception_radius = Behavior.DAY_NIGHT['ANT_DAY_PERCEPTION']
             
             # Update snake behavior with sleep animation
             if is_night and self.snake_sleep_position:
@@ -856,10 +1118,10 @@ class Game:
                     self.snake.position = self.snake_sleep_position
                     # Add sleep animation (Z's)
                     if hasattr(self, 'sleep_animation_time'):
-                        if pygame.time.get_ticks() - self.sleep_animation_time > 1000:
-                            self.sleep_animation_time = pygame.time.get_ticks()
+                        if self.clock.get_ticks() - self.sleep_animation_time > 1000:
+                            self.sleep_animation_time = self.clock.get_ticks()
                     else:
-                        self.sleep_animation_time = pygame.time.get_ticks()
+                        self.sleep_animation_time = self.clock.get_ticks()
             else:
                 self.snake.speed = Behavior.DAY_NIGHT['SNAKE_DAY_SPEED']
                 if hasattr(self, 'sleep_animation_time'):
@@ -868,9 +1130,15 @@ class Game:
         except Exception as e:
             logging.error(f"Error in update_day_night_behaviors: {e}")
 
-    def draw_day_night_effects(self):
-        """Draw enhanced day/night visual effects with smooth celestial transitions"""
-        current_time = pygame.time.get_ticks()
+    def day_night_state(self):
+        """Where the day/night cycle is, for drawing and dirty tracking
+
+        Returns a dict with the cycle time, whether it is night, the
+        phase ('dawn', 'day', 'dusk' or 'night'), the night overlay
+        alpha, the sun/moon position and hover state, and the star (if
+        any) twinkling this frame.
+        """
+        current_time = self.clock.get_ticks()
         cycle_time = (current_time - self.cycle_start_time) % DAY_NIGHT['CYCLE_DURATION']
         
         # Calculate base overlay alpha
@@ -896,188 +1164,108 @@ class Game:
             celestial_x = -WINDOW_WIDTH * 0.1 + (WINDOW_WIDTH * 1.2) * body_progress
             celestial_y = base_height - path_height * math.sin(body_progress * math.pi)
         
-        # Draw celestial body and effects
-        if is_night:
-            # Draw moon and glow
-            pygame.draw.circle(self.screen, VISUALS['TIME']['NIGHT']['MOON'],
-                             (int(celestial_x), int(celestial_y)), 20)
-            for radius in range(30, 20, -2):
-                glow_color = (*VISUALS['TIME']['NIGHT']['MOON_GLOW'][:3], 
-                             int(255 * (30-radius)/10))
-                pygame.draw.circle(self.screen, glow_color,
-                                 (int(celestial_x), int(celestial_y)), radius)
-        else:
-            # Draw animated sun
-            self._draw_sun((celestial_x, celestial_y), body_progress)
-        
         # Check for mouse hover over visible celestial body
+        hovered = False
         if 0 <= celestial_x <= WINDOW_WIDTH:
-            mouse_pos = pygame.mouse.get_pos()
-            celestial_pos = (int(celestial_x), int(celestial_y))
+            mouse_pos = self.input.cursor_pos()
             celestial_radius = 25 if not is_night else 20
-            distance_to_mouse = math.hypot(mouse_pos[0] - celestial_pos[0], 
-                                         mouse_pos[1] - celestial_pos[1])
-            
-            # Draw tooltip on hover
-            if distance_to_mouse <= celestial_radius:
-                minutes_in_cycle = DAY_NIGHT['CYCLE_DURATION'] / 1000 / 60
-                current_minutes = (cycle_time / 1000 / 60)
-                time_left = minutes_in_cycle/2 - current_minutes if not is_night else \
-                           minutes_in_cycle - current_minutes
-                
-                if is_night:
-                    time_str = f"Night Time - {time_left:.1f} minutes until dawn"
-                else:
-                    time_str = f"Day Time - {time_left:.1f} minutes until dusk"
-                
-                # Draw tooltip using UI style
-                tooltip_font = pygame.font.Font(None, UI.Tooltips.FONT_SIZE)
-                tooltip_surface = tooltip_font.render(time_str, True, UI.Tooltips.TEXT_COLOR)
-                tooltip_rect = tooltip_surface.get_rect()
-                tooltip_rect.centerx = int(celestial_x)
-                tooltip_rect.bottom = int(celestial_y) - UI.Tooltips.OFFSET_Y
-                
-                background_rect = tooltip_rect.inflate(UI.Tooltips.PADDING * 2, UI.Tooltips.PADDING * 2)
-                pygame.draw.rect(self.screen, UI.Tooltips.BACKGROUND, background_rect)
-                pygame.draw.rect(self.screen, UI.Tooltips.BORDER_COLOR, background_rect, 
-                               UI.Tooltips.BORDER_WIDTH)
-                self.screen.blit(tooltip_surface, tooltip_rect)
+            hovered = math.hypot(mouse_pos[0] - int(celestial_x),
+                                 mouse_pos[1] - int(celestial_y)) <= celestial_radius
         
-        # Handle transitions and overlays
+        # Transitions and overlay strength
+        star = None
         if cycle_time < DAY_NIGHT['DAWN_DURATION']:
-            # Dawn transition
+            phase = 'dawn'
             progress = cycle_time / DAY_NIGHT['DAWN_DURATION']
             alpha = int(max_alpha * (1 - progress))
-            dawn_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            dawn_overlay.fill((*VISUALS['TIME']['TRANSITIONS']['DAWN']['TINT'], 
-                              VISUALS['TIME']['TRANSITIONS']['DAWN']['ALPHA']))
-            self.screen.blit(dawn_overlay, (0, 0))
-        
         elif cycle_time < DAY_NIGHT['CYCLE_DURATION'] / 2:
-            # Day
+            phase = 'day'
             alpha = 0
-            
         elif cycle_time < DAY_NIGHT['CYCLE_DURATION'] / 2 + DAY_NIGHT['DUSK_DURATION']:
-            # Dusk transition
+            phase = 'dusk'
             transition_time = cycle_time - DAY_NIGHT['CYCLE_DURATION'] / 2
             progress = transition_time / DAY_NIGHT['DUSK_DURATION']
             alpha = int(max_alpha * progress)
-            dusk_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            dusk_overlay.fill((*VISUALS['TIME']['TRANSITIONS']['DUSK']['TINT'], 
-                              VISUALS['TIME']['TRANSITIONS']['DUSK']['ALPHA']))
-            self.screen.blit(dusk_overlay, (0, 0))
         else:
-            # Night
+            phase = 'night'
             alpha = max_alpha
-            if random.random() < 0.05:
-                star_pos = (random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT))
-                star_size = random.randint(1, 3)
-                pygame.draw.circle(self.screen, VISUALS['TIME']['NIGHT']['STARS'], 
-                                 star_pos, star_size)
-        
-        # Apply base night overlay
-        night_color = list(VISUALS['TIME']['NIGHT']['SKY'])
-        night_color[3] = alpha
-        self.night_overlay.fill(night_color)
-        self.screen.blit(self.night_overlay, (0, 0)) 
+            rng = self.rng.cosmetic
+            if rng.random() < 0.05:
+                star_pos = (rng.randint(0, WINDOW_WIDTH), rng.randint(0, WINDOW_HEIGHT))
+                star = (star_pos, rng.randint(1, 3))
+        
+        return {
+            'cycle_time': cycle_time,
+            'is_night': is_night,
+            'body_progress': body_progress,
+            'celestial': (celestial_x, celestial_y),
+            'hovered': hovered,
+            'phase': phase,
+            'alpha': alpha,
+            'star': star
+        }
 
-    def _draw_sun(self, pos, cycle_progress):
-        """Draw a pixelated sun with dynamic rays and warm gradients"""
-        x, y = int(pos[0]), int(pos[1])
-        current_time = pygame.time.get_ticks()
-        
-        # Core sun colors
-        sun_colors = [
-            (255, 247, 184),  # Bright yellow
-            (255, 222, 123),  # Golden yellow
-            (255, 198, 93),   # Orange yellow
-            (255, 170, 66)    # Deep orange
-        ]
-        
-        # Create larger pixel pattern for circular shape
-        pixel_pattern = [
-            "   XXXXX   ",
-            "  XXXXXXX  ",
-            " XXXXXXXXX ",
-            "XXXXXXXXXXX",
-            "XXXXXXXXXXX",
-            "XXXXXXXXXXX",
-            "XXXXXXXXXXX",
-            "XXXXXXXXXXX",
-            " XXXXXXXXX ",
-            "  XXXXXXX  ",
-            "   XXXXX   "
-        ]
-        
-        # Calculate sun dimensions
-        pixel_size = 3
-        pattern_width = len(pixel_pattern[0])
-        sun_radius = (pattern_width * pixel_size) // 2
-        
-        # Draw rays first (behind the sun)
-        num_rays = 12
-        max_ray_length = sun_radius * 0.5  # Ray length relative to sun size
-        ray_width_base = 3
-        
-        ray_colors = [
-            (255, 247, 184, 255),  # Bright yellow
-            (255, 222, 123, 255),  # Golden yellow
-        ]
+    def draw_day_night_effects(self, day_night=None, regions=None):
+        """Draw enhanced day/night visual effects with smooth celestial transitions
+
+        Args:
+            day_night: State from day_night_state() (computed if omitted)
+            regions: Dirty regions being redrawn, or None for the whole screen
+        """
+        if day_night is None:
+            day_night = self.day_night_state()
+        cycle_time = day_night['cycle_time']
+        is_night = day_night['is_night']
+        celestial_x, celestial_y = day_night['celestial']
         
-        # Draw rays from center
-        for i in range(num_rays):
-            angle = (i * (360 / num_rays) + current_time * 0.02) % 360
-            ray_length = max_ray_length * (0.7 + 0.3 * math.sin(current_time * 0.003 + i * 0.5))
+        # Draw celestial body and effects
+        if is_night:
+            # Draw moon and glow
+            self.celestial.blit(self.screen, self.celestial.moon, (celestial_x, celestial_y))
+        else:
+            # Draw animated sun
+            self._draw_sun((celestial_x, celestial_y), day_night['body_progress'])
+        
+        # Draw tooltip on hover
+        if day_night['hovered']:
+            minutes_in_cycle = DAY_NIGHT['CYCLE_DURATION'] / 1000 / 60
+            current_minutes = (cycle_time / 1000 / 60)
+            time_left = minutes_in_cycle/2 - current_minutes if not is_night else \
+                       minutes_in_cycle - current_minutes
             
-            # Start from center of sun
-            start_x = x
-            start_y = y
-            end_x = x + math.cos(math.radians(angle)) * (sun_radius + ray_length)
-            end_y = y + math.sin(math.radians(angle)) * (sun_radius + ray_length)
+            if is_night:
+                time_str = f"Night Time - {time_left:.1f} minutes until dawn"
+            else:
+                time_str = f"Day Time - {time_left:.1f} minutes until dusk"
             
-            # Draw ray with gradient
-            points = []
-            ray_width = ray_width_base
-            for t in range(8):
-                progress = t / 7
-                current_x = start_x + (end_x - start_x) * progress
-                current_y = start_y + (end_y - start_y) * progress
-                
-                # Reduced wobble effect
-                wobble = math.sin(current_time * 0.004 + i * 0.5) * 0.5
-                current_x += math.cos(math.radians(angle + 90)) * wobble
-                current_y += math.sin(math.radians(angle + 90)) * wobble
-                
-                points.append((current_x, current_y))
-                
-                color = ray_colors[0] if t < 4 else ray_colors[1]
-                alpha = int(255 * (1 - progress))
-                color = (*color[:3], alpha)
-                
-                if len(points) > 1:
-                    pygame.draw.line(self.screen, color, points[-2], points[-1], 
-                                   max(1, int(ray_width * (1 - progress * 0.5))))
-        
-        # Draw pixelated sun disc over the rays
-        for row_idx, row in enumerate(pixel_pattern):
-            for col_idx, cell in enumerate(row):
-                if cell == 'X':
-                    pixel_x = x - (len(row) * pixel_size // 2) + col_idx * pixel_size
-                    pixel_y = y - (len(pixel_pattern) * pixel_size // 2) + row_idx * pixel_size
-                    
-                    noise_val = noise.pnoise2(col_idx * 0.5 + current_time * 0.001,
-                                            row_idx * 0.5,
-                                            octaves=2,
-                                            persistence=0.5)
-                    
-                    dist_from_center = math.sqrt(
-                        (row_idx - len(pixel_pattern)//2)**2 + 
-                        (col_idx - len(row)//2)**2
-                    )
-                    color_index = min(3, int(dist_from_center/2))
-                    color = list(sun_colors[color_index])
-                    
-                    color = [min(255, max(0, c + int(noise_val * 15))) for c in color]
-                    
-                    pygame.draw.rect(self.screen, color, 
-                                   (pixel_x, pixel_y, pixel_size, pixel_size)) 
\ No newline at end of file
+            # Draw tooltip using UI style
+            tooltip_surface = render_text(time_str, UI.Tooltips.FONT_SIZE, UI.Tooltips.TEXT_COLOR)
+            tooltip_rect = tooltip_surface.get_rect()
+            tooltip_rect.centerx = int(celestial_x)
+            tooltip_rect.bottom = int(celestial_y) - UI.Tooltips.OFFSET_Y
+            
+            background_rect = tooltip_rect.inflate(UI.Tooltips.PADDING * 2, UI.Tooltips.PADDING * 2)
+            pygame.draw.rect(self.screen, UI.Tooltips.BACKGROUND, background_rect)
+            pygame.draw.rect(self.screen, UI.Tooltips.BORDER_COLOR, background_rect, 
+                           UI.Tooltips.BORDER_WIDTH)
+            self.screen.blit(tooltip_surface, tooltip_rect)
+        
+        # Twinkling star at night
+        if day_night['star']:
+            star_pos, star_size = day_night['star']
+            pygame.draw.circle(self.screen, VISUALS['TIME']['NIGHT']['STARS'], 
+                             star_pos, star_size)
+        
+        # Apply the dawn/dusk tint and night sky as one pre-blended overlay
+        overlay = self.sky_overlay.get(day_night['phase'], day_night['alpha'])
+        if overlay is None:
+            return
+        if regions is None:
+            self.screen.blit(overlay, (0, 0))
+        else:
+            for rect in regions:
+                self.screen.blit(overlay, rect, rect)
+
+    def _draw_sun(self, pos, cycle_progress):
+        """Draw the animated sun from its pre-rendered frames"""
+        self.celestial.blit(self.screen, self.celestial.sun(pygame.time.get_ticks()), pos) 
\ No newline at end of file
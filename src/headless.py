@@ -0,0 +1,127 @@
+"""
+Headless simulation entry point for Muchas Cacas! LITE
+
+Runs the same Colony/Ant/Snake/Spider/SpiderWeb logic as the game, but
+without a window, audio mixer or HUD surfaces. Time comes from a
+SimulationClock that advances a fixed step per update, so days of game
+time can be simulated as fast as the CPU allows.
+
+That is roughly 10-25 simulated days per minute on a one-screen map. A
+day is 10,800 ticks, and each tick walks every ant, resource and colony
+(Game.update, SpatialHash lookups, AntScheduler.update), so the rate
+falls as colonies grow. --coarse advances in Offline.TICK_MS steps with
+the offline-progress model (offline.py), at several thousand days per
+minute. It credits per-ant yields fitted to full runs with expansion off
+(benchmarks/fit_offline.py) instead of moving ants. Colonies built
+during a coarse run never gather, since the model credits only a
+colony's own ants.
+
+Usage:
+    python src/headless.py --days 10 --seed 1
+    python src/headless.py --days 1000 --seed 1 --coarse --no-expand
+"""
+
+import argparse
+import logging
+import time
+from clock import SimulationClock
+from game import Game
+from offline import advance_offline
+from world import parse_world_size
+from constants import DAY_NIGHT, FPS, Offline
+
+def create_headless_game(seed=None, colony_position=None, step_ms=1000 / FPS, swarm=False,
+                         world_size=None, lod=True):
+    """Create a headless game with the first colony already placed"""
+    game = Game(headless=True, clock=SimulationClock(step_ms), swarm=swarm, seed=seed,
+                world_size=world_size, lod=lod)
+    if colony_position is None:
+        colony_position = (game.width // 2, game.height // 2)
+    game.create_colony(colony_position)
+    return game
+
+def auto_expand(game):
+    """Stand in for the player: build a new colony whenever affordable"""
+    if game.colonies and game.colonies[0].can_create_colony():
+        position = game.find_valid_resource_position()
+        game.create_colony(position)
+        return True
+    return False
+
+def step(game, expand=True):
+    """Advance the simulation by one clock step"""
+    game.step()
+    if expand:
+        auto_expand(game)
+
+def summarize(game):
+    """Collect the simulation metrics we track for balance sweeps"""
+    simulated_ms = game.clock.get_ticks()
+    return {
+        'simulated_ms': simulated_ms,
+        'days': simulated_ms / DAY_NIGHT['CYCLE_DURATION'],
+        'colonies': len(game.colonies),
+        'ants': len(game.ants),
+        'minerals': sum(c.resources['minerals'] for c in game.colonies),
+        'plants': sum(c.resources['plants'] for c in game.colonies),
+        'snake_kills': game.hud.kills,
+        'rocks': len(game.rocks),
+        'trees': len(game.plants),
+        'bushes': len(game.bushes)
+    }
+
+def advance_coarse(game, end_time, on_tick=None):
+    """Advance to end_time in Offline.TICK_MS steps with the offline-progress model
+
+    on_tick is called with the game after every coarse tick.
+    """
+    while game.clock.get_ticks() < end_time:
+        # Each call credits at most Offline.MAX_AWAY_MS
+        away_ms = min(end_time - game.clock.get_ticks(), Offline.MAX_AWAY_MS)
+        if not advance_offline(game, away_ms, on_tick)['away_ms']:
+            break  # Less than one coarse tick left
+
+def run_headless(days=1.0, seed=None, expand=True, step_ms=1000 / FPS, swarm=False,
+                 world_size=None, lod=True, coarse=False):
+    """Simulate the given number of day/night cycles and return metrics
+
+    With coarse=True the days are advanced with the offline-progress model
+    (offline.py) in Offline.TICK_MS steps instead of frame by frame.
+    """
+    game = create_headless_game(seed, step_ms=step_ms, swarm=swarm, world_size=world_size,
+                                lod=lod)
+    end_time = days * DAY_NIGHT['CYCLE_DURATION']
+    if coarse:
+        advance_coarse(game, end_time, auto_expand if expand else None)
+        return summarize(game)
+    while game.clock.get_ticks() < end_time and game.running:
+        step(game, expand)
+    return summarize(game)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the colony simulation without a display")
+    parser.add_argument('--days', type=float, default=1.0, help="Day/night cycles to simulate")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    parser.add_argument('--step-ms', type=float, default=1000 / FPS, help="Simulated milliseconds per update")
+    parser.add_argument('--no-expand', action='store_true', help="Never build secondary colonies")
+    parser.add_argument('--swarm', action='store_true', help="Use the vectorized NumPy ant swarm")
+    parser.add_argument('--world', type=parse_world_size, default=None, metavar='WxH',
+                        help="Map size, e.g. 1440x2400 (default: one screen)")
+    parser.add_argument('--no-lod', action='store_true',
+                        help="Fully update every ant every tick (see lod.py)")
+    parser.add_argument('--coarse', action='store_true',
+                        help="Advance in 1 s steps with the offline-progress model (see offline.py)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    start = time.perf_counter()
+    result = run_headless(args.days, args.seed, not args.no_expand, args.step_ms, args.swarm,
+                          args.world, not args.no_lod, args.coarse)
+    elapsed = time.perf_counter() - start
+
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    print(f"wall time: {elapsed:.2f}s ({result['days'] / elapsed * 60:.1f} simulated days/min)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Level of detail for the ant simulation
+
+Most ants, most of the time, are walking a straight line: out exploring
+or back home with a load, with nothing around them to react to. For
+those a full Ant.update (threat checks, resource and colony lookups,
+re-bucketing in the spatial index) works out the same heading tick after
+tick. AntScheduler keeps full updates every tick for the ants where
+something can happen at once:
+
+- ants within LOD.NEAR_RADIUS of the cursor, the snake, the spider or a web;
+- ants caught in a web;
+- ants closing in on a resource they picked ('collecting');
+- ants whose state changed last tick, so they turn for home or set off
+  again straight away instead of gliding on the old heading.
+
+Every other ant is fully updated once every LOD.INTERVAL ticks, in turn
+by list position, and in between glides along its current heading at
+its current speed, which is the path a full update would have taken it.
+Picking a resource, turning home or depositing happens at most a few
+ticks late, so colony deposit rates stay the same within the tolerance
+checked by benchmarks/bench_lod.py. On maps larger than the window, ants
+outside the camera's active region use the longer
+World.FAR_TICK_INTERVAL.
+
+The schedule depends only on list positions and the tick count, so
+seeded runs and replays stay deterministic.
+
+Usage:
+    scheduler = AntScheduler(game)
+    scheduler.update(game.ants, cursor_pos, obstacles)  # Once per tick
+"""
+
+from constants import LOD, World
+
+class AntScheduler:
+    """Chooses each tick which list-stored ants get a full update"""
+    def __init__(self, game):
+        self.game = game
+        self.phase = 0  # Tick count modulo both intervals, saved in snapshots
+        self.changed = set()  # Ants whose state changed last tick
+        self.full_updates = 0  # Full Ant.update calls, to judge the savings
+        self.glides = 0
+
+    def near_threats(self, cursor_pos):
+        """Ants within LOD.NEAR_RADIUS of the cursor, snake, spider or a web"""
+        game = self.game
+        grid = game.ant_grid
+        radius = LOD.NEAR_RADIUS
+        near = set(grid.query(game.snake.position, radius))
+        if cursor_pos is not None:
+            near.update(grid.query(cursor_pos, radius))
+        if game.spider:
+            near.update(grid.query(game.spider.position, radius))
+        for web in game.webs:
+            near.update(grid.query(web.position, radius + web.size))
+        return near
+
+    def update(self, ants, cursor_pos, obstacles):
+        """Advance every ant one tick, fully or by gliding"""
+        game = self.game
+        near = self.near_threats(cursor_pos)
+        active = game.camera.active_rect()
+        snake_pos = game.snake.position
+        resources, colonies, grid = game.resource_grid, game.colony_grid, game.ant_grid
+        scale = game.tick_scale
+        phase = self.phase
+        changed, self.changed = self.changed, set()
+        for i, ant in enumerate(ants):
+            if (ant in near or ant in changed or ant.web_slow_timer > 0
+                    or ant.state == 'collecting'):
+                due = True
+            elif active is None or active.collidepoint(ant.position):
+                due = (i + phase) % LOD.INTERVAL == 0
+            else:
+                due = (i + phase) % World.FAR_TICK_INTERVAL == 0
+
+            if due:
+                state = ant.state
+                ant.update(cursor_pos, snake_pos, obstacles, resources, colonies)
+                grid.update(ant)
+                if ant.state != state:
+                    self.changed.add(ant)
+                self.full_updates += 1
+            else:
+                # Glide: what Ant.update does to an ant with nothing to react to
+                ant.update_jump()
+                ant.move(obstacles, ant.speed * scale)
+                self.glides += 1
+        self.phase = (phase + 1) % (LOD.INTERVAL * World.FAR_TICK_INTERVAL)
@@ -1,11 +1,95 @@
+import argparse
+import os
+import time
 import pygame
 from game import Game
+from profiler import Profiler
+from snapshot import Autosaver, read_snapshot, restore
+from offline import advance_offline
+from replay import InputRecorder
+from world import parse_world_size
+
+def back_up_save(path):
+    """Move a save that failed to load aside, so autosave cannot overwrite it
+
+    Returns False if it could not be moved; autosave then stays off.
+    """
+    backup = path + '.bak'
+    try:
+        os.replace(path, backup)
+    except OSError as e:
+        print(f"Could not back up {path} ({e}); autosave is off for this session")
+        return False
+    print(f"Moved the saved game to {backup}; autosaving a new game to {path}")
+    return True
 
 def main():
+    parser = argparse.ArgumentParser(description="Muchas Cacas! Lite")
+    parser.add_argument('--profile', action='store_true',
+                        help="Show the frame timing overlay (toggle with F3)")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="Record spans and write a Chrome trace to PATH on exit")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Seed the game's random streams to replay the same world")
+    parser.add_argument('--save', metavar='PATH',
+                        help="Resume from PATH if it exists and autosave the game there")
+    parser.add_argument('--world', type=parse_world_size, default=None, metavar='WxH',
+                        help="Play on a map larger than the window, e.g. 1440x2400 "
+                             "(scroll with the arrow keys or WASD)")
+    parser.add_argument('--record', metavar='PATH',
+                        help="Record input to PATH for benchmarks/bench_replay.py")
+    args = parser.parse_args()
+    if args.record and args.save:
+        parser.error("--record replays from a fresh game, so it cannot be combined with --save")
+
     pygame.init()
-    game = Game()
-    game.run()
+    profiler = Profiler(enabled=args.profile, trace=bool(args.trace))
+    profiler.overlay_visible = args.profile
+    snapshot = None
+    load_failed = False
+    if args.save and os.path.exists(args.save):
+        try:
+            snapshot = read_snapshot(args.save)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load saved game: {e}")
+            load_failed = True
+    # A saved game continues on the map it was saved on
+    world = args.world
+    if snapshot is not None and 'world' in snapshot[0]:
+        world = tuple(snapshot[0]['world'])
+    game = Game(profiler=profiler, seed=args.seed, world_size=world)
+    if args.save:
+        if snapshot is not None:
+            meta, arrays = snapshot
+            try:
+                restore(game, meta, arrays)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                # restore leaves the game untouched, so play on from a new one
+                print(f"Could not load saved game: {e}")
+                load_failed = True
+            else:
+                away_ms = (time.time() - meta.get('saved_at', time.time())) * 1000
+                report = advance_offline(game, away_ms)
+                if report['away_ms']:
+                    print(f"While you were away: +{report['minerals']} minerals, "
+                          f"+{report['plants']} plants, {report['ants_spawned']} ants hatched, "
+                          f"{report['ants_lost']} lost to the snake")
+        if not load_failed or back_up_save(args.save):
+            game.autosaver = Autosaver(game, args.save)
+            game.autosaver.start()
+    if args.record:
+        game.input = InputRecorder(game)
+    try:
+        game.run()
+    finally:
+        if args.record:
+            game.input.save(args.record)
+            print(f"Recorded {len(game.input.frames)} frames to {args.record}")
+        if game.autosaver is not None:
+            game.autosaver.stop()
+        if args.trace:
+            profiler.dump_chrome_trace(args.trace)
     pygame.quit()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
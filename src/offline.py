@@ -0,0 +1,153 @@
+"""
+Progress for time spent away from the game
+
+Replaying hours of absence frame by frame would take minutes, so it is
+advanced with a coarse-tick model instead. Every Offline.TICK_MS:
+
+- each colony is credited what its ants would have gathered, using
+  per-ant yields measured from full headless runs, scaled down at night
+  and capped by the rocks, plants and bushes actually on the map;
+- by day the snake takes its expected share of ants;
+- the real Colony.update and Game.update_resources run, so ant spawning
+  and resource respawn follow the same rules as the game.
+
+Ants keep their positions and the spider is left where it was; colony
+stores, ant counts, resources, kills, the clock and the day/night phase
+move forward.
+
+headless.py --coarse uses the same model to run long sweeps quickly.
+
+Usage:
+    report = advance_offline(game, away_ms)
+"""
+
+from sounds import SilentGameSounds
+from constants import DAY_NIGHT, Offline
+
+def advance_offline(game, away_ms, on_tick=None):
+    """Advance the game by away_ms of simulated time with the coarse model
+
+    on_tick, if given, is called with the game after every coarse tick
+    (headless.py builds colonies from it). Returns a summary of the
+    absence: the simulated time credited and the minerals, plants, ants
+    spawned and ants lost along the way.
+    """
+    ticks = int(min(away_ms, Offline.MAX_AWAY_MS) // Offline.TICK_MS)
+    start = game.clock.elapsed
+    report = {'away_ms': ticks * Offline.TICK_MS, 'minerals': 0, 'plants': 0,
+              'ants_spawned': 0, 'ants_lost': 0}
+    if ticks == 0:
+        return report
+
+    cycle = DAY_NIGHT['CYCLE_DURATION']
+    day_seconds = Offline.TICK_MS / 1000
+    kill_chance = Offline.SNAKE_KILLS_PER_ANT_HOUR * Offline.TICK_MS / 3600000
+    owed = {id(colony): [0.0, 0.0] for colony in game.colonies}
+    kills_owed = 0.0
+    midday_passed = False
+
+    # Nobody should hear a burst of spawn sounds for time that already passed
+    sounds = game.sounds
+    game.sounds = SilentGameSounds()
+    try:
+        for tick in range(1, ticks + 1):
+            now = start + tick * Offline.TICK_MS
+            game.clock.elapsed = now  # So on_tick and new entities see the coarse time
+            cycle_time = (now - game.cycle_start_time) % cycle
+            is_night = cycle_time >= cycle / 2
+            if cycle / 4 <= cycle_time <= cycle / 4 + Offline.TICK_MS:
+                midday_passed = True
+
+            seconds = day_seconds * (Offline.NIGHT_YIELD if is_night else 1.0)
+            _gather(game, owed, seconds, report)
+            if not is_night:
+                kills_owed += kill_chance * len(game.ants)
+                while kills_owed >= 1 and game.ants:
+                    _snake_kill(game)
+                    kills_owed -= 1
+                    report['ants_lost'] += 1
+
+            before = len(game.ants)
+            game.update_resources(now)
+            for colony in game.colonies:
+                colony.update(now)
+            report['ants_spawned'] += len(game.ants) - before
+            if on_tick:
+                on_tick(game)
+    finally:
+        game.sounds = sounds
+
+    game.clock.elapsed = start + ticks * Offline.TICK_MS
+    if midday_passed:
+        game.webs.clear()
+
+    # Trees that sprouted while away have long finished growing
+    for plant in game.plants:
+        if plant.is_growing:
+            plant.is_growing = False
+            plant.growth_scale = 1.0
+
+    cycle_time = (game.clock.get_ticks() - game.cycle_start_time) % cycle
+    time_of_day = 'night' if cycle_time >= cycle / 2 else 'day'
+    if time_of_day != game.current_time_of_day:
+        game.handle_time_change(time_of_day)
+        game.current_time_of_day = time_of_day
+    game.sync_spatial_indexes()
+    if not game.headless:
+        game.full_redraw = True
+    return report
+
+def _gather(game, owed, seconds, report):
+    """Credit each colony one tick of its ants' yield, taken from the map"""
+    for colony in game.colonies:
+        if colony.ant_count <= 0:
+            continue
+        ledger = owed.setdefault(id(colony), [0.0, 0.0])  # Colonies built on_tick start empty
+        ledger[0] += colony.ant_count * Offline.MINERALS_PER_ANT_S * seconds
+        ledger[1] += colony.ant_count * Offline.PLANTS_PER_ANT_S * seconds
+
+        # Whole units are taken from the map; demand it cannot meet is lost
+        wanted = int(ledger[0])
+        if wanted:
+            taken = _harvest(game, game.rocks, 'minerals', wanted)
+            colony.resources['minerals'] += taken
+            report['minerals'] += taken
+            ledger[0] -= wanted
+        wanted = int(ledger[1])
+        if wanted:
+            taken = _harvest(game, game.plants, 'resources', wanted)
+            taken += _harvest(game, game.bushes, 'resources', wanted - taken)
+            colony.resources['plants'] += taken
+            report['plants'] += taken
+            ledger[1] -= wanted
+
+def _harvest(game, sources, attribute, amount):
+    """Take up to amount from the front of sources, returning what was taken
+
+    Sources emptied along the way are dropped from the list and the
+    spatial index, as Game.update does for depleted resources.
+    """
+    taken = 0
+    emptied = 0
+    for source in sources:
+        part = min(getattr(source, attribute), amount - taken)
+        setattr(source, attribute, getattr(source, attribute) - part)
+        taken += part
+        if getattr(source, attribute) > 0:
+            break
+        game.resource_grid.remove(source)
+        emptied += 1
+        if taken >= amount:
+            break
+    del sources[:emptied]
+    return taken
+
+def _snake_kill(game):
+    """Remove a random ant the way Snake.update does when it catches one"""
+    ant = game.ants[game.rng.simulation.randrange(len(game.ants))]
+    if ant.home_colony:
+        ant.home_colony.ant_count -= 1
+    game.ants.remove(ant)
+    game.ant_grid.remove(ant)
+    game.snake.length += 1
+    game.hud.kills += 1
@@ -0,0 +1,185 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+import numpy as np
+import pygame
+
+class _NullSpan:
+    """Stand-in returned while profiling is off, so call sites stay cheap"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def next(self, name):
+        pass
+
+    def end(self):
+        pass
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+class _Phases:
+    """Consecutive sub-spans of one parent span, started with next()"""
+    def __init__(self, profiler, parent):
+        self.profiler = profiler
+        self.parent = parent
+        self.name = None
+        self.start = 0
+
+    def next(self, name):
+        now = time.perf_counter_ns()
+        if self.name is not None:
+            self.profiler.record(self.name, self.start, now)
+        self.name = f"{self.parent}.{name}"
+        self.start = now
+
+    def end(self):
+        if self.name is not None:
+            self.profiler.record(self.name, self.start, time.perf_counter_ns())
+            self.name = None
+
+class Profiler:
+    """Opt-in frame instrumentation
+
+    Spans are timed with perf_counter and kept in rolling windows per
+    name for the on-screen overlay and summary statistics. While
+    tracing, every span is also kept as a Chrome trace event, so a run
+    can be inspected in chrome://tracing or Perfetto.
+
+    Usage:
+        with profiler.span('draw'):
+            ...
+        phases = profiler.phases('update')
+        phases.next('snake')
+        ...
+        phases.end()
+    """
+    WINDOW = 240          # Samples kept per span (4 seconds at 60 FPS)
+    MAX_TRACE_EVENTS = 500000
+
+    def __init__(self, enabled=False, trace=False):
+        self.enabled = enabled or trace
+        self.tracing = trace
+        self.overlay_visible = False
+        self.samples = {}      # name -> deque of durations in ms
+        self.order = []        # Span names in first-seen order
+        self.trace_events = []
+        self.origin_ns = time.perf_counter_ns()
+        self.last_frame_ns = None
+        self.font = None
+
+    def span(self, name):
+        """Context manager timing the enclosed block"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def phases(self, parent):
+        """Timer for back-to-back sub-spans named parent.<phase>"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Phases(self, parent)
+
+    def record(self, name, start_ns, end_ns):
+        window = self.samples.get(name)
+        if window is None:
+            window = self.samples[name] = deque(maxlen=self.WINDOW)
+            self.order.append(name)
+        window.append((end_ns - start_ns) / 1e6)
+        if self.tracing and len(self.trace_events) < self.MAX_TRACE_EVENTS:
+            self.trace_events.append({
+                'name': name,
+                'cat': name.split('.')[0],
+                'ph': 'X',
+                'ts': (start_ns - self.origin_ns) / 1000,
+                'dur': (end_ns - start_ns) / 1000,
+                'pid': os.getpid(),
+                'tid': threading.get_ident()
+            })
+
+    def frame(self):
+        """Mark the end of a rendered frame, recording the frame time"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.last_frame_ns is not None:
+            self.record('frame', self.last_frame_ns, now)
+        self.last_frame_ns = now
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+
+    def stats(self, name):
+        """Rolling mean/p50/p95/max in milliseconds for one span"""
+        window = self.samples.get(name)
+        if not window:
+            return None
+        values = np.fromiter(window, dtype=float)
+        return {
+            'mean': float(values.mean()),
+            'p50': float(np.percentile(values, 50)),
+            'p95': float(np.percentile(values, 95)),
+            'max': float(values.max())
+        }
+
+    def histogram(self, name, bins=10):
+        """Counts and bin edges (ms) of the rolling window for one span"""
+        window = self.samples.get(name)
+        if not window:
+            return None
+        counts, edges = np.histogram(np.fromiter(window, dtype=float), bins=bins)
+        return counts.tolist(), edges.tolist()
+
+    def summary(self):
+        return {name: self.stats(name) for name in self.order}
+
+    def draw_overlay(self, surface):
+        """Compact table of span timings in the top-left corner"""
+        if not self.overlay_visible:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 16)
+
+        rows = []
+        for name in self.order:
+            stats = self.stats(name)
+            if stats:
+                indent = '  ' * name.count('.')
+                label = name.rsplit('.', 1)[-1]
+                rows.append(f"{indent}{label:<14}{stats['mean']:6.2f} {stats['p95']:6.2f} {stats['max']:6.2f}")
+        if not rows:
+            return
+        rows.insert(0, f"{'span':<14}{'mean':>6} {'p95':>6} {'max':>6} ms")
+
+        line_height = 13
+        panel = pygame.Surface((200, line_height * len(rows) + 6), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, row in enumerate(rows):
+            text = self.font.render(row, True, (220, 220, 220))
+            panel.blit(text, (4, 3 + i * line_height))
+        surface.blit(panel, (5, 60))
+
+    def dump_chrome_trace(self, path):
+        """Write recorded spans as Chrome trace-event JSON"""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events, 'displayTimeUnit': 'ms'}, f)
+        print(f"Wrote {len(self.trace_events)} trace events to {path}")
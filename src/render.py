@@ -0,0 +1,284 @@
+from itertools import chain
+import math
+import numpy as np
+import noise
+import pygame
+from constants import DAY_NIGHT, VISUALS
+
+class DirtyRects:
+    """Screen regions that changed since the last presented frame
+
+    Each frame the game marks the bounds of everything that moves or
+    animates, then asks for the regions to redraw. Marks from this frame
+    and the last one (so vacated pixels get restored) are snapped to a
+    grid of TILE-sized tiles, and the dirty tiles are returned as
+    disjoint rects, so overlays can be blended over them exactly once.
+    present() pushes only those regions to the display. A frame is drawn
+    and flipped whole after force_full(), or when the dirty tiles would
+    cover most of the screen anyway.
+
+    Usage:
+        dirty.mark(ant.bounds())
+        regions = dirty.regions()   # None means redraw everything
+        ...
+        dirty.present()
+    """
+    TILE = 16
+    FULL_REDRAW_FRACTION = 0.6  # Share of the screen worth a full redraw
+
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.columns = -(-self.screen_rect.width // self.TILE)
+        self.rows = -(-self.screen_rect.height // self.TILE)
+        self.rects = []
+        self.previous = []
+        self.current = None
+        self.full = True  # Nothing is on screen yet
+
+    def mark(self, rect):
+        self.rects.append(rect)
+
+    def extend(self, rects):
+        self.rects.extend(rects)
+
+    def force_full(self):
+        """Redraw and flip the whole screen this frame"""
+        self.full = True
+
+    def regions(self):
+        """Disjoint rects to redraw this frame, or None for the whole screen"""
+        marked, self.rects = self.rects, []
+        regions = None
+        if not self.full:
+            tiles = self.tiles(marked + self.previous)
+            if tiles.mean() <= self.FULL_REDRAW_FRACTION:
+                regions = self.spans(tiles)
+        self.previous = marked
+        self.current = regions
+        self.full = False
+        return regions
+
+    def tiles(self, rects):
+        """Boolean (rows, columns) grid of tiles touched by any rect"""
+        if not rects:
+            return np.zeros((self.rows, self.columns), dtype=bool)
+        tile = self.TILE
+        boxes = np.fromiter(chain.from_iterable(rects), dtype=np.int64,
+                            count=4 * len(rects)).reshape(-1, 4)
+        boxes[:, :2] -= self.screen_rect.topleft
+        x0 = np.clip(boxes[:, 0] // tile, 0, self.columns)
+        y0 = np.clip(boxes[:, 1] // tile, 0, self.rows)
+        x1 = np.clip((boxes[:, 0] + boxes[:, 2] - 1) // tile + 1, 0, self.columns)
+        y1 = np.clip((boxes[:, 1] + boxes[:, 3] - 1) // tile + 1, 0, self.rows)
+        # Paint every box at once: +1/-1 at its corners, then prefix sums
+        stride = self.columns + 1
+        size = (self.rows + 1) * stride
+        coverage = (np.bincount(y0 * stride + x0, minlength=size) -
+                    np.bincount(y0 * stride + x1, minlength=size) -
+                    np.bincount(y1 * stride + x0, minlength=size) +
+                    np.bincount(y1 * stride + x1, minlength=size))
+        coverage = coverage.reshape(self.rows + 1, stride).cumsum(axis=0).cumsum(axis=1)
+        return coverage[:self.rows, :self.columns] > 0
+
+    def spans(self, grid):
+        """Cover the dirty tiles with disjoint rects
+
+        Runs of dirty tiles in a row become one rect, and identical runs
+        in consecutive rows are stacked into a single taller rect.
+        """
+        padded = np.zeros((self.rows, self.columns + 2), dtype=bool)
+        padded[:, 1:-1] = grid
+        rows, edges = np.nonzero(padded[:, 1:] != padded[:, :-1])
+        if len(rows) == 0:
+            return []
+        # Edges pair up within each row: (start, end) column of every run
+        row, start, end = rows[::2], edges[::2], edges[1::2]
+        order = np.lexsort((row, end, start))
+        row, start, end = row[order], start[order], end[order]
+        # A new rect begins unless the run continues the one in the row above
+        begins = np.ones(len(row), dtype=bool)
+        begins[1:] = (start[1:] != start[:-1]) | (end[1:] != end[:-1]) | (row[1:] != row[:-1] + 1)
+        first = np.flatnonzero(begins)
+        heights = np.diff(np.append(first, len(row)))
+        tile = self.TILE
+        left, top = self.screen_rect.topleft
+        return [pygame.Rect(left + x * tile, top + y * tile, (x_end - x) * tile, h * tile).clip(self.screen_rect)
+                for x, x_end, y, h in zip(start[first].tolist(), end[first].tolist(),
+                                          row[first].tolist(), heights.tolist())]
+
+    def present(self):
+        """Push this frame's regions (or the whole screen) to the display"""
+        if self.current is None:
+            pygame.display.flip()
+        elif self.current:
+            pygame.display.update(self.current)
+        self.current = None
+
+class DayNightOverlay:
+    """Pre-blended tint for the day/night cycle
+
+    Dawn and dusk stack a transition tint and the night sky, both uniform
+    colors, so every overlay strength (the integer alpha the cycle already
+    steps through) collapses to a single color and surface alpha. Those
+    are computed once per phase into a table; one opaque surface is
+    refilled only when the entry changes and blitted with surface alpha,
+    instead of building and blending per-pixel alpha surfaces each frame.
+    """
+    def __init__(self, size):
+        self.surface = pygame.Surface(size)
+        self.entry = None
+        sky = VISUALS['TIME']['NIGHT']['SKY'][:3]
+        max_alpha = DAY_NIGHT['MAX_NIGHT_ALPHA']
+        transitions = VISUALS['TIME']['TRANSITIONS']
+        night = [self.blend(sky, alpha) for alpha in range(max_alpha + 1)]
+        self.table = {
+            'day': night,
+            'night': night,
+            'dawn': [self.blend(sky, alpha, transitions['DAWN']['TINT'], transitions['DAWN']['ALPHA'])
+                     for alpha in range(max_alpha + 1)],
+            'dusk': [self.blend(sky, alpha, transitions['DUSK']['TINT'], transitions['DUSK']['ALPHA'])
+                     for alpha in range(max_alpha + 1)]
+        }
+
+    @staticmethod
+    def blend(sky, sky_alpha, tint=(0, 0, 0), tint_alpha=0):
+        """One (color, alpha) equal to blending tint and then sky over a pixel"""
+        a1 = tint_alpha / 255
+        a2 = sky_alpha / 255
+        alpha = 1 - (1 - a1) * (1 - a2)
+        if alpha <= 0:
+            return None
+        color = tuple(min(255, round((a2 * s + (1 - a2) * a1 * t) / alpha))
+                      for s, t in zip(sky, tint))
+        return color, round(alpha * 255)
+
+    def get(self, phase, alpha):
+        """Overlay surface for a phase and night alpha, or None if clear"""
+        table = self.table[phase]
+        entry = table[max(0, min(int(alpha), len(table) - 1))]
+        if entry is None:
+            return None
+        if entry != self.entry:
+            color, surface_alpha = entry
+            self.surface.fill(color)
+            self.surface.set_alpha(surface_alpha)
+            self.entry = entry
+        return self.surface
+
+class CelestialSprites:
+    """Pre-rendered sun animation and moon
+
+    The sun's rays spin, pulse and wobble and its disc shimmers with
+    Perlin noise. All of it is drawn once into a looping sheet of frames,
+    so the sun costs one blit looked up by animation time. The loop is
+    made seamless by rounding each motion to a whole number of cycles
+    per PERIOD and wrapping the noise with repeatx. The moon never
+    changes, so it is a single surface.
+    """
+    PERIOD = 6000      # ms for the whole animation to repeat
+    FRAMES = 120       # Sun frames per period (20 per second)
+    HALF_SIZE = 28     # Center to sprite edge, covering rays at full length
+    SPIN_CYCLES = 4    # Rays spaced 30 degrees apart, turning 0.02 deg/ms
+    PULSE_CYCLES = 3   # Ray length pulse, about 0.003 rad/ms
+    WOBBLE_CYCLES = 4  # Sideways ray wobble, about 0.004 rad/ms
+    NOISE_DRIFT = 6    # Noise x offset per period (0.001 per ms)
+
+    SUN_COLORS = [
+        (255, 247, 184),  # Bright yellow
+        (255, 222, 123),  # Golden yellow
+        (255, 198, 93),   # Orange yellow
+        (255, 170, 66)    # Deep orange
+    ]
+    SUN_PATTERN = [
+        "   XXXXX   ",
+        "  XXXXXXX  ",
+        " XXXXXXXXX ",
+        "XXXXXXXXXXX",
+        "XXXXXXXXXXX",
+        "XXXXXXXXXXX",
+        "XXXXXXXXXXX",
+        "XXXXXXXXXXX",
+        " XXXXXXXXX ",
+        "  XXXXXXX  ",
+        "   XXXXX   "
+    ]
+
+    def __init__(self):
+        self.sun_frames = [self.draw_sun_frame(i / self.FRAMES) for i in range(self.FRAMES)]
+        self.moon = self.draw_moon()
+
+    def sun(self, time_ms):
+        """Sun frame for a time in milliseconds"""
+        return self.sun_frames[int(time_ms % self.PERIOD * self.FRAMES // self.PERIOD)]
+
+    def draw_sun_frame(self, phase):
+        """Pixelated sun with dynamic rays, at a phase (0..1) of the loop"""
+        size = self.HALF_SIZE * 2 + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        x = y = self.HALF_SIZE
+        turn = 2 * math.pi * phase
+
+        pixel_size = 3
+        pattern_width = len(self.SUN_PATTERN[0])
+        sun_radius = (pattern_width * pixel_size) // 2
+
+        # Rays first (behind the sun)
+        num_rays = 12
+        max_ray_length = sun_radius * 0.5
+        ray_width_base = 3
+        ray_colors = [(255, 247, 184), (255, 222, 123)]
+        for i in range(num_rays):
+            angle = (i * (360 / num_rays) + phase * self.SPIN_CYCLES * 360 / num_rays) % 360
+            ray_length = max_ray_length * (0.7 + 0.3 * math.sin(turn * self.PULSE_CYCLES + i * 0.5))
+            wobble = math.sin(turn * self.WOBBLE_CYCLES + i * 0.5) * 0.5
+            end_x = x + math.cos(math.radians(angle)) * (sun_radius + ray_length)
+            end_y = y + math.sin(math.radians(angle)) * (sun_radius + ray_length)
+            offset_x = math.cos(math.radians(angle + 90)) * wobble
+            offset_y = math.sin(math.radians(angle + 90)) * wobble
+
+            points = []
+            for t in range(8):
+                progress = t / 7
+                points.append((x + (end_x - x) * progress + offset_x,
+                               y + (end_y - y) * progress + offset_y))
+                # The screen has no per-pixel alpha, so rays were always drawn opaque
+                color = ray_colors[0] if t < 4 else ray_colors[1]
+                if len(points) > 1:
+                    pygame.draw.line(surface, color, points[-2], points[-1],
+                                     max(1, int(ray_width_base * (1 - progress * 0.5))))
+
+        # Pixelated disc over the rays, shimmering with noise that wraps each loop
+        rows = len(self.SUN_PATTERN)
+        for row_idx, row in enumerate(self.SUN_PATTERN):
+            for col_idx, cell in enumerate(row):
+                if cell != 'X':
+                    continue
+                pixel_x = x - (len(row) * pixel_size // 2) + col_idx * pixel_size
+                pixel_y = y - (rows * pixel_size // 2) + row_idx * pixel_size
+                noise_val = noise.pnoise2(col_idx * 0.5 + phase * self.NOISE_DRIFT,
+                                          row_idx * 0.5,
+                                          octaves=2,
+                                          persistence=0.5,
+                                          repeatx=self.NOISE_DRIFT)
+                dist_from_center = math.sqrt((row_idx - rows // 2) ** 2 +
+                                             (col_idx - len(row) // 2) ** 2)
+                color = self.SUN_COLORS[min(3, int(dist_from_center / 2))]
+                color = [min(255, max(0, c + int(noise_val * 15))) for c in color]
+                surface.fill(color, (pixel_x, pixel_y, pixel_size, pixel_size))
+        return surface
+
+    def draw_moon(self):
+        """Moon and glow, drawn opaque as they always appeared on screen"""
+        size = self.HALF_SIZE * 2 + 5
+        center = size // 2
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, VISUALS['TIME']['NIGHT']['MOON'], (center, center), 20)
+        for radius in range(30, 20, -2):
+            pygame.draw.circle(surface, VISUALS['TIME']['NIGHT']['MOON_GLOW'][:3],
+                               (center, center), radius)
+        return surface
+
+    def blit(self, screen, sprite, pos):
+        """Draw a sprite centered on pos"""
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(pos[0]) - half, int(pos[1]) - half))
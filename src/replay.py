@@ -0,0 +1,176 @@
+"""
+Recording and replaying player input
+
+Everything the simulation learns from the player comes through the
+Game's input source: the length of each frame, the events of that frame
+and the cursor position ants flee from. LiveInput reads them from
+pygame, InputRecorder does the same while logging them, and InputReplay
+feeds a recording back without waiting between frames. Together with the
+recorded seed, that reproduces the session's simulation exactly, so a
+real 30-minute session can be replayed in seconds and its frame times
+compared between builds (see benchmarks/bench_replay.py).
+
+A recording is a compressed NumPy .npz archive with one row per frame
+(frame length and cursor position), one row per event and a small JSON
+header. Recording starts once the intro is over; a replay starts its
+game straight in the running state.
+
+Usage:
+    game.input = InputRecorder(game)
+    game.run()
+    game.input.save('session.rec')
+
+    replay = InputReplay.load('session.rec')
+    game = Game(seed=replay.seed, swarm=replay.swarm, world_size=replay.world)
+    game.input = replay
+    game.intro_state = 'game_running'
+    game.run()
+"""
+
+import json
+import os
+import time
+import numpy as np
+import pygame
+from constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT
+
+FORMAT = 'muchas-cacas-replay'
+FORMAT_VERSION = 1
+
+FRAME_DTYPE = np.dtype([('frame_ms', '<f4'), ('x', '<i2'), ('y', '<i2')])
+EVENT_DTYPE = np.dtype([('frame', '<u4'), ('type', '<u4'), ('x', '<i2'), ('y', '<i2'),
+                        ('code', '<i4')])
+
+# Events the game reacts to, and the attribute kept as each one's code
+RECORDED_EVENTS = {
+    pygame.QUIT: None,
+    pygame.KEYDOWN: 'key',
+    pygame.KEYUP: 'key',
+    pygame.MOUSEBUTTONDOWN: 'button',
+    pygame.MOUSEBUTTONUP: 'button',
+    pygame.MOUSEMOTION: None
+}
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+class LiveInput:
+    """Frame timing, events and cursor straight from pygame"""
+    def tick(self, frame_clock):
+        """Wait for the next frame and return its length in milliseconds"""
+        return frame_clock.tick(FPS)
+
+    def events(self):
+        return pygame.event.get()
+
+    def cursor_pos(self):
+        return pygame.mouse.get_pos()
+
+class InputRecorder(LiveInput):
+    """LiveInput that logs every running frame for a later replay
+
+    The cursor only moves when events are pumped, so sampling it once
+    after each frame's events captures what every later call that frame
+    sees.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.frame_ms = 0.0
+        self.frames = []
+        self.recorded = []
+
+    def tick(self, frame_clock):
+        self.frame_ms = super().tick(frame_clock)
+        return self.frame_ms
+
+    def events(self):
+        events = super().events()
+        if self.game.intro_state != 'game_running':
+            return events
+        frame = len(self.frames)
+        x, y = pygame.mouse.get_pos()
+        self.frames.append((self.frame_ms, x, y))
+        for event in events:
+            if event.type not in RECORDED_EVENTS:
+                continue
+            code = RECORDED_EVENTS[event.type]
+            x, y = event.pos if event.type in MOUSE_EVENTS else (0, 0)
+            self.recorded.append((frame, event.type, x, y, getattr(event, code) if code else 0))
+        return events
+
+    def save(self, path):
+        """Write the recording, replacing path only once it is complete"""
+        meta = {
+            'format': FORMAT,
+            'version': FORMAT_VERSION,
+            'seed': self.game.rng.seed,
+            'swarm': self.game.swarm,
+            'world': [self.game.width, self.game.height],
+            'tick_ms': self.game.tick_ms,
+            'recorded_at': time.time()
+        }
+        document = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+        temporary = f"{path}.tmp"
+        with open(temporary, 'wb') as f:
+            np.savez_compressed(f, meta=document,
+                                frames=np.array(self.frames, dtype=FRAME_DTYPE),
+                                events=np.array(self.recorded, dtype=EVENT_DTYPE))
+        os.replace(temporary, path)
+
+class InputReplay:
+    """Input source playing a recording back as fast as the game runs
+
+    Once the recording runs out it sends a QUIT event, so Game.run()
+    returns.
+    """
+    def __init__(self, meta, frames, events):
+        self.seed = meta['seed']
+        self.swarm = meta['swarm']
+        self.world = tuple(meta.get('world', (WINDOW_WIDTH, WINDOW_HEIGHT)))  # Older recordings
+        self.tick_ms = meta['tick_ms']
+        self.frame_ms = frames['frame_ms'].tolist()
+        self.cursors = list(zip(frames['x'].tolist(), frames['y'].tolist()))
+        self.frame = -1
+        self.cursor = (0, 0)
+
+        # Events grouped by frame; most frames have none
+        self.events_by_frame = {}
+        for frame, kind, x, y, code in events.tolist():
+            attributes = {'pos': (x, y)} if kind in MOUSE_EVENTS else {}
+            if RECORDED_EVENTS.get(kind):
+                attributes[RECORDED_EVENTS[kind]] = code
+            self.events_by_frame.setdefault(frame, []).append(pygame.event.Event(kind, attributes))
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording written by InputRecorder.save()"""
+        with np.load(path) as data:
+            meta = json.loads(data['meta'].tobytes())
+            if meta.get('format') != FORMAT:
+                raise ValueError(f"{path} is not an input recording")
+            if meta.get('version') != FORMAT_VERSION:
+                raise ValueError(f"Unsupported recording version {meta.get('version')} "
+                                 f"(expected {FORMAT_VERSION})")
+            return cls(meta, data['frames'], data['events'])
+
+    def __len__(self):
+        return len(self.frame_ms)
+
+    @property
+    def duration_ms(self):
+        return sum(self.frame_ms)
+
+    def tick(self, frame_clock):
+        """Length of the next recorded frame, without waiting for it"""
+        self.frame += 1
+        if self.frame >= len(self.frame_ms):
+            return 0
+        return self.frame_ms[self.frame]
+
+    def events(self):
+        pygame.event.clear()  # Live input is ignored, but keep the window responsive
+        if self.frame >= len(self.frame_ms):
+            return [pygame.event.Event(pygame.QUIT)]
+        self.cursor = self.cursors[self.frame]
+        return self.events_by_frame.get(self.frame, [])
+
+    def cursor_pos(self):
+        return self.cursor
@@ -1,22 +1,60 @@
 import pygame
 import math
 import random
+from functools import lru_cache
+from sprites import PixelArt, get_sprite
+
+# Canonical copies of pixel entries; resources draw from a handful of
+# positions and colors, so every instance can share the same tuples
+_SHARED_PIXELS = {}
+
+def shared(entry):
+    """Canonical copy of an immutable pixel entry"""
+    return _SHARED_PIXELS.setdefault(entry, entry)
+
+def layer(pixels, part):
+    """Pixels of one part as PixelArt for the sprite atlas"""
+    return PixelArt(tuple(shared((pos, color)) for pos, color, kind in pixels if kind == part))
+
+@lru_cache(maxsize=256)
+def red_tint(art):
+    """Layer with a bit of red mixed in, shown while a spider hides inside"""
+    return PixelArt(tuple(shared(((x, y), (min(color[0] + 20, 255), color[1], color[2])))
+                          for (x, y), color in art.pixels))
 
 class GameObject:
+    __slots__ = ('position', 'size', 'color')
+
     def __init__(self, position, size, color):
         self.position = position
         self.size = size
         self.color = color
 
-    def draw(self, surface):
+    def draw(self, surface, origin=(0, 0)):
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
         pygame.draw.rect(surface, self.color, pygame.Rect(
-            self.position[0] - self.size // 2,
-            self.position[1] - self.size // 2,
+            screen_x - self.size // 2,
+            screen_y - self.size // 2,
             self.size,
             self.size
         ))
 
+    def art_bounds(self, current_size, pixel_size, columns, rows, sway=0, indicator=False):
+        """Screen area of pixel art drawn the way the resources draw it
+
+        Includes the sway margin and, if shown, the resource indicator bar.
+        """
+        left = self.position[0] - (current_size // 2) - sway - 1
+        top = self.position[1] - (current_size // 2) - sway - 1
+        art = pygame.Rect(left, top, columns * pixel_size + 2 * sway + 3,
+                          rows * pixel_size + 2 * sway + 3)
+        if indicator:
+            art.union_ip((self.position[0] - 11, self.position[1] + 14, 22, 11))
+        return art
+
 class Rock(GameObject):
+    __slots__ = ('minerals', 'original_size', 'shape', 'pixels', 'body_pixels', 'shine_offset')
+
     # Rock colors
     ROCK_COLORS = {
         'base': [(139, 137, 137), (145, 142, 142), (131, 129, 129)],  # Gray variations
@@ -53,16 +91,17 @@ class Rock(GameObject):
          " XXX "],
     ]
 
-    def __init__(self, position):
+    def __init__(self, position, rng=random):
         super().__init__(position, 20, (139, 69, 19))
         self.minerals = 50
         self.original_size = 40
         self.size = self.original_size
-        self.shape = random.choice(self.ROCK_SHAPES)
-        self.pixels = self.generate_rock_pixels()
-        self.shine_offset = random.random() * 6.28  # Random start phase for shimmer
+        self.shape = rng.choice(self.ROCK_SHAPES)
+        self.pixels = self.generate_rock_pixels(rng)
+        self.body_pixels = layer(self.pixels, 'rock')
+        self.shine_offset = rng.random() * 6.28  # Random start phase for shimmer
 
-    def generate_rock_pixels(self):
+    def generate_rock_pixels(self, rng=random):
         """Generate pixel art for rock"""
         pixels = []
         
@@ -71,19 +110,26 @@ class Rock(GameObject):
             for x, char in enumerate(row):
                 if char == 'X':
                     # Randomly choose between base and dark colors for variety
-                    color = random.choice(self.ROCK_COLORS['base'] if random.random() > 0.3 
+                    color = rng.choice(self.ROCK_COLORS['base'] if rng.random() > 0.3 
                                         else self.ROCK_COLORS['dark'])
-                    pixels.append(((x, y), color, 'rock'))
+                    pixels.append(shared(((x, y), color, 'rock')))
                 elif char == 'S':
                     # Mark shine position
-                    pixels.append(((x, y), random.choice(self.ROCK_COLORS['shine']), 'shine'))
+                    pixels.append(shared(((x, y), rng.choice(self.ROCK_COLORS['shine']), 'shine')))
         
         return pixels
 
-    def draw(self, surface, alpha=255):
+    def bounds(self):
+        scale = max(self.minerals, 0) / 50
+        return self.art_bounds(int(self.original_size * scale), max(3, int(5 * scale)),
+                               len(self.shape[0]), len(self.shape), indicator=self.minerals < 50)
+
+    def draw(self, surface, alpha=255, origin=(0, 0)):
         if self.minerals <= 0:
             return
 
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
+
         # Calculate size scale based on remaining minerals
         scale = self.minerals / 50
         current_size = int(self.original_size * scale)
@@ -93,7 +139,11 @@ class Rock(GameObject):
         time = pygame.time.get_ticks() / 1000
         shine_intensity = (math.sin(time * 2 + self.shine_offset) + 1) / 2  # 0 to 1
 
-        # Draw each pixel of the rock
+        # Draw the rock body in one blit, then the animated shine pixel
+        left = screen_x - (current_size // 2)
+        top = screen_y - (current_size // 2)
+        surface.blit(get_sprite('rock', self.body_pixels, pixel_size, alpha), (left, top))
+
         for (x, y), color, part in self.pixels:
             if part == 'shine':
                 # Interpolate between rock color and shine color based on intensity
@@ -103,18 +153,15 @@ class Rock(GameObject):
                     int(base_color[i] + (shine_color[i] - base_color[i]) * shine_intensity)
                     for i in range(3)
                 ]
-            else:
-                current_color = color
+                current_color = (*current_color, alpha)  # Add alpha to color tuple
 
-            current_color = (*current_color, alpha)  # Add alpha to color tuple
-
-            pixel_rect = pygame.Rect(
-                self.position[0] + (x * pixel_size) - (current_size // 2),
-                self.position[1] + (y * pixel_size) - (current_size // 2),
-                pixel_size,
-                pixel_size
-            )
-            pygame.draw.rect(surface, current_color, pixel_rect)
+                pixel_rect = pygame.Rect(
+                    left + (x * pixel_size),
+                    top + (y * pixel_size),
+                    pixel_size,
+                    pixel_size
+                )
+                pygame.draw.rect(surface, current_color, pixel_rect)
 
         # Draw mineral indicator with alpha
         if self.minerals < 50:
@@ -122,35 +169,41 @@ class Rock(GameObject):
             indicator_fg = (*((139, 69, 19)), alpha)    # Brown with alpha
             
             pygame.draw.rect(surface, indicator_bg,
-                           (self.position[0] - 10, self.position[1] + 20,
+                           (screen_x - 10, screen_y + 20,
                             20, 4))
             pygame.draw.rect(surface, indicator_fg,
-                           (self.position[0] - 10, self.position[1] + 20,
+                           (screen_x - 10, screen_y + 20,
                             int(20 * (self.minerals / 50)), 4))
 
 class Plant(GameObject):
+    __slots__ = ('game', 'resources', 'original_size', 'sway_offset', 'pixels', 'leaf_pixels',
+                 'trunk_pixels', 'has_spider', 'is_growing', 'growth_start', 'growth_scale')
+
+    growth_duration = 1000  # 1 second to grow
     # Pine tree colors
     TREE_COLORS = {
         'leaves': [(34, 139, 34), (46, 139, 34), (40, 180, 40)],  # Different green shades
         'trunk': [(139, 69, 19), (160, 82, 45)]  # Brown shades
     }
     
-    def __init__(self, position):
+    def __init__(self, position, game, rng=random):
         super().__init__(position, 10, (0, 255, 0))
+        self.game = game
         self.resources = 30
         self.original_size = 120
         self.size = 0  # Start at size 0
-        self.sway_offset = random.random() * 6.28
-        self.pixels = self.generate_pine_pixels()
+        self.sway_offset = rng.random() * 6.28
+        self.pixels = self.generate_pine_pixels(rng)
+        self.leaf_pixels = layer(self.pixels, 'leaf')
+        self.trunk_pixels = layer(self.pixels, 'trunk')
         self.has_spider = False  # Add this to track if a spider is hiding here
         
         # Growth animation properties
         self.is_growing = True
-        self.growth_start = pygame.time.get_ticks()
-        self.growth_duration = 1000  # 1 second to grow
+        self.growth_start = game.clock.get_ticks()  # Simulated ms
         self.growth_scale = 0.0  # Start at 0%
 
-    def generate_pine_pixels(self):
+    def generate_pine_pixels(self, rng=random):
         """Generate pixel art for pine tree"""
         # Taller pine tree layout (8x12 pixels scaled up)
         pine_layout = [
@@ -175,17 +228,17 @@ class Plant(GameObject):
         for y, row in enumerate(pine_layout):
             for x, char in enumerate(row):
                 if char == 'X':
-                    color = random.choice(self.TREE_COLORS['leaves'])
-                    pixels.append(((x, y), color, 'leaf'))
+                    color = rng.choice(self.TREE_COLORS['leaves'])
+                    pixels.append(shared(((x, y), color, 'leaf')))
                 elif char == '|':
-                    color = random.choice(self.TREE_COLORS['trunk'])
-                    pixels.append(((x, y), color, 'trunk'))
+                    color = rng.choice(self.TREE_COLORS['trunk'])
+                    pixels.append(shared(((x, y), color, 'trunk')))
         
         return pixels
 
     def update(self):
         if self.is_growing:
-            current_time = pygame.time.get_ticks()
+            current_time = self.game.clock.get_ticks()
             elapsed = current_time - self.growth_start
             
             if elapsed < self.growth_duration:
@@ -207,12 +260,23 @@ class Plant(GameObject):
         else:
             return pow(2, -10 * x) * math.sin((x * 10 - 0.75) * c4) + 1
 
-    def draw(self, surface, alpha=255):
+    def bounds(self):
+        scale = self.growth_scale * max(self.resources, 0) / 30
+        rect = self.art_bounds(int(self.original_size * scale), max(2, int(4 * scale)),
+                               8, 12, sway=2 * self.growth_scale,
+                               indicator=not self.is_growing and self.resources < 30)
+        if self.is_growing:
+            # The tree grows out of its anchor and the elastic easing
+            # overshoots to about 1.35x, so cover the whole sweep
+            rect.union_ip(self.art_bounds(int(self.original_size * 1.4), 5, 8, 12, sway=3))
+            rect.union_ip((self.position[0] - 1, self.position[1] - 1, 2, 2))
+        return rect
+
+    def draw(self, surface, alpha=255, origin=(0, 0)):
         if self.resources <= 0:
             return
 
-        # Update growth animation
-        self.update()
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
 
         # Calculate current size based on growth animation
         current_size = int(self.original_size * self.growth_scale * (self.resources / 30))
@@ -222,21 +286,17 @@ class Plant(GameObject):
         time = pygame.time.get_ticks() / 1000
         sway = math.sin(time + self.sway_offset) * 2 * self.growth_scale  # Sway increases with growth
 
-        # Draw each pixel of the tree
-        for (x, y), color, part in self.pixels:
-            # Apply sway only to leaves, not trunk
-            sway_offset = sway if part == 'leaf' else 0
-            
-            # Add alpha to color
-            current_color = (*color, alpha)
-            
-            pixel_rect = pygame.Rect(
-                self.position[0] + (x * pixel_size) - (current_size // 2) + sway_offset,
-                self.position[1] + (y * pixel_size) - (current_size // 2),
-                pixel_size,
-                pixel_size
-            )
-            pygame.draw.rect(surface, current_color, pixel_rect)
+        # Draw the tree as two cached layers, swaying only the leaves
+        # (leaves carry a red tint if a spider is hiding here)
+        left = screen_x - (current_size // 2)
+        top = screen_y - (current_size // 2)
+        if self.has_spider:
+            # Slight red tint on the leaves while a spider hides here
+            leaves = get_sprite('spider-leaf', red_tint(self.leaf_pixels), pixel_size, alpha)
+        else:
+            leaves = get_sprite('leaf', self.leaf_pixels, pixel_size, alpha)
+        surface.blit(leaves, (left + sway, top))
+        surface.blit(get_sprite('trunk', self.trunk_pixels, pixel_size, alpha), (left, top))
 
         # Draw resource indicator with alpha (only when fully grown)
         if not self.is_growing and self.resources < 30:
@@ -244,29 +304,16 @@ class Plant(GameObject):
             indicator_fg = (*(0, 255, 0), alpha)
             
             pygame.draw.rect(surface, indicator_bg,
-                           (self.position[0] - 10, self.position[1] + 20,
+                           (screen_x - 10, screen_y + 20,
                             20, 4))
             pygame.draw.rect(surface, indicator_fg,
-                           (self.position[0] - 10, self.position[1] + 20,
+                           (screen_x - 10, screen_y + 20,
                             int(20 * (self.resources / 30)), 4))
 
-        # If a spider is hiding here, add subtle visual cue
-        if self.has_spider:
-            # Add slight red tint to leaves
-            for (x, y), color, part in self.pixels:
-                if part == 'leaf':
-                    # Mix in a bit of red
-                    red_tint = (min(color[0] + 20, 255), color[1], color[2])
-                    current_color = (*red_tint, alpha)
-                    pixel_rect = pygame.Rect(
-                        self.position[0] + (x * pixel_size) - (current_size // 2),
-                        self.position[1] + (y * pixel_size) - (current_size // 2),
-                        pixel_size,
-                        pixel_size
-                    )
-                    pygame.draw.rect(surface, current_color, pixel_rect)
-
 class Bush(GameObject):
+    __slots__ = ('resources', 'original_size', 'sway_offset', 'has_berries', 'has_spider',
+                 'pixels', 'leaf_pixels', 'stem_pixels')
+
     # Bush colors
     BUSH_COLORS = {
         'leaves': [(0, 100, 0), (34, 139, 34), (0, 128, 0)],  # Darker green shades for bush
@@ -274,17 +321,19 @@ class Bush(GameObject):
         'stem': [(101, 67, 33), (139, 69, 19)]  # Dark brown shades
     }
     
-    def __init__(self, position):
+    def __init__(self, position, rng=random):
         super().__init__(position, 15, (0, 200, 0))
         self.resources = 10  # As per documentation
         self.original_size = 40  # Smaller than trees
         self.size = self.original_size
-        self.sway_offset = random.random() * 6.28
-        self.has_berries = random.random() > 0.5  # 50% chance of having berries
+        self.sway_offset = rng.random() * 6.28
+        self.has_berries = rng.random() > 0.5  # 50% chance of having berries
         self.has_spider = False  # Add this to track if a spider is hiding here
-        self.pixels = self.generate_bush_pixels()
+        self.pixels = self.generate_bush_pixels(rng)
+        self.leaf_pixels = layer(self.pixels, 'leaf')
+        self.stem_pixels = layer(self.pixels, 'stem')
 
-    def generate_bush_pixels(self):
+    def generate_bush_pixels(self, rng=random):
         """Generate pixel art for berry bush"""
         # Bush layout (6x6 pixels scaled up)
         bush_layout = [
@@ -307,21 +356,28 @@ class Bush(GameObject):
                 if char == 'X':
                     # Check if this position should be a berry
                     if (x, y) in berry_positions:
-                        color = random.choice(self.BUSH_COLORS['berries'])
-                        pixels.append(((x, y), color, 'berry'))
+                        color = rng.choice(self.BUSH_COLORS['berries'])
+                        pixels.append(shared(((x, y), color, 'berry')))
                     else:
-                        color = random.choice(self.BUSH_COLORS['leaves'])
-                        pixels.append(((x, y), color, 'leaf'))
+                        color = rng.choice(self.BUSH_COLORS['leaves'])
+                        pixels.append(shared(((x, y), color, 'leaf')))
                 elif char in ['/','\\','|']:
-                    color = random.choice(self.BUSH_COLORS['stem'])
-                    pixels.append(((x, y), color, 'stem'))
+                    color = rng.choice(self.BUSH_COLORS['stem'])
+                    pixels.append(shared(((x, y), color, 'stem')))
         
         return pixels
 
-    def draw(self, surface, alpha=255):
+    def bounds(self):
+        scale = max(self.resources, 0) / 10
+        return self.art_bounds(int(self.original_size * scale), max(2, int(4 * scale)),
+                               6, 6, sway=2.5, indicator=self.resources < 10)
+
+    def draw(self, surface, alpha=255, origin=(0, 0)):
         if self.resources <= 0:
             return
 
+        screen_x, screen_y = self.position[0] - origin[0], self.position[1] - origin[1]
+
         # Calculate size scale based on remaining resources
         scale = self.resources / 10
         current_size = int(self.original_size * scale)
@@ -331,26 +387,24 @@ class Bush(GameObject):
         time = pygame.time.get_ticks() / 1000
         sway = math.sin(time + self.sway_offset) * 1.5
 
-        # Draw each pixel of the bush
+        # Draw cached leaf and stem layers, swaying only the leaves
+        left = screen_x - (current_size // 2)
+        top = screen_y - (current_size // 2)
+        surface.blit(get_sprite('leaf', self.leaf_pixels, pixel_size, alpha), (left + sway, top))
+        surface.blit(get_sprite('stem', self.stem_pixels, pixel_size, alpha), (left, top))
+
+        # Berries sway with the leaves and each bounces on its own
         for (x, y), color, part in self.pixels:
-            # Apply sway only to leaves and berries, not stems
-            sway_offset = sway if part in ['leaf', 'berry'] else 0
-            
-            # Add subtle bounce to berries
-            berry_bounce = 0
             if part == 'berry':
                 berry_bounce = math.sin(time * 2 + x * 0.5) * 1
-            
-            # Add alpha to color
-            current_color = (*color, alpha)
-            
-            pixel_rect = pygame.Rect(
-                self.position[0] + (x * pixel_size) - (current_size // 2) + sway_offset,
-                self.position[1] + (y * pixel_size) - (current_size // 2) + berry_bounce,
-                pixel_size,
-                pixel_size
-            )
-            pygame.draw.rect(surface, current_color, pixel_rect)
+                current_color = (*color, alpha)
+                pixel_rect = pygame.Rect(
+                    left + (x * pixel_size) + sway,
+                    top + (y * pixel_size) + berry_bounce,
+                    pixel_size,
+                    pixel_size
+                )
+                pygame.draw.rect(surface, current_color, pixel_rect)
 
         # Draw resource indicator with alpha
         if self.resources < 10:
@@ -358,36 +412,8 @@ class Bush(GameObject):
             indicator_fg = (*(0, 255, 0), alpha)        # Green with alpha
             
             pygame.draw.rect(surface, indicator_bg,
-                           (self.position[0] - 10, self.position[1] + 15,
+                           (screen_x - 10, screen_y + 15,
                             20, 4))
             pygame.draw.rect(surface, indicator_fg,
-                           (self.position[0] - 10, self.position[1] + 15,
+                           (screen_x - 10, screen_y + 15,
                             int(20 * (self.resources / 10)), 4))
-
-        # If a spider is hiding here, add subtle visual cue
-        if self.has_spider:
-            # Add slight movement to indicate spider presence
-            sway_multiplier = 1.5 if self.has_spider else 1.0
-            sway = math.sin(time + self.sway_offset) * sway_multiplier
-            sway_offset = sway
-            
-            # Draw each pixel of the bush
-            for (x, y), color, part in self.pixels:
-                # Apply sway only to leaves and berries, not stems
-                sway_offset = sway if part in ['leaf', 'berry'] else 0
-                
-                # Add subtle bounce to berries
-                berry_bounce = 0
-                if part == 'berry':
-                    berry_bounce = math.sin(time * 2 + x * 0.5) * 1
-                
-                # Add alpha to color
-                current_color = (*color, alpha)
-                
-                pixel_rect = pygame.Rect(
-                    self.position[0] + (x * pixel_size) - (current_size // 2) + sway_offset,
-                    self.position[1] + (y * pixel_size) - (current_size // 2) + berry_bounce,
-                    pixel_size,
-                    pixel_size
-                )
-                pygame.draw.rect(surface, current_color, pixel_rect) 
\ No newline at end of file
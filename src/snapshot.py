@@ -0,0 +1,498 @@
+"""
+Saving and loading the complete game state
+
+A snapshot is an uncompressed NumPy .npz archive. Ants, which can number
+in the tens of thousands, are stored column by column in arrays; the
+rest (colonies, rocks, plants and bushes with their pixel art, the snake,
+spider, webs, clock, kill count, map size, camera position, ant scheduling
+phase and simulation random state) is a small JSON document stored in the
+same archive. Entities refer to each other by list index. The format name
+and FORMAT_VERSION are checked on load.
+
+Short-lived animation state (the snake's sleeping Zs, plant growth
+timing, HUD flashes) is not saved and restarts on load.
+
+Usage:
+    save_game(game, 'colony.sav')
+    load_game(game, 'colony.sav')
+
+    autosaver = Autosaver(game, 'colony.sav')
+    autosaver.start()
+    ...
+    autosaver.update()       # Once per frame; saves every AUTOSAVE_MS
+    autosaver.stop()         # Writes a final snapshot
+"""
+
+import gc
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from operator import attrgetter
+import numpy as np
+from entities import Colony, Ant, Snake, Spider, SpiderWeb
+from resources import Rock, Plant, Bush, shared, layer
+from swarm import AntSwarm, SwarmAnt, STATE_NAMES, STATE_CODES
+from constants import Simulation
+
+FORMAT = 'muchas-cacas-snapshot'
+FORMAT_VERSION = 1
+
+# Scalar attributes stored as-is for each kind of entity
+COLONY_FIELDS = ('is_main', 'ant_count', 'max_ants', 'spawn_timer', 'spawn_interval',
+                 'flash_timer', 'flash_interval', 'flash_state', 'animation_frame', 'light_phase')
+ROCK_FIELDS = ('size', 'minerals', 'original_size', 'shine_offset')
+PLANT_FIELDS = ('size', 'resources', 'original_size', 'sway_offset', 'has_spider',
+                'is_growing', 'growth_scale')
+BUSH_FIELDS = ('size', 'resources', 'original_size', 'sway_offset', 'has_berries', 'has_spider')
+SNAKE_FIELDS = ('size', 'length', 'speed', 'perception_radius', 'wave_offset',
+                'is_sleeping', 'z_spawn_interval')
+SPIDER_FIELDS = ('size', 'speed', 'state', 'death_animation_timer', 'death_blinks',
+                 'web_cooldown', 'web_chance', 'leg_animation_offset', 'flee_timer',
+                 'daylight_death_timer', 'edge_buffer')
+ANT_COLUMNS = ('speed', 'perception_radius', 'jump_height', 'jump_count',
+               'web_slow_timer', 'scuttle_offset')
+
+def _point(value):
+    return (value[0], value[1]) if value is not None else None
+
+def _fields(obj, names):
+    return {name: getattr(obj, name) for name in names}
+
+def _restore_fields(obj, values, names):
+    for name in names:
+        setattr(obj, name, values[name])
+
+def _pixels(pixels):
+    return [[list(position), list(color), kind] for position, color, kind in pixels]
+
+def _restore_pixels(entries):
+    return [shared(((x, y), tuple(color), kind)) for (x, y), color, kind in entries]
+
+@contextmanager
+def _paused_gc():
+    """Hold off cyclic garbage collection while building thousands of objects
+
+    Otherwise every few hundred allocations trigger a collection pass,
+    which costs more than creating the ants themselves.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+# Capturing (game thread)
+
+def capture(game):
+    """Copy the game state into (meta, arrays), ready to be written
+
+    Runs on the game thread and copies everything it returns, so the
+    result can be written from another thread while the game moves on.
+    """
+    with _paused_gc():
+        colony_index = {id(colony): i for i, colony in enumerate(game.colonies)}
+        resource_refs = {}
+        for kind, resources in enumerate((game.rocks, game.plants, game.bushes)):
+            for i, resource in enumerate(resources):
+                resource_refs[id(resource)] = (kind, i)
+
+        arrays = _capture_ants(game.ants, colony_index, resource_refs)
+        ant_index = {}
+        if any(web.ant_jump_timer for web in game.webs):
+            ant_index = {id(ant): i for i, ant in enumerate(game.ants)}
+
+        meta = {
+            'format': FORMAT,
+            'version': FORMAT_VERSION,
+            'saved_at': time.time(),  # Wall clock, for offline progress on load
+            'world': [game.width, game.height],
+            'camera': list(game.camera.origin),
+            'lod': _capture_lod(game.lod, game.ants),
+            'clock_ms': game.clock.elapsed,
+            'cycle_start_time': game.cycle_start_time,
+            'current_time_of_day': game.current_time_of_day,
+            'resource_spawn_timer': game.resource_spawn_timer,
+            'snake_sleep_position': _point(game.snake_sleep_position),
+            'kills': game.hud.kills,
+            'rng': game.rng.getstate(),
+            'music': _fields(game.game_state, ('intensity', 'danger_level', 'resource_abundance',
+                                               'time_of_day', 'current_mood')),
+            'colonies': [dict(_fields(colony, COLONY_FIELDS), position=_point(colony.position),
+                              resources=dict(colony.resources))
+                         for colony in game.colonies],
+            'rocks': [dict(_fields(rock, ROCK_FIELDS), position=_point(rock.position),
+                           shape=Rock.ROCK_SHAPES.index(rock.shape), pixels=_pixels(rock.pixels))
+                      for rock in game.rocks],
+            'plants': [dict(_fields(plant, PLANT_FIELDS), position=_point(plant.position),
+                            growth_start=plant.growth_start, pixels=_pixels(plant.pixels))
+                       for plant in game.plants],
+            'bushes': [dict(_fields(bush, BUSH_FIELDS), position=_point(bush.position),
+                            pixels=_pixels(bush.pixels))
+                       for bush in game.bushes],
+            'snake': _capture_snake(game.snake),
+            'spider': _capture_spider(game.spider, resource_refs),
+            'webs': [_capture_web(web, ant_index) for web in game.webs]
+        }
+        return meta, arrays
+
+def _capture_ants(ants, colony_index, resource_refs):
+    if isinstance(ants, AntSwarm):
+        n = ants.count
+        arrays = {f'ant_{name}': getattr(ants, name)[:n].copy() for name in ANT_COLUMNS}
+        arrays['ant_position'] = ants.position[:n].copy()
+        arrays['ant_direction'] = ants.direction[:n].copy()
+        arrays['ant_is_jumping'] = ants.is_jumping[:n].copy()
+        arrays['ant_carried'] = ants.carried[:n].copy()
+        arrays['ant_state'] = ants.state[:n].copy()
+        homes = ants.home_colonies
+        targets = ants.target_resources
+    else:
+        scalars = attrgetter(*ANT_COLUMNS)
+        columns = np.array([scalars(ant) for ant in ants], dtype=float).reshape(-1, len(ANT_COLUMNS))
+        arrays = {f'ant_{name}': columns[:, i].copy() for i, name in enumerate(ANT_COLUMNS)}
+        arrays['ant_position'] = np.array([ant.position for ant in ants], dtype=float).reshape(-1, 2)
+        arrays['ant_direction'] = np.array([ant.direction for ant in ants], dtype=float).reshape(-1, 2)
+        arrays['ant_is_jumping'] = np.array([ant.is_jumping for ant in ants], dtype=bool)
+        arrays['ant_carried'] = np.array([(resources['minerals'], resources['plants'])
+                                          for resources in map(attrgetter('resources'), ants)],
+                                         dtype=np.int64).reshape(-1, 2)
+        arrays['ant_state'] = np.array([STATE_CODES[ant.state] for ant in ants], dtype=np.int8)
+        homes = [ant.home_colony for ant in ants]
+        targets = [ant.target_resource for ant in ants]
+
+    # None (and anything no longer in the game) is stored as -1
+    arrays['ant_home'] = np.array([colony_index.get(id(colony), -1) for colony in homes],
+                                  dtype=np.int32)
+    arrays['ant_target'] = np.array([resource_refs.get(id(resource), (-1, -1)) for resource in targets],
+                                    dtype=np.int32).reshape(-1, 2)
+    return arrays
+
+def _capture_snake(snake):
+    return dict(_fields(snake, SNAKE_FIELDS),
+                position=_point(snake.position),
+                direction=[float(d) for d in snake.direction],
+                body=[_point(p) for p in snake.body],
+                sleep_center=_point(snake.sleep_center),
+                sleep_coil=[_point(p) for p in snake.sleep_coil])
+
+def _capture_spider(spider, resource_refs):
+    if spider is None:
+        return None
+    home = resource_refs.get(id(spider.home_plant)) if spider.home_plant is not None else None
+    return dict(_fields(spider, SPIDER_FIELDS),
+                position=_point(spider.position),
+                flee_direction=[float(d) for d in spider.flee_direction],
+                home_plant=home)
+
+def _capture_web(web, ant_index):
+    return {
+        'position': _point(web.position),
+        'destroyed': web.destroyed,
+        'wave_offset': web.wave_offset,
+        'affected_ants': [ant_index[id(ant)] for ant in web.affected_ants if id(ant) in ant_index],
+        'ant_jump_timer': [[ant_index[id(ant)], timer] for ant, timer in web.ant_jump_timer.items()
+                           if id(ant) in ant_index]
+    }
+
+def _capture_lod(scheduler, ants):
+    if scheduler is None:
+        return None
+    changed = scheduler.changed
+    return {
+        'phase': scheduler.phase,
+        'changed': [i for i, ant in enumerate(ants) if ant in changed] if changed else []
+    }
+
+# Writing and reading (any thread)
+
+def write_snapshot(path, meta, arrays):
+    """Write a captured snapshot, replacing path only once it is complete"""
+    # NumPy scalars can end up in entity state; store them as plain numbers
+    text = json.dumps(meta, default=lambda value: value.item())
+    document = np.frombuffer(text.encode(), dtype=np.uint8)
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        np.savez(f, meta=document, **arrays)
+    os.replace(temporary, path)
+
+def read_snapshot(path):
+    """Read (meta, arrays) from a snapshot file, checking its format"""
+    with np.load(path) as data:
+        meta = json.loads(data['meta'].tobytes())
+        if meta.get('format') != FORMAT:
+            raise ValueError(f"{path} is not a game snapshot")
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {meta.get('version')} "
+                             f"(expected {FORMAT_VERSION})")
+        arrays = {name: data[name] for name in data.files if name != 'meta'}
+    return meta, arrays
+
+def save_game(game, path):
+    """Write the full game state to path"""
+    write_snapshot(path, *capture(game))
+
+# Restoring (game thread)
+
+def load_game(game, path):
+    """Replace the state of an existing Game with the snapshot at path
+
+    The game keeps its display, sounds and settings; only the simulation
+    state is swapped out. Returns the snapshot's metadata (its 'saved_at'
+    wall-clock time tells how long the player was away).
+    """
+    meta, arrays = read_snapshot(path)
+    restore(game, meta, arrays)
+    return meta
+
+def restore(game, meta, arrays):
+    """Rebuild every entity from a snapshot and re-index them
+
+    Everything is read and built before the game is touched, so a
+    snapshot that fails to load leaves the game as it was.
+    """
+    world = tuple(meta.get('world', (game.width, game.height)))
+    if world != (game.width, game.height):
+        raise ValueError(f"Snapshot is of a {world[0]}x{world[1]} map, "
+                         f"but the game is {game.width}x{game.height}")
+    clock_ms = meta['clock_ms']
+    cycle_start_time = meta['cycle_start_time']
+    current_time_of_day = meta['current_time_of_day']
+    resource_spawn_timer = meta['resource_spawn_timer']
+    snake_sleep_position = _point(meta['snake_sleep_position'])
+    kills = meta['kills']
+    music = dict(meta['music'])
+    camera = meta.get('camera')
+
+    with _paused_gc():
+        colonies = [_restore_colony(values, game) for values in meta['colonies']]
+        rocks = [_restore_rock(values) for values in meta['rocks']]
+        plants = [_restore_plant(values, game, clock_ms) for values in meta['plants']]
+        bushes = [_restore_bush(values) for values in meta['bushes']]
+        resources = (rocks, plants, bushes)
+
+        ants = _restore_ants(game, arrays, colonies, resources)
+        ant_list = list(ants)
+
+        snake = _restore_snake(meta['snake'], game)
+        spider = _restore_spider(meta['spider'], game, resources)
+        webs = [_restore_web(values, game, ant_list) for values in meta['webs']]
+        lod = _restore_lod(meta.get('lod'), ant_list) if game.lod else None
+
+        # Nothing below can fail on a bad snapshot; rng.setstate changes
+        # nothing if it raises
+        if 'rng' in meta:
+            game.rng.setstate(meta['rng'])
+        game.clock.elapsed = clock_ms
+        game.cycle_start_time = cycle_start_time
+        game.current_time_of_day = current_time_of_day
+        game.resource_spawn_timer = resource_spawn_timer
+        game.snake_sleep_position = snake_sleep_position
+        game.hud.kills = kills
+        for name, value in music.items():
+            setattr(game.game_state, name, value)
+        game.placing_colony = False
+        game.colonies, game.rocks, game.plants, game.bushes = colonies, rocks, plants, bushes
+        game.ants = ants
+        game.snake, game.spider, game.webs = snake, spider, webs
+        if game.lod:
+            game.lod.phase, game.lod.changed = lod
+
+        # Every entity is new, so rebuild the indexes instead of diffing them
+        positions = ants.position[:ants.count] if isinstance(ants, AntSwarm) else None
+        game.ant_grid.rebuild(ants, positions)
+        game.resource_grid.rebuild(rocks + plants + bushes)
+        game.colony_grid.rebuild(colonies)
+    if camera is not None and game.camera.move_to(*camera) and not game.headless:
+        game.view_moved()
+    if not game.headless:
+        game.full_redraw = True
+
+def _restore_colony(values, game):
+    colony = Colony.__new__(Colony)
+    _restore_fields(colony, values, COLONY_FIELDS)
+    colony.position = _point(values['position'])
+    colony.resources = dict(values['resources'])
+    colony.game = game
+    colony.ant_indicator_rect = None
+    colony.colony_indicator_rect = None
+    return colony
+
+def _restore_rock(values):
+    rock = Rock.__new__(Rock)
+    _restore_fields(rock, values, ROCK_FIELDS)
+    rock.position = _point(values['position'])
+    rock.color = (139, 69, 19)
+    rock.shape = Rock.ROCK_SHAPES[values['shape']]
+    rock.pixels = _restore_pixels(values['pixels'])
+    rock.body_pixels = layer(rock.pixels, 'rock')
+    return rock
+
+def _restore_plant(values, game, clock_ms):
+    plant = Plant.__new__(Plant)
+    _restore_fields(plant, values, PLANT_FIELDS)
+    plant.position = _point(values['position'])
+    plant.color = (0, 255, 0)
+    plant.pixels = _restore_pixels(values['pixels'])
+    plant.leaf_pixels = layer(plant.pixels, 'leaf')
+    plant.trunk_pixels = layer(plant.pixels, 'trunk')
+    plant.game = game
+    # Simulated ms; older saves did not keep it, so their trees restart the animation
+    plant.growth_start = values.get('growth_start', clock_ms)
+    return plant
+
+def _restore_bush(values):
+    bush = Bush.__new__(Bush)
+    _restore_fields(bush, values, BUSH_FIELDS)
+    bush.position = _point(values['position'])
+    bush.color = (0, 200, 0)
+    bush.pixels = _restore_pixels(values['pixels'])
+    bush.leaf_pixels = layer(bush.pixels, 'leaf')
+    bush.stem_pixels = layer(bush.pixels, 'stem')
+    return bush
+
+def _restore_ants(game, arrays, colonies, resources):
+    n = len(arrays['ant_state'])
+    homes = [colonies[i] if i >= 0 else None for i in arrays['ant_home'].tolist()]
+    targets = [resources[kind][i] if kind >= 0 else None
+               for kind, i in arrays['ant_target'].tolist()]
+
+    if game.swarm:
+        swarm = AntSwarm(game, capacity=max(64, n))
+        for name in ANT_COLUMNS + ('position', 'direction', 'is_jumping', 'carried', 'state'):
+            getattr(swarm, name)[:n] = arrays[f'ant_{name}']
+        swarm.carry_capacity[:n] = Ant.carry_capacity
+        for row, colony in enumerate(homes):
+            if colony is not None:
+                swarm.home_position[row] = colony.position
+        swarm.count = n
+        swarm.home_colonies = homes
+        swarm.target_resources = targets
+        for row in range(n):
+            view = SwarmAnt(game)
+            view.swarm = swarm
+            view.row = row
+            swarm.views.append(view)
+        return swarm
+
+    rows = zip(*(arrays[f'ant_{name}'].tolist() for name in ANT_COLUMNS),
+               map(tuple, arrays['ant_position'].tolist()),
+               arrays['ant_direction'].tolist(),
+               arrays['ant_is_jumping'].tolist(),
+               arrays['ant_carried'].tolist(),
+               arrays['ant_state'].tolist(),
+               homes, targets)
+    ants = []
+    for (speed, perception_radius, jump_height, jump_count, web_slow_timer, scuttle_offset,
+         position, direction, is_jumping, (minerals, plants), state, home, target) in rows:
+        ant = Ant.__new__(Ant)
+        ant.speed = speed
+        ant.perception_radius = perception_radius
+        ant.jump_height = jump_height
+        ant.jump_count = jump_count
+        ant.web_slow_timer = web_slow_timer
+        ant.scuttle_offset = scuttle_offset
+        ant.position = position
+        ant.direction = direction
+        ant.is_jumping = is_jumping
+        ant.resources = {'minerals': minerals, 'plants': plants}
+        ant.state = STATE_NAMES[state]
+        ant.home_colony = home
+        ant.target_resource = target
+        ant.game = game
+        ants.append(ant)
+    return ants
+
+def _restore_snake(values, game):
+    snake = Snake.__new__(Snake)
+    _restore_fields(snake, values, SNAKE_FIELDS)
+    snake.position = _point(values['position'])
+    snake.direction = list(values['direction'])
+    snake.body = [_point(p) for p in values['body']]
+    snake.sleep_center = _point(values['sleep_center'])
+    snake.sleep_coil = [_point(p) for p in values['sleep_coil']]
+    snake.sleep_zs = []
+    snake.z_spawn_timer = 0
+    snake.game = game
+    return snake
+
+def _restore_spider(values, game, resources):
+    if values is None:
+        return None
+    spider = Spider(_point(values['position']), game)
+    _restore_fields(spider, values, SPIDER_FIELDS)
+    spider.flee_direction = list(values['flee_direction'])
+    home = values['home_plant']
+    spider.home_plant = resources[home[0]][home[1]] if home is not None else None
+    return spider
+
+def _restore_web(values, game, ants):
+    web = SpiderWeb.__new__(SpiderWeb)
+    web.position = _point(values['position'])
+    web.game = game
+    web.destroyed = values['destroyed']
+    web.wave_offset = values['wave_offset']
+    web.affected_ants = {ants[i] for i in values['affected_ants']}
+    web.ant_jump_timer = {ants[i]: timer for i, timer in values['ant_jump_timer']}
+    return web
+
+def _restore_lod(values, ants):
+    """(phase, changed) for the ant scheduler"""
+    if values is None:  # Saved with the scheduler off
+        return 0, set()
+    return values['phase'], {ants[i] for i in values['changed']}
+
+class Autosaver(threading.Thread):
+    """Daemon thread that writes snapshots off the game loop
+
+    The game thread only captures the state (array copies and a small
+    dict) and hands it over; encoding and writing to disk happen here,
+    so a slow disk never stalls a frame. Only the newest pending
+    snapshot is kept.
+    """
+    def __init__(self, game, path, interval_ms=Simulation.AUTOSAVE_MS):
+        super().__init__(name="Autosaver", daemon=True)
+        self.game = game
+        self.path = path
+        self.interval_ms = interval_ms
+        self.last_save = game.clock.get_ticks()
+        # deque append and popleft are atomic, so the handoff needs no lock
+        self.pending = deque(maxlen=1)
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+
+    def update(self):
+        """Capture a snapshot if the autosave interval has passed"""
+        if self.game.clock.get_ticks() - self.last_save >= self.interval_ms:
+            self.request()
+
+    def request(self):
+        """Capture the game now and write it in the background"""
+        self.last_save = self.game.clock.get_ticks()
+        self.pending.append(capture(self.game))
+        self.wakeup.set()
+
+    def run(self):
+        while True:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            while self.pending:
+                meta, arrays = self.pending.popleft()
+                try:
+                    write_snapshot(self.path, meta, arrays)
+                except OSError as e:
+                    print(f"Error autosaving game: {e}")
+            if self.stopping.is_set():
+                return
+
+    def stop(self, save=True):
+        """Write a final snapshot (unless save is False) and wait for the thread"""
+        if save:
+            self.request()
+        self.stopping.set()
+        self.wakeup.set()
+        self.join(timeout=5.0)
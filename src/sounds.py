@@ -11,6 +11,7 @@ The system uses pygame's audio mixer and numpy for sound synthesis.
 
 Key Components:
 - GameSounds: Main sound manager handling all audio playback
+- MusicProducer: Background thread that synthesizes music segments
 - MusicGenerator: Procedural music generation with dynamic moods
 - Sound synthesis utilities for creating game sound effects
 
@@ -18,7 +19,6 @@ Requirements:
 - pygame
 - numpy
 - math
-- random
 
 Author: Guillermo
 License: MIT
@@ -27,27 +27,57 @@ License: MIT
 import pygame
 import numpy as np
 import pygame.sndarray
-import random
 import signal
 import math
+import hashlib
+import threading
+from collections import OrderedDict, deque, namedtuple
 from constants import *
 from state import GameState
+from utils import cache_path
+from rng import RandomStreams
 
-# Initialize pygame mixer
-pygame.mixer.init(44100, -16, 2, 512)
+# Mixer settings, applied when GameSounds opens the mixer
+MIXER_FORMAT = (44100, -16, 2)
+MIXER_BUFFER = 1024
 
-def create_synth_sound(frequency, duration, volume=0.5, waveform='sine'):
-    """Create a synthesized sound with the given parameters"""
+def stereo_samples(wave, scale=32767, out=None):
+    """Mono float wave written straight into the mixer's interleaved int16 layout
+
+    The wave is scaled in place, so pass a buffer that is not needed
+    afterwards. Sounds copy their samples, so a caller that makes sounds
+    repeatedly can pass a reusable (n, 2) int16 array as out; otherwise
+    the interleaved array is the only allocation.
+    """
+    if out is None or len(out) < len(wave):
+        out = np.empty((len(wave), 2), dtype=np.int16)
+    samples = out[:len(wave)]
+    wave *= scale
+    np.copyto(samples[:, 0], wave, casting='unsafe')
+    samples[:, 1] = samples[:, 0]
+    return samples
+
+def make_stereo_sound(wave, scale=32767, out=None):
+    """Sound from a mono float wave (see stereo_samples)"""
+    return pygame.sndarray.make_sound(stereo_samples(wave, scale, out))
+
+def synth_samples(frequency, duration, volume=0.5, waveform='sine'):
+    """Stereo int16 samples of a synthesized tone"""
     sample_rate = 44100
     samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples, False)
+    # Phase (or cycles for the sawtooth) computed in a single float32 buffer
+    wave = np.arange(samples, dtype=np.float32)
     
     if waveform == 'sine':
-        wave = np.sin(2 * np.pi * frequency * t)
+        wave *= 2 * np.pi * frequency / sample_rate
+        np.sin(wave, out=wave)
     elif waveform == 'square':
-        wave = np.sign(np.sin(2 * np.pi * frequency * t))
+        wave *= 2 * np.pi * frequency / sample_rate
+        np.sign(np.sin(wave, out=wave), out=wave)
     elif waveform == 'sawtooth':
-        wave = 2 * (frequency * t - np.floor(0.5 + frequency * t))
+        wave *= frequency / sample_rate
+        wave -= np.floor(wave + 0.5)
+        wave *= 2
     
     # Apply volume
     wave *= volume
@@ -55,16 +85,151 @@ def create_synth_sound(frequency, duration, volume=0.5, waveform='sine'):
     # Apply fade out (fixed the fade calculation)
     fade_samples = int(0.1 * sample_rate)
     if fade_samples > 0:
-        fade = np.linspace(1.0, 0.0, min(fade_samples, len(wave)))
+        fade = np.linspace(1.0, 0.0, min(fade_samples, len(wave)), dtype=np.float32)
         wave[-len(fade):] *= fade
     
-    # Convert to 16-bit integers
-    wave = np.int16(wave * 32767)
+    # Convert to 16-bit stereo
+    return stereo_samples(wave)
+
+def create_synth_sound(frequency, duration, volume=0.5, waveform='sine'):
+    """Create a synthesized sound with the given parameters"""
+    return pygame.sndarray.make_sound(synth_samples(frequency, duration, volume, waveform))
+
+def chord_samples(base_freq=220, duration=0.5):
+    """Stereo int16 samples of a gentle major chord"""
+    samples = int(44100 * duration)
+    t = np.linspace(0, duration, samples, False)
+    chord = np.zeros(samples)
+    for freq_mult in [1, 1.25, 1.5]:  # Major chord
+        chord += np.sin(2 * np.pi * base_freq * freq_mult * t) * 0.1  # Reduced volume
+    
+    # Normalize and convert chord
+    return stereo_samples(chord, 32767 / np.max(np.abs(chord)))
+
+def gameboy_samples():
+    """Stereo int16 samples of a GameBoy-style startup sound"""
+    sample_rate = 44100
+    duration = 1.2  # Slightly longer duration
+    
+    # Create time array
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    
+    # Generate the characteristic "ping" frequencies (adjusted for more GameBoy-like sound)
+    f1, f2, f3, f4 = 350, 700, 1400, 2100  # Higher frequencies for clearer sound
     
-    # Make stereo by duplicating the wave
-    stereo = np.column_stack([wave, wave])
+    # Create the four tones with timing offsets
+    tone1 = np.sin(2 * np.pi * f1 * t) * np.exp(-2 * t)
+    tone2 = np.sin(2 * np.pi * f2 * t) * np.exp(-2 * (t - 0.1)) * (t > 0.1)
+    tone3 = np.sin(2 * np.pi * f3 * t) * np.exp(-2 * (t - 0.2)) * (t > 0.2)
+    tone4 = np.sin(2 * np.pi * f4 * t) * np.exp(-2 * (t - 0.3)) * (t > 0.3)
     
-    return pygame.sndarray.make_sound(stereo)
+    # Add slight pitch bend for more character
+    bend = np.linspace(1.0, 1.02, len(t))
+    tone4 *= bend
+    
+    # Combine tones with adjusted volumes
+    audio_data = (
+        tone1 * 0.4 + 
+        tone2 * 0.35 + 
+        tone3 * 0.3 + 
+        tone4 * 0.25
+    )
+    
+    # Add slight reverb effect
+    reverb = np.zeros_like(audio_data)
+    delay_samples = int(0.05 * sample_rate)
+    reverb[delay_samples:] = audio_data[:-delay_samples] * 0.3
+    audio_data += reverb
+    
+    # Normalize and convert to 16-bit stereo at 90% volume
+    return stereo_samples(audio_data, 32767 * 0.9 / np.max(np.abs(audio_data)))
+
+SFX_CACHE_VERSION = 1  # Bump when effect synthesis changes
+
+# Sound effects: name -> (sample builder, its arguments, initial volume)
+SOUND_EFFECTS = {
+    'ant_spawn': (synth_samples, (880, 0.1, 0.15, 'sine'), 1.0),  # Halved volume
+    # Resource collection sounds (very subtle)
+    'mineral_collect': (synth_samples, (440, 0.05, 0.1, 'square'), 1.0),
+    'plant_collect': (synth_samples, (550, 0.05, 0.1, 'sine'), 1.0),
+    # Colony creation (gentler chord, initial volume lower)
+    'colony_create': (chord_samples, (220, 0.5), 0.15),
+    # Snake eating ant (softer thump)
+    'snake_eat': (synth_samples, (110, 0.2, 0.2, 'square'), 1.0),
+    # Resource deposit sound (gentler chime)
+    'resource_deposit': (synth_samples, (660, 0.15, 0.15, 'sine'), 1.0),
+    # Error sound (softer)
+    'error': (synth_samples, (220, 0.2, 0.15, 'sawtooth'), 1.0),
+    # Startup sound (adjusted volume)
+    'startup': (gameboy_samples, (), 0.2),
+    # Spider sounds (soft and creepy)
+    'spider_death': (synth_samples, (220, 0.3, 0.15, 'sawtooth'), 1.0),
+    'spider_web': (synth_samples, (440, 0.1, 0.1, 'sine'), 1.0)
+}
+
+class EffectBank:
+    """Sound effects created the first time they are played
+
+    Samples are cached on disk as one .npy file per effect, named by a
+    hash of its builder, arguments and SFX_CACHE_VERSION, and memory
+    mapped on later runs, so startup never synthesizes and an effect
+    that is never played this session is never loaded at all.
+
+    Usage:
+        effects = EffectBank(SOUND_EFFECTS)
+        effects.play('ant_spawn')
+        effects.set_volume(0.5)
+    """
+    def __init__(self, recipes):
+        self.recipes = recipes
+        self.sounds = {}
+        self.volume = None  # Set by set_volume; until then recipe volumes apply
+
+    def __contains__(self, name):
+        return name in self.sounds
+
+    def get(self, name):
+        """Sound for an effect, loading or synthesizing it on first use"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            build, args, volume = self.recipes[name]
+            sound = pygame.sndarray.make_sound(self.load_samples(name, build, args))
+            sound.set_volume(volume if self.volume is None else self.volume)
+            self.sounds[name] = sound
+        return sound
+
+    def play(self, name):
+        self.get(name).play()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for sound in self.sounds.values():
+            sound.set_volume(volume)
+
+    @staticmethod
+    def cache_key(name, build, args):
+        recipe = repr((SFX_CACHE_VERSION, build.__name__, args, SAMPLE_RATE))
+        digest = hashlib.sha1(recipe.encode()).hexdigest()[:12]
+        return f"sfx_{name}_{digest}.npy"
+
+    def load_samples(self, name, build, args):
+        """Stereo int16 samples from the disk cache, synthesized on a miss"""
+        path = cache_path(self.cache_key(name, build, args))
+        if path and path.exists():
+            try:
+                samples = np.load(path, mmap_mode='r')
+                if samples.dtype == np.int16 and samples.ndim == 2 and samples.shape[1] == 2:
+                    return samples
+            except (OSError, ValueError) as e:
+                print(f"Error loading cached sound {name}: {e}")
+
+        samples = build(*args)
+        if path:
+            try:
+                np.save(path, samples)
+            except OSError as e:
+                print(f"Error caching sound {name}: {e}")
+        return samples
 
 # Create game sounds
 class GameSounds:
@@ -84,190 +249,77 @@ class GameSounds:
         sounds.start_background_music()  # Start dynamic music
         sounds.set_volumes(0.5, 0.5)  # Set sound/music volumes
     """
-    def __init__(self):
+    def __init__(self, streams=None):
+        """Open the mixer and set up effects and music
+
+        Args:
+            streams: The game's RandomStreams, so the music is seeded with
+                the rest of the game (a fresh unseeded set when None)
+        """
+        if streams is None:
+            streams = RandomStreams()
         try:
-            pygame.mixer.quit()
-            pygame.mixer.init(44100, -16, 2, 1024)
-            
-            # Much quieter sound effects
-            self.ant_spawn = create_synth_sound(880, 0.1, 0.15, 'sine')  # Halved volume
-            
-            # Resource collection sounds (very subtle)
-            self.mineral_collect = create_synth_sound(440, 0.05, 0.1, 'square')
-            self.plant_collect = create_synth_sound(550, 0.05, 0.1, 'sine')
+            # Reopen the mixer only if it is closed or in another format
+            if pygame.mixer.get_init() != MIXER_FORMAT:
+                pygame.mixer.quit()
+                pygame.mixer.init(*MIXER_FORMAT, MIXER_BUFFER)
             
-            # Colony creation (gentler chord)
-            base_freq = 220
-            chord_duration = 0.5
-            chord_samples = int(44100 * chord_duration)
-            chord = np.zeros(chord_samples)
-            
-            for freq_mult in [1, 1.25, 1.5]:  # Major chord
-                t = np.linspace(0, chord_duration, chord_samples, False)
-                chord += np.sin(2 * np.pi * base_freq * freq_mult * t) * 0.1  # Reduced volume
-            
-            # Normalize and convert chord
-            chord = np.int16(chord * 32767 / np.max(np.abs(chord)))
-            self.colony_create = pygame.sndarray.make_sound(np.column_stack([chord, chord]))
-            self.colony_create.set_volume(0.15)  # Set initial volume lower
-            
-            # Snake eating ant (softer thump)
-            self.snake_eat = create_synth_sound(110, 0.2, 0.2, 'square')
-            
-            # Resource deposit sound (gentler chime)
-            self.resource_deposit = create_synth_sound(660, 0.15, 0.15, 'sine')
-            
-            # Error sound (softer)
-            self.error = create_synth_sound(220, 0.2, 0.15, 'sawtooth')
-            
-            # Startup sound (adjusted volume)
-            self.startup_sound = self.create_gameboy_sound()
-            self.startup_sound.set_volume(0.2)
-            
-            # Spider sounds (soft and creepy)
-            self.spider_death = create_synth_sound(220, 0.3, 0.15, 'sawtooth')
-            self.spider_web = create_synth_sound(440, 0.1, 0.1, 'sine')
+            # Effects are loaded (or synthesized) the first time they play
+            self.effects = EffectBank(SOUND_EFFECTS)
             
             # Initialize volume controls
             self.sound_volume = 0.5  # Default sound effect volume
             self.music_volume = 0.5  # Default music volume
             
             # Better buffering settings for slower music
-            self.music_generator = MusicGenerator()
-            self.audio_queue = []
+            self.music_generator = MusicGenerator(streams)
+            # Ready segments, filled by the producer thread. deque append and
+            # popleft are atomic, so the handoff needs no lock.
+            self.audio_queue = deque(maxlen=MUSIC_STATE['MAX_QUEUE_LENGTH'])
+            self.latest_state = None
+            self.producer = None
+            self.producer_wakeup = threading.Event()
             self.queue_length = QUEUE_LENGTH
             self.segment_duration = SEGMENT_DURATION
             self.is_playing = False
             self.last_queue_time = 0
             self.crossfade_duration = CROSSFADE_DURATION
             
+            # Work buffers reused by the producer thread for every segment
+            self.fade_curves = {}
+            self.dither_rng = streams.audio_np
+            self.dither_buffer = np.empty(0, dtype=np.float32)
+            self.stereo_buffer = np.empty((0, 2), dtype=np.int16)
+            
         except Exception as e:
             print(f"Error initializing sounds: {e}")
             self.music_generator = None
-            self.audio_queue = []
-
-    def create_gameboy_sound(self):
-        """Create a GameBoy-style startup sound"""
-        sample_rate = 44100
-        duration = 1.2  # Slightly longer duration
-        
-        # Create time array
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # Generate the characteristic "ping" frequencies (adjusted for more GameBoy-like sound)
-        f1, f2, f3, f4 = 350, 700, 1400, 2100  # Higher frequencies for clearer sound
-        
-        # Create the four tones with timing offsets
-        tone1 = np.sin(2 * np.pi * f1 * t) * np.exp(-2 * t)
-        tone2 = np.sin(2 * np.pi * f2 * t) * np.exp(-2 * (t - 0.1)) * (t > 0.1)
-        tone3 = np.sin(2 * np.pi * f3 * t) * np.exp(-2 * (t - 0.2)) * (t > 0.2)
-        tone4 = np.sin(2 * np.pi * f4 * t) * np.exp(-2 * (t - 0.3)) * (t > 0.3)
-        
-        # Add slight pitch bend for more character
-        bend = np.linspace(1.0, 1.02, len(t))
-        tone4 *= bend
-        
-        # Combine tones with adjusted volumes
-        audio_data = (
-            tone1 * 0.4 + 
-            tone2 * 0.35 + 
-            tone3 * 0.3 + 
-            tone4 * 0.25
-        )
-        
-        # Add slight reverb effect
-        reverb = np.zeros_like(audio_data)
-        delay_samples = int(0.05 * sample_rate)
-        reverb[delay_samples:] = audio_data[:-delay_samples] * 0.3
-        audio_data += reverb
-        
-        # Normalize and convert to 16-bit integers
-        audio_data = audio_data / np.max(np.abs(audio_data))
-        audio_data = (audio_data * 32767 * 0.9).astype(np.int16)  # Increased volume to 90%
-        
-        # Create stereo audio
-        stereo_data = np.column_stack([audio_data, audio_data])
-        
-        # Create pygame Sound object
-        sound = pygame.sndarray.make_sound(stereo_data)
-        return sound
+            self.audio_queue = deque()
+            self.producer = None
 
     def update_music(self, game_state):
-        """Update music based on game state with enhanced dynamics"""
+        """Publish the latest game state and keep queued music playing
+
+        Synthesis happens on the MusicProducer thread; this only hands it
+        a snapshot of the state and starts the next ready segment.
+        """
         try:
             if not self.music_generator or not self.is_playing:
                 return
             
-            # Validate music generator state
-            self.music_generator.validate_state()
-            
-            # Update music generator with game state
-            self.music_generator.update_game_state(game_state)
+            # The producer picks up the newest snapshot on its next pass
+            snapshot = MusicSnapshot.from_state(game_state)
+            self.latest_state = snapshot
+            if self.producer is None or not self.producer.is_alive():
+                self.producer = MusicProducer(self)
+                self.producer.start()
             
-            # Update audio queue
             current_time = pygame.time.get_ticks()
-            samples_per_segment = int(self.segment_duration * 44100)
-            crossfade_samples = int(self.crossfade_duration * 44100)
-            
-            # Dynamic queue length based on intensity and danger
-            target_queue_length = max(
-                MUSIC_STATE['MIN_QUEUE_LENGTH'],
-                min(MUSIC_STATE['MAX_QUEUE_LENGTH'],
-                    int(12 * (game_state.intensity + game_state.danger_level) / 2)
-                )
-            )
-            
-            while len(self.audio_queue) < target_queue_length:
-                segment = self.music_generator.generate_segment(samples_per_segment + crossfade_samples)
-                
-                # Enhanced dynamic volume system
-                base_volume = self.music_volume * (
-                    0.8 +  # Base level
-                    0.2 * game_state.resource_abundance * MUSIC_STATE['RESOURCE_VOLUME_FACTOR'] +  # Resource influence
-                    0.3 * game_state.danger_level * MUSIC_STATE['DANGER_VOLUME_FACTOR'] +  # Danger boost
-                    0.1 * game_state.intensity * MUSIC_STATE['INTENSITY_TEMPO_FACTOR']  # Activity boost
-                )
-                
-                # Time of day influence
-                if game_state.time_of_day == 'night':
-                    base_volume *= 0.85  # Slightly quieter at night
-                
-                # Mood-based volume adjustments
-                mood = game_state.current_mood.upper()
-                if mood in MOODS:
-                    base_volume *= (
-                        MOODS[mood]['melody_prominence'] * 0.4 +
-                        MOODS[mood]['bass_prominence'] * 0.4 +
-                        0.2  # Minimum volume
-                    )
-                
-                # Normalize and apply volume with smoother transitions
-                max_val = np.max(np.abs(segment))
-                if max_val > 0:
-                    segment = segment * base_volume / max_val
-                
-                # Enhanced crossfade with mood-based timing
-                fade_duration = crossfade_samples * (1.2 if mood == 'DREAMY' else 1.0)
-                fade_in = (1 - np.cos(np.linspace(0, np.pi, int(fade_duration)))) / 2
-                fade_out = (1 + np.cos(np.linspace(0, np.pi, int(fade_duration)))) / 2
-                
-                # Apply crossfade
-                segment[:len(fade_in)] *= fade_in[:len(segment[:len(fade_in)])]
-                segment[-len(fade_out):] *= fade_out[-len(segment[-len(fade_out):]):]
-                
-                # Convert to 16-bit integers with dithering for smoother sound
-                dither = np.random.uniform(-0.5, 0.5, len(segment)) * 0.001
-                audio_data = (segment * 32767 + dither).astype(np.int16)
-                stereo_data = np.column_stack((audio_data, audio_data))
-                
-                sound = pygame.sndarray.make_sound(stereo_data)
-                sound.set_volume(base_volume)
-                self.audio_queue.append(sound)
             
             # Dynamic segment timing based on game state
             segment_duration = self.segment_duration * (
-                1.1 - 0.2 * game_state.intensity +  # Speed up with intensity
-                0.1 * game_state.danger_level       # Slight slowdown with danger
+                1.1 - 0.2 * snapshot.intensity +  # Speed up with intensity
+                0.1 * snapshot.danger_level       # Slight slowdown with danger
             )
             
             # Update playback timing
@@ -281,12 +333,96 @@ class GameSounds:
         except Exception as e:
             print(f"Error in update_music: {e}")
     
+    def target_queue_length(self, game_state):
+        """Dynamic queue length based on intensity and danger"""
+        return max(
+            MUSIC_STATE['MIN_QUEUE_LENGTH'],
+            min(MUSIC_STATE['MAX_QUEUE_LENGTH'],
+                int(12 * (game_state.intensity + game_state.danger_level) / 2)
+            )
+        )
+    
+    def render_segment(self, game_state):
+        """Synthesize one music segment as a ready-to-play Sound
+
+        Runs on the producer thread, which owns the music generator.
+        """
+        samples_per_segment = int(self.segment_duration * 44100)
+        crossfade_samples = int(self.crossfade_duration * 44100)
+        
+        # Validate music generator state
+        self.music_generator.validate_state()
+        
+        # Update music generator with game state
+        self.music_generator.update_game_state(game_state)
+        
+        segment = self.music_generator.generate_segment(samples_per_segment + crossfade_samples)
+        
+        # Enhanced dynamic volume system
+        base_volume = self.music_volume * (
+            0.8 +  # Base level
+            0.2 * game_state.resource_abundance * MUSIC_STATE['RESOURCE_VOLUME_FACTOR'] +  # Resource influence
+            0.3 * game_state.danger_level * MUSIC_STATE['DANGER_VOLUME_FACTOR'] +  # Danger boost
+            0.1 * game_state.intensity * MUSIC_STATE['INTENSITY_TEMPO_FACTOR']  # Activity boost
+        )
+        
+        # Time of day influence
+        if game_state.time_of_day == 'night':
+            base_volume *= 0.85  # Slightly quieter at night
+        
+        # Mood-based volume adjustments
+        mood = game_state.current_mood.upper()
+        if mood in MOODS:
+            base_volume *= (
+                MOODS[mood]['melody_prominence'] * 0.4 +
+                MOODS[mood]['bass_prominence'] * 0.4 +
+                0.2  # Minimum volume
+            )
+        
+        # Normalize and apply volume with smoother transitions
+        max_val = max(segment.max(), -segment.min())
+        if max_val > 0:
+            segment *= base_volume / max_val
+        
+        # Enhanced crossfade with mood-based timing
+        fade_in, fade_out = self.crossfade_curves(
+            int(crossfade_samples * (1.2 if mood == 'DREAMY' else 1.0)))
+        
+        # Apply crossfade
+        segment[:len(fade_in)] *= fade_in[:len(segment[:len(fade_in)])]
+        segment[-len(fade_out):] *= fade_out[-len(segment[-len(fade_out):]):]
+        
+        # Dither for smoother sound, then convert to 16-bit stereo
+        segment *= 32767
+        if len(self.dither_buffer) < len(segment):
+            self.dither_buffer = np.empty(len(segment), dtype=np.float32)
+        dither = self.dither_buffer[:len(segment)]
+        self.dither_rng.random(dtype=np.float32, out=dither)
+        dither -= 0.5
+        dither *= 0.001
+        segment += dither
+        
+        if len(self.stereo_buffer) < len(segment):
+            self.stereo_buffer = np.empty((len(segment), 2), dtype=np.int16)
+        sound = make_stereo_sound(segment, 1, self.stereo_buffer)
+        sound.set_volume(base_volume)
+        return sound
+    
+    def crossfade_curves(self, length):
+        """Cosine fade-in and fade-out curves, computed once per length"""
+        curves = self.fade_curves.get(length)
+        if curves is None:
+            ramp = np.cos(np.linspace(0, np.pi, length, dtype=np.float32))
+            curves = self.fade_curves[length] = ((1 - ramp) / 2, (1 + ramp) / 2)
+        return curves
+    
     def play_next_segment(self):
         """Play next segment with overlap"""
         try:
             if self.audio_queue:
-                segment = self.audio_queue.pop(0)
+                segment = self.audio_queue.popleft()
                 segment.play(fade_ms=50)  # Add small fade to smooth transition
+                self.producer_wakeup.set()  # Room for another segment
                 
         except Exception as e:
             print(f"Error playing segment: {e}")
@@ -297,20 +433,11 @@ class GameSounds:
         self.music_volume = music_vol
         
         # Update music volume for queued segments
-        for segment in self.audio_queue:
+        for segment in tuple(self.audio_queue):
             segment.set_volume(music_vol)
         
-        # Update sound effects volumes
-        self.ant_spawn.set_volume(sound_vol)
-        self.mineral_collect.set_volume(sound_vol)
-        self.plant_collect.set_volume(sound_vol)
-        self.colony_create.set_volume(sound_vol)
-        self.snake_eat.set_volume(sound_vol)
-        self.resource_deposit.set_volume(sound_vol)
-        self.error.set_volume(sound_vol)
-        self.startup_sound.set_volume(sound_vol)
-        self.spider_death.set_volume(sound_vol)
-        self.spider_web.set_volume(sound_vol)
+        # Update sound effects volumes (effects not loaded yet pick it up later)
+        self.effects.set_volume(sound_vol)
     
     def start_background_music(self):
         """Start background music with fade in"""
@@ -337,7 +464,7 @@ class GameSounds:
             for vol in range(0, 11):
                 self.music_volume = vol / 10.0
                 pygame.time.wait(200)
-                for segment in self.audio_queue:
+                for segment in tuple(self.audio_queue):
                     segment.set_volume(self.music_volume)
                 
         except Exception as e:
@@ -351,12 +478,15 @@ class GameSounds:
             for vol in range(10, -1, -1):
                 self.music_volume = vol * original_volume / 10
                 # Update volume of queued segments
-                for segment in self.audio_queue:
+                for segment in tuple(self.audio_queue):
                     segment.set_volume(self.music_volume)
                 pygame.time.wait(200)
             
             # Stop playback
             self.is_playing = False
+            if self.producer is not None:
+                self.producer.stop()
+                self.producer = None
             pygame.mixer.stop()
             self.audio_queue.clear()
             
@@ -364,41 +494,41 @@ class GameSounds:
             print(f"Error stopping background music: {e}")
 
     def play_ant_spawn(self):
-        self.ant_spawn.play()
+        self.effects.play('ant_spawn')
     
     def play_mineral_collect(self):
-        self.mineral_collect.play()
+        self.effects.play('mineral_collect')
     
     def play_plant_collect(self):
-        self.plant_collect.play()
+        self.effects.play('plant_collect')
     
     def play_colony_create(self):
-        self.colony_create.play()
+        self.effects.play('colony_create')
     
     def play_snake_eat(self):
-        self.snake_eat.play()
+        self.effects.play('snake_eat')
     
     def play_resource_deposit(self):
-        self.resource_deposit.play()
+        self.effects.play('resource_deposit')
     
     def play_error(self):
-        self.error.play()
+        self.effects.play('error')
 
     def play_startup(self):
         """Play the startup sound"""
-        self.startup_sound.play()
+        self.effects.play('startup')
 
     def play_spider_death(self):
         """Play spider death sound"""
         try:
-            self.spider_death.play()
+            self.effects.play('spider_death')
         except:
             pass
             
     def play_spider_web(self):
         """Play web creation sound"""
         try:
-            self.spider_web.play()
+            self.effects.play('spider_web')
         except:
             pass
 
@@ -416,6 +546,160 @@ class DummySound:
     def get_volume(self):
         return 0.0
 
+class SilentGameSounds:
+    """
+    Null audio backend with the same interface as GameSounds.
+    
+    Used by the headless simulation so that no mixer is initialized and
+    no sound buffers are synthesized.
+    """
+    def __init__(self):
+        self.sound_volume = 0.0
+        self.music_volume = 0.0
+        self.music_generator = None
+        self.audio_queue = []
+        self.is_playing = False
+
+    def update_music(self, game_state):
+        pass
+
+    def set_volumes(self, sound_vol, music_vol):
+        self.sound_volume = sound_vol
+        self.music_volume = music_vol
+
+    def start_background_music(self):
+        pass
+
+    def stop_background_music(self):
+        pass
+
+    def play_ant_spawn(self):
+        pass
+
+    def play_mineral_collect(self):
+        pass
+
+    def play_plant_collect(self):
+        pass
+
+    def play_colony_create(self):
+        pass
+
+    def play_snake_eat(self):
+        pass
+
+    def play_resource_deposit(self):
+        pass
+
+    def play_error(self):
+        pass
+
+    def play_startup(self):
+        pass
+
+    def play_spider_death(self):
+        pass
+
+    def play_spider_web(self):
+        pass
+
+class MusicSnapshot(namedtuple('MusicSnapshot', [
+        'intensity', 'danger_level', 'resource_abundance', 'time_of_day', 'current_mood'])):
+    """Immutable copy of the GameState fields the music depends on
+
+    The game loop publishes one of these per update; the producer thread
+    only ever reads snapshots, never the live GameState.
+    """
+    @classmethod
+    def from_state(cls, game_state):
+        return cls(
+            getattr(game_state, 'intensity', 0.0),
+            getattr(game_state, 'danger_level', 0.0),
+            getattr(game_state, 'resource_abundance', 1.0),
+            getattr(game_state, 'time_of_day', 'day'),
+            getattr(game_state, 'current_mood', 'peaceful')
+        )
+
+class MusicProducer(threading.Thread):
+    """Daemon thread that keeps GameSounds.audio_queue stocked
+
+    Synthesizing a segment takes several full-length NumPy passes, which
+    caused frame hitches when done inside the game's update(). The
+    producer renders segments for the latest published MusicSnapshot
+    until the queue reaches its target length, then sleeps until a
+    segment is played or the poll interval passes.
+    """
+    POLL_INTERVAL = 0.1  # Seconds between checks when the queue is full
+
+    def __init__(self, sounds):
+        super().__init__(name="MusicProducer", daemon=True)
+        self.sounds = sounds
+        self.stopping = threading.Event()
+
+    def run(self):
+        sounds = self.sounds
+        while not self.stopping.is_set():
+            state = sounds.latest_state
+            if state is not None and len(sounds.audio_queue) < sounds.target_queue_length(state):
+                try:
+                    sounds.audio_queue.append(sounds.render_segment(state))
+                except Exception as e:
+                    print(f"Error generating music segment: {e}")
+                    self.stopping.wait(self.POLL_INTERVAL)
+                continue
+            sounds.producer_wakeup.wait(self.POLL_INTERVAL)
+            sounds.producer_wakeup.clear()
+
+    def stop(self):
+        """Ask the thread to finish and wait for the current segment"""
+        self.stopping.set()
+        self.sounds.producer_wakeup.set()
+        self.join(timeout=2.0)
+
+class VoiceBank:
+    """Bounded least-recently-used store of synthesized instrument voices
+
+    A voice depends only on its instrument, pitch, length and style, and
+    the music keeps reusing the few notes of the day and night scales at
+    the same segment length. Each voice is synthesized once and kept as a
+    read-only float32 array; once the stored voices exceed max_bytes the
+    one used longest ago is dropped. Noise-based percussion is cached
+    too, so a drum keeps one fixed sample, like a drum machine.
+    """
+    MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.voices = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.voices)
+
+    def get(self, key, build):
+        """Return the voice for key, calling build() to synthesize it if needed"""
+        voice = self.voices.get(key)
+        if voice is not None:
+            self.voices.move_to_end(key)
+            self.hits += 1
+            return voice
+
+        self.misses += 1
+        voice = np.asarray(build(), dtype=np.float32)
+        voice.flags.writeable = False
+        self.voices[key] = voice
+        self.nbytes += voice.nbytes
+        while self.nbytes > self.max_bytes and len(self.voices) > 1:
+            _, dropped = self.voices.popitem(last=False)
+            self.nbytes -= dropped.nbytes
+        return voice
+
+    def clear(self):
+        self.voices.clear()
+        self.nbytes = 0
+
 class MusicGenerator:
     """
     Procedural music generator for ambient game soundtrack.
@@ -440,8 +724,17 @@ class MusicGenerator:
     - Channels: Stereo
     - Buffer size: 1024 samples
     """
-    def __init__(self):
-        """Initialize the music generator"""
+    def __init__(self, streams=None):
+        """Initialize the music generator
+
+        Args:
+            streams: RandomStreams whose audio streams drive phrasing and
+                noise (a fresh unseeded set when None)
+        """
+        if streams is None:
+            streams = RandomStreams()
+        self.rng = streams.audio
+        self.noise_rng = streams.audio_np
         self.is_night = False
         self.current_combination = 0
         self.sequence_position = 0
@@ -479,6 +772,10 @@ class MusicGenerator:
         
         # Last played note for melodic continuity
         self.last_note = None
+        
+        # Synthesized notes and drums, reused across segments
+        self.voices = VoiceBank()
+        self.buffers = {}
 
     def update_game_state(self, game_state):
         """Update generator state based on game state"""
@@ -502,8 +799,11 @@ class MusicGenerator:
         - Occasional harmonies
         - Soft percussion elements
         - Dynamic mood transitions
+        
+        Returns a float32 work buffer that the next call overwrites.
         """
-        segment = np.zeros(length)
+        segment = self.work_buffer('segment', length)
+        segment.fill(0)
         
         # Get current scale
         scale = self.night_scale if self.is_night else self.day_scale
@@ -529,7 +829,7 @@ class MusicGenerator:
         self.progression_position %= len(self.progression_sequence[0])
         
         # Melodic elements with plenty of space
-        if random.random() < 0.15:  # Sparse melodic moments
+        if self.rng.random() < 0.15:  # Sparse melodic moments
             try:
                 prog_index = (self.sequence_position // 4) % len(self.progression_sequence)
                 chord_index = self.progression_sequence[prog_index][self.progression_position]
@@ -543,20 +843,20 @@ class MusicGenerator:
                     scale[chord_index] * 2.0,  # Octave
                 ]
                 
-                note = random.choice(available_notes)
+                note = self.rng.choice(available_notes)
                 if self.last_note:
-                    while abs(note - self.last_note) > scale[2] and random.random() < 0.9:
-                        note = random.choice(available_notes)
+                    while abs(note - self.last_note) > scale[2] and self.rng.random() < 0.9:
+                        note = self.rng.choice(available_notes)
                 self.last_note = note
                 
                 # Very gentle melody
                 melody_vol = 0.12 + 0.03 * math.sin(self.sequence_position * 0.1)
-                segment += self.create_melody(note, length) * melody_vol
+                self.mix(segment, self.create_melody(note, length), melody_vol)
                 
                 # Occasional harmony
-                if random.random() < 0.2:
+                if self.rng.random() < 0.2:
                     harmony = note * 1.5  # Perfect fifth
-                    segment += self.create_melody(harmony, length) * (melody_vol * 0.4)
+                    self.mix(segment, self.create_melody(harmony, length), melody_vol * 0.4)
             except Exception as e:
                 print(f"Error in melody generation: {e}")
                 # Continue without melody if there's an error
@@ -567,29 +867,48 @@ class MusicGenerator:
             self.current_progression = (self.current_progression + 1) % len(self.progression_sequence)
         
         # Very rare, soft percussion
-        if random.random() < 0.08:
+        if self.rng.random() < 0.08:
             try:
                 drums = self.generate_drum_pattern(length, 
                                                 'dreamy' if self.is_night else 'peaceful',
                                                 self.sequence_position)
-                segment += drums * 0.06
+                self.mix(segment, drums, 0.06)
             except Exception as e:
                 print(f"Error in drum generation: {e}")
         
         # Minimal compression
-        segment = np.tanh(segment * 1.01)
+        segment *= 1.01
+        np.tanh(segment, out=segment)
         
         # Normalize with plenty of headroom
-        max_val = np.max(np.abs(segment))
+        max_val = max(segment.max(), -segment.min())
         if max_val > 0:
-            segment = segment / max_val * 0.5
+            segment *= 0.5 / max_val
         
         # Update sequence position
         self.sequence_position += 1
         
         return segment
 
+    def work_buffer(self, name, length):
+        """Preallocated float32 buffer, reallocated only when segments get longer"""
+        buffer = self.buffers.get(name)
+        if buffer is None or len(buffer) < length:
+            buffer = self.buffers[name] = np.empty(length, dtype=np.float32)
+        return buffer[:length]
+
+    def mix(self, segment, voice, gain):
+        """Add voice * gain into segment without a full-length temporary"""
+        scaled = self.work_buffer('mix', len(segment))
+        np.multiply(voice, gain, out=scaled, casting='unsafe')
+        segment += scaled
+
     def create_melody(self, frequency, length):
+        """Soft, piano-like melody voice from the voice bank"""
+        return self.voices.get(('melody', frequency, length),
+                               lambda: self.synth_melody(frequency, length))
+
+    def synth_melody(self, frequency, length):
         """Create a soft, piano-like melody sound"""
         t = np.linspace(0, length/SAMPLE_RATE, length)
         
@@ -681,6 +1000,10 @@ class MusicGenerator:
             print(f"Error requesting transition: {e}")
 
     def create_kick(self, length):
+        """Ultra-soft kick voice from the voice bank"""
+        return self.voices.get(('kick', length), lambda: self.synth_kick(length))
+
+    def synth_kick(self, length):
         """Create an ultra-soft, minimal kick for ambient music"""
         t = np.linspace(0, length/SAMPLE_RATE, length)
         
@@ -717,13 +1040,17 @@ class MusicGenerator:
         return output * 0.15  # Even lower volume
 
     def create_snare(self, length):
+        """Soft snare voice from the voice bank"""
+        return self.voices.get(('snare', length), lambda: self.synth_snare(length))
+
+    def synth_snare(self, length):
         """Create a soft snare sound"""
         t = np.linspace(0, length/SAMPLE_RATE, length)
         
         # Mix of tone and noise
         tone_freq = 180
         tone = np.sin(2 * np.pi * tone_freq * t)
-        noise = np.random.uniform(-1, 1, len(t))
+        noise = self.noise_rng.uniform(-1, 1, len(t))
         
         # Filter the noise
         noise = np.convolve(noise, np.hanning(32), mode='same')
@@ -741,11 +1068,16 @@ class MusicGenerator:
         return snare * envelope * 0.2  # Quiet snare
 
     def create_hihat(self, length, is_open=False):
+        """Gentle hi-hat voice from the voice bank"""
+        return self.voices.get(('hihat', is_open, length),
+                               lambda: self.synth_hihat(length, is_open))
+
+    def synth_hihat(self, length, is_open=False):
         """Create a gentle hi-hat sound"""
         t = np.linspace(0, length/SAMPLE_RATE, length)
         
         # Generate noise
-        noise = np.random.uniform(-1, 1, len(t))
+        noise = self.noise_rng.uniform(-1, 1, len(t))
         
         # Bandpass filter (6-12kHz range)
         noise = np.convolve(noise, np.hanning(16), mode='same')
@@ -760,11 +1092,16 @@ class MusicGenerator:
         return noise * envelope * 0.15  # Very quiet hi-hat
 
     def create_shaker(self, length, style='soft'):
+        """Gentle shaker/tambourine voice from the voice bank"""
+        return self.voices.get(('shaker', style, length),
+                               lambda: self.synth_shaker(length, style))
+
+    def synth_shaker(self, length, style='soft'):
         """Create a gentle shaker/tambourine sound"""
         t = np.linspace(0, length/SAMPLE_RATE, length)
         
         # Generate filtered noise
-        noise = np.random.uniform(-1, 1, len(t))
+        noise = self.noise_rng.uniform(-1, 1, len(t))
         
         # Different filter characteristics for different styles
         if style == 'soft':
@@ -777,7 +1114,7 @@ class MusicGenerator:
         # Add some metallic resonance for tambourine
         if style == 'bright':
             resonance = np.sin(2 * np.pi * 6000 * t) * 0.1
-            noise += resonance * np.random.uniform(0, 1, len(t))
+            noise += resonance * self.noise_rng.uniform(0, 1, len(t))
         
         # Envelope
         attack = int(0.001 * length)
@@ -820,7 +1157,7 @@ class MusicGenerator:
                 kick_positions = [0, int(quarter_note * 2), int(quarter_note * 3.5)]
             
             for offset in kick_positions:
-                if offset < length and random.random() < 0.8:
+                if offset < length and self.rng.random() < 0.8:
                     pattern[offset:] += self.create_kick(length-offset) * 0.5
                     
                     # Variable room sound
@@ -833,7 +1170,7 @@ class MusicGenerator:
         
         elif mood == 'dreamy':
             # Dreamy variations
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 kick = self.create_kick(length) * (0.3 + 0.1 * math.sin(position * 0.3))
                 pattern += kick
                 
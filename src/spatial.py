@@ -0,0 +1,203 @@
+import math
+import numpy as np
+from constants import PERCEPTION_RADIUS
+
+class SpatialHash:
+    """Uniform grid index for fast proximity queries
+
+    Objects are bucketed by the grid cell containing their `position`.
+    Buckets are kept up to date incrementally: call update() after an
+    object moves, or sync() with the authoritative list when it changed
+    outside the update loop.
+    A radius query only visits the cells overlapping the search circle,
+    so with a cell size close to the typical query radius each lookup
+    touches a handful of buckets instead of every object.
+    """
+    def __init__(self, cell_size=PERCEPTION_RADIUS):
+        self.cell_size = cell_size
+        self.cells = {}       # (cell_x, cell_y) -> set of objects
+        self.locations = {}   # object -> (cell_x, cell_y)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __contains__(self, obj):
+        return obj in self.locations
+
+    def __iter__(self):
+        return iter(self.locations)
+
+    def cell_for(self, position):
+        """Grid cell containing a position"""
+        return (int(position[0] // self.cell_size), int(position[1] // self.cell_size))
+
+    def insert(self, obj):
+        cell = self.cell_for(obj.position)
+        self.cells.setdefault(cell, set()).add(obj)
+        self.locations[obj] = cell
+
+    def remove(self, obj):
+        cell = self.locations.pop(obj, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        bucket.discard(obj)
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, obj):
+        """Re-bucket an object after it moved (inserts unknown objects)"""
+        position = obj.position
+        cell = (int(position[0] // self.cell_size), int(position[1] // self.cell_size))
+        old_cell = self.locations.get(obj)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            bucket = self.cells[old_cell]
+            bucket.discard(obj)
+            if not bucket:
+                del self.cells[old_cell]
+        self.cells.setdefault(cell, set()).add(obj)
+        self.locations[obj] = cell
+
+    def sync(self, objects):
+        """Make the index match a list of objects: add new, move, drop missing"""
+        present = set()
+        for obj in objects:
+            present.add(obj)
+            self.update(obj)
+        if len(present) != len(self.locations):
+            for obj in [o for o in self.locations if o not in present]:
+                self.remove(obj)
+
+    def rebuild(self, objects, positions=None):
+        """Index exactly these objects, replacing everything indexed before
+
+        Quicker than sync() for a whole new population (e.g. a loaded
+        game): cells are computed for all objects at once. positions is
+        an optional (n, 2) array matching objects, to skip reading each
+        object's position.
+        """
+        objects = list(objects)
+        if positions is None:
+            positions = [obj.position for obj in objects]
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        keys = map(tuple, np.floor_divide(positions, self.cell_size).astype(np.int64).tolist())
+        self.locations = dict(zip(objects, keys))
+        self.cells = {}
+        for obj, cell in self.locations.items():
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = {obj}
+            else:
+                bucket.add(obj)
+
+    def clear(self):
+        self.cells.clear()
+        self.locations.clear()
+
+    def candidates(self, position, radius):
+        """Objects in every cell overlapping the square around a circle"""
+        size = self.cell_size
+        min_x = int((position[0] - radius) // size)
+        max_x = int((position[0] + radius) // size)
+        min_y = int((position[1] - radius) // size)
+        max_y = int((position[1] + radius) // size)
+        cells = self.cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+
+    def query(self, position, radius):
+        """List objects strictly closer than radius to position"""
+        px, py = position
+        limit = radius * radius
+        found = []
+        for obj in self.candidates(position, radius):
+            dx = obj.position[0] - px
+            dy = obj.position[1] - py
+            if dx * dx + dy * dy < limit:
+                found.append(obj)
+        return found
+
+    def count(self, position, radius):
+        """Number of objects strictly closer than radius to position"""
+        px, py = position
+        limit = radius * radius
+        total = 0
+        for obj in self.candidates(position, radius):
+            dx = obj.position[0] - px
+            dy = obj.position[1] - py
+            if dx * dx + dy * dy < limit:
+                total += 1
+        return total
+
+    def nearest(self, position, max_radius=None, predicate=None):
+        """Closest object to position, searching outward ring by ring
+
+        Returns (object, distance), or (None, inf) when nothing matches
+        within max_radius (or in the whole index when max_radius is None).
+        """
+        if not self.locations:
+            return None, float('inf')
+        if max_radius is not None:
+            return self._nearest_in(self.candidates(position, max_radius),
+                                    position, max_radius, predicate)
+
+        px, py = position
+        size = self.cell_size
+        center_x, center_y = self.cell_for(position)
+        max_ring = self._max_ring(center_x, center_y)
+        if (2 * max_ring + 1) ** 2 > len(self.locations):
+            # Sparse index: scanning every object beats walking empty rings
+            return self._nearest_in(self.locations, position, None, predicate)
+
+        best, best_dist = None, float('inf')
+        for ring in range(max_ring + 1):
+            # Anything in a further ring is at least (ring - 1) cells away
+            if best is not None and (ring - 1) * size > best_dist:
+                break
+            for cell in self._ring_cells(center_x, center_y, ring):
+                bucket = self.cells.get(cell)
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    if predicate is not None and not predicate(obj):
+                        continue
+                    dist = math.hypot(obj.position[0] - px, obj.position[1] - py)
+                    if dist < best_dist:
+                        best, best_dist = obj, dist
+        return best, best_dist
+
+    def _nearest_in(self, objects, position, max_radius, predicate):
+        """Linear nearest search over a candidate collection"""
+        px, py = position
+        best = None
+        best_dist = float('inf') if max_radius is None else max_radius
+        for obj in objects:
+            if predicate is not None and not predicate(obj):
+                continue
+            dist = math.hypot(obj.position[0] - px, obj.position[1] - py)
+            if dist < best_dist:
+                best, best_dist = obj, dist
+        if best is None:
+            return None, float('inf')
+        return best, best_dist
+
+    def _max_ring(self, center_x, center_y):
+        """Ring count needed to cover every occupied cell"""
+        return max(max(abs(cx - center_x), abs(cy - center_y)) for cx, cy in self.cells)
+
+    def _ring_cells(self, center_x, center_y, ring):
+        """Cells on the square ring at Chebyshev distance `ring`"""
+        if ring == 0:
+            yield (center_x, center_y)
+            return
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            yield (cell_x, center_y - ring)
+            yield (cell_x, center_y + ring)
+        for cell_y in range(center_y - ring + 1, center_y + ring):
+            yield (center_x - ring, cell_y)
+            yield (center_x + ring, cell_y)
@@ -0,0 +1,103 @@
+import pygame
+from collections import OrderedDict
+
+class SurfaceCache:
+    """Least-recently-used cache of pre-rendered surfaces
+
+    Surfaces are looked up by a hashable key and built on a miss by the
+    callable passed to get(). Once max_entries is exceeded the surface
+    used longest ago is dropped.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, build):
+        """Return the surface for key, calling build() to create it if needed"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+def bake_pixels(pixels, pixel_size, alpha=255):
+    """Render ((x, y), color) pixel art into a single transparent surface"""
+    width = (max((x for (x, _), _ in pixels), default=0) + 1) * pixel_size
+    height = (max((y for (_, y), _ in pixels), default=0) + 1) * pixel_size
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    for (x, y), color in pixels:
+        surface.fill((*color, alpha), (x * pixel_size, y * pixel_size, pixel_size, pixel_size))
+    return surface
+
+class PixelArt:
+    """One layer of ((x, y), color) pixel art and its atlas id
+
+    The id is a hash of the pixels, worked out once when the art is
+    created, so drawing does not rehash every pixel to find the sprite.
+    """
+    __slots__ = ('pixels', 'art_id')
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.art_id = hash(pixels)
+
+# Shared by every resource so identical pixel art is only rendered once
+ATLAS = SurfaceCache(512)
+
+def get_sprite(kind, art, pixel_size, alpha=255):
+    """Atlas surface for a layer of pixel art at one scale step and alpha
+
+    Args:
+        kind: Layer name, part of the key so different layers never collide
+        art: PixelArt to draw, keyed by its art_id
+        pixel_size: Scale step (size of one art pixel in screen pixels)
+    """
+    key = (kind, art.art_id, pixel_size, alpha)
+    return ATLAS.get(key, lambda: bake_pixels(art.pixels, pixel_size, alpha))
+
+# Font objects are pooled by (file, size); None is pygame's default font
+_FONTS = {}
+
+def get_font(size, name=None):
+    """Shared Font for a font file and point size"""
+    key = (name, size)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = pygame.font.Font(name, size)
+    return font
+
+# Rendered text is mostly labels and counters that rarely change
+TEXT = SurfaceCache(512)
+
+def render_text(text, size, color, alpha=None, name=None, antialias=True):
+    """Cached text surface, rendered only the first time a string is drawn
+
+    Surfaces are shared between callers and must not be modified; pass
+    alpha instead of calling set_alpha on the result.
+    """
+    key = (name, size, text, color, alpha, antialias)
+
+    def build():
+        surface = get_font(size, name).render(text, antialias, color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        return surface
+    return TEXT.get(key, build)
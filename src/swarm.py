@@ -0,0 +1,502 @@
+import math
+import numpy as np
+from entities import Ant
+from constants import ANT_SIZE, COLONY_MIN_SIZE, DAY_NIGHT, Behavior
+
+# FSM states stored as small integers
+EXPLORING = 0
+COLLECTING = 1
+RETURNING = 2
+STATE_NAMES = ('exploring', 'collecting', 'returning')
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+EDGE_BUFFER = Ant.edge_buffer
+CELL_STRIDE = 1 << 20  # Packs a grid cell (x, y) into one sortable key
+ROW_CHUNK = 4096       # Ants measured against the colonies at once
+DENSE_PAIRS = 50000    # Below this many ant-resource pairs, measure them all
+
+class AntSwarm:
+    """Structure-of-arrays storage for every ant in the game
+
+    Positions, directions, speeds, jump state, carried resources and FSM
+    state live in contiguous NumPy arrays and are advanced together by
+    update(). The swarm behaves like the plain list of Ant objects the
+    game normally uses (append, remove, len, iteration), handing out
+    SwarmAnt views so existing callers such as Snake.update and
+    SpiderWeb.affects_ant keep working unchanged.
+
+    Removal swaps the last row into the freed slot, so row order is not
+    stable, but each view keeps pointing at its own ant.
+    """
+    def __init__(self, game, capacity=64):
+        self.game = game
+        self.count = 0
+        self.views = []             # Row -> SwarmAnt
+        self.home_colonies = []     # Row -> Colony or None
+        self.target_resources = []  # Row -> resource or None
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.position = np.zeros((capacity, 2))
+        self.direction = np.zeros((capacity, 2))
+        self.speed = np.zeros(capacity)
+        self.perception_radius = np.zeros(capacity)
+        self.jump_height = np.zeros(capacity)
+        self.jump_count = np.zeros(capacity)
+        self.is_jumping = np.zeros(capacity, dtype=bool)
+        self.carried = np.zeros((capacity, 2), dtype=np.int64)  # minerals, plants
+        self.carry_capacity = np.zeros(capacity, dtype=np.int64)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.web_slow_timer = np.zeros(capacity)
+        self.scuttle_offset = np.zeros(capacity)
+        self.home_position = np.full((capacity, 2), np.nan)
+
+    def _columns(self):
+        return ('position', 'direction', 'speed', 'perception_radius',
+                'jump_height', 'jump_count', 'is_jumping', 'carried',
+                'carry_capacity', 'state', 'web_slow_timer',
+                'scuttle_offset', 'home_position')
+
+    def _grow(self):
+        old = {name: getattr(self, name) for name in self._columns()}
+        self._allocate(self.capacity * 2)
+        for name, values in old.items():
+            getattr(self, name)[:self.count] = values[:self.count]
+
+    # List-like interface used by the rest of the game
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.views[:self.count])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.views[:self.count][index]
+        if not -self.count <= index < self.count:
+            raise IndexError("swarm index out of range")
+        return self.views[index % self.count]
+
+    def __contains__(self, ant):
+        return isinstance(ant, SwarmAnt) and ant.swarm is self
+
+    def __bool__(self):
+        return self.count > 0
+
+    def append(self, ant):
+        """Adopt an Ant (or a detached SwarmAnt) and return its view"""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.count += 1
+
+        self.position[row] = ant.position
+        self.direction[row] = ant.direction
+        self.speed[row] = ant.speed
+        self.perception_radius[row] = ant.perception_radius
+        self.jump_height[row] = ant.jump_height
+        self.jump_count[row] = ant.jump_count
+        self.is_jumping[row] = ant.is_jumping
+        self.carried[row] = (ant.resources['minerals'], ant.resources['plants'])
+        self.carry_capacity[row] = ant.carry_capacity
+        self.state[row] = STATE_CODES[ant.state]
+        self.web_slow_timer[row] = ant.web_slow_timer
+        self.scuttle_offset[row] = ant.scuttle_offset
+        home = ant.home_colony
+        self.home_position[row] = home.position if home is not None else (np.nan, np.nan)
+        self.home_colonies.append(home)
+        self.target_resources.append(ant.target_resource)
+
+        view = ant if isinstance(ant, SwarmAnt) else SwarmAnt(self.game)
+        view.swarm = self
+        view.row = row
+        self.views.append(view)
+        return view
+
+    def remove(self, view):
+        """Swap-remove an ant; the view is detached and stays usable"""
+        if view not in self:
+            raise ValueError("ant is not in this swarm")
+        row = view.row
+        last = self.count - 1
+
+        # The view keeps working on a copy of its row
+        view.swarm = _DetachedRow(self, row)
+        view.row = 0
+
+        if row != last:
+            for name in self._columns():
+                column = getattr(self, name)
+                column[row] = column[last]
+            for rows in (self.views, self.home_colonies, self.target_resources):
+                rows[row] = rows[last]
+            self.views[row].row = row
+        for rows in (self.views, self.home_colonies, self.target_resources):
+            rows.pop()
+        self.count = last
+
+    def clear(self):
+        for view in list(self):
+            self.remove(view)
+
+    # Batched simulation
+
+    def update(self, cursor_pos, snake_pos, resources, colonies, ant_grid=None):
+        """Advance every ant one tick, mirroring Ant.update
+
+        Args:
+            cursor_pos: Cursor position ants flee from (None when headless)
+            snake_pos: Snake head position
+            resources: SpatialHash of rocks, plants and bushes
+            colonies: SpatialHash of colonies
+            ant_grid: Optional SpatialHash to re-bucket ants that changed cell
+        """
+        n = self.count
+        if n == 0:
+            return
+        pos = self.position[:n]
+        direction = self.direction[:n]
+
+        # Web slowdown: half speed and keep jumping while stuck
+        webbed = self.web_slow_timer[:n] > 0
+        self.web_slow_timer[:n][webbed] -= self.game.dt
+        current_speed = np.where(webbed, self.speed[:n] * 0.5, self.speed[:n]) * self.game.tick_scale
+        self._start_jump(webbed)
+
+        # Threats: flee in a random direction and jump
+        threatened = np.zeros(n, dtype=bool)
+        for threat in (cursor_pos, snake_pos):
+            if threat is not None:
+                dist = np.hypot(pos[:, 0] - threat[0], pos[:, 1] - threat[1])
+                threatened |= dist < self.perception_radius[:n]
+        fleeing = np.flatnonzero(threatened)
+        if len(fleeing):
+            angles = self.game.rng.simulation_np.uniform(0, 2 * math.pi, len(fleeing))
+            direction[fleeing, 0] = np.cos(angles)
+            direction[fleeing, 1] = np.sin(angles)
+        self._start_jump(threatened)
+
+        self._update_jump()
+
+        old_cells = None
+        if ant_grid is not None:
+            old_cells = np.floor_divide(pos, ant_grid.cell_size)
+        self._move(current_speed)
+
+        # Only calm ants carry on with their task
+        calm = ~threatened
+        state = self.state[:n]
+        exploring = np.flatnonzero(calm & (state == EXPLORING))
+        collecting = np.flatnonzero(calm & (state == COLLECTING))
+        returning = np.flatnonzero(calm & (state == RETURNING))
+        self._explore(exploring, resources)
+        for row in collecting:
+            self.views[row].collect_resources()
+        self._return_to_colony(returning, colonies)
+
+        if ant_grid is not None:
+            new_cells = np.floor_divide(self.position[:n], ant_grid.cell_size)
+            moved = np.flatnonzero((new_cells != old_cells).any(axis=1))
+            for row in moved:
+                ant_grid.update(self.views[row])
+
+    def _start_jump(self, mask):
+        n = self.count
+        starting = mask & ~self.is_jumping[:n]
+        self.is_jumping[:n][starting] = True
+        self.jump_count[:n][starting] = 0
+
+    def _update_jump(self):
+        n = self.count
+        jumping = self.is_jumping[:n]
+        count = self.jump_count[:n]
+        height = self.jump_height[:n]
+        rising = jumping & (count < 2)  # Two jumps as per documentation
+        height[rising] = 5 * np.sin(count[rising] * math.pi)
+        count[rising] += 0.1 * self.game.tick_scale
+        landed = jumping & ~rising
+        jumping[landed] = False
+        height[landed] = 0
+
+    def _move(self, speed):
+        """Bounce off the world edges, then step along each direction"""
+        n = self.count
+        pos = self.position[:n]
+        direction = self.direction[:n]
+        near_edge = np.zeros(n, dtype=bool)
+        for axis, limit in ((0, self.game.width), (1, self.game.height)):
+            low = pos[:, axis] <= EDGE_BUFFER
+            high = ~low & (pos[:, axis] >= limit - EDGE_BUFFER)
+            direction[low, axis] = np.abs(direction[low, axis])
+            direction[high, axis] = -np.abs(direction[high, axis])
+            near_edge |= low | high
+        self._start_jump(near_edge)
+
+        pos += direction * speed[:, None]
+        np.clip(pos[:, 0], 0, self.game.width, out=pos[:, 0])
+        np.clip(pos[:, 1], 0, self.game.height, out=pos[:, 1])
+
+    def _explore(self, rows, resources):
+        """Head for the nearest resource in range, or home when full"""
+        if len(rows) == 0:
+            return
+        full = (self.carried[rows] >= self.carry_capacity[rows, None]).any(axis=1)
+        self.state[rows[full]] = RETURNING
+        rows = rows[~full]
+        if len(rows) == 0 or not resources:
+            return
+
+        objects, positions, nearest, dist = _nearest_in_cells(
+            resources, self.position[rows], self.perception_radius[rows].max())
+        in_range = dist < self.perception_radius[rows]
+        rows, nearest = rows[in_range], nearest[in_range]
+        if len(rows) == 0:
+            return
+
+        for row, index in zip(rows, nearest):
+            self.target_resources[row] = objects[index]
+        self.state[rows] = COLLECTING
+        mask = np.zeros(self.count, dtype=bool)
+        mask[rows] = True
+        self._start_jump(mask)
+        self._steer(rows, positions[nearest] - self.position[rows])
+
+    def _return_to_colony(self, rows, colonies):
+        """Walk to the nearest colony and drop off anything carried"""
+        if len(rows) == 0 or not colonies:
+            return
+        # There are few colonies whatever the map size, so every returning
+        # ant is measured against each of them, a chunk of rows at a time
+        objects = list(colonies)
+        homes = np.array([colony.position for colony in objects], dtype=float)
+        nearest = np.empty(len(rows), dtype=np.int64)
+        far = np.empty(len(rows), dtype=bool)
+        for start in range(0, len(rows), ROW_CHUNK):
+            chunk = rows[start:start + ROW_CHUNK]
+            delta = homes[None, :, :] - self.position[chunk, None, :]
+            dist = np.hypot(delta[..., 0], delta[..., 1])
+            closest = dist.argmin(axis=1)
+            nearest[start:start + ROW_CHUNK] = closest
+            far[start:start + ROW_CHUNK] = dist[np.arange(len(chunk)), closest] > ANT_SIZE + COLONY_MIN_SIZE
+        self._steer(rows[far], homes[nearest[far]] - self.position[rows[far]])
+
+        arrived, arrived_at = rows[~far], nearest[~far]
+        if len(arrived) == 0:
+            return
+        for colony_index in np.unique(arrived_at):
+            colony = objects[colony_index]
+            minerals, plants = self.carried[arrived[arrived_at == colony_index]].sum(axis=0)
+            colony.resources['minerals'] += int(minerals)
+            colony.resources['plants'] += int(plants)
+        self.carried[arrived] = 0
+        self.state[arrived] = EXPLORING
+        mask = np.zeros(self.count, dtype=bool)
+        mask[arrived] = True
+        self._start_jump(mask)
+        for _ in arrived:
+            self.game.sounds.play_resource_deposit()
+
+    def _steer(self, rows, delta):
+        """Point ants along delta using the same L1 normalisation as Ant"""
+        total = np.abs(delta).sum(axis=1)
+        moving = total != 0
+        self.direction[rows[moving]] = delta[moving] / total[moving, None]
+
+    def apply_day_night(self, is_night):
+        """Batched version of Game.update_day_night_behaviors for ants"""
+        n = self.count
+        if not is_night:
+            self.speed[:n] = Behavior.DAY_NIGHT['ANT_DAY_SPEED']
+            self.perception_radius[:n] = Behavior.DAY_NIGHT['ANT_DAY_PERCEPTION']
+            return
+        self.speed[:n] = Behavior.DAY_NIGHT['ANT_NIGHT_SPEED']
+        self.perception_radius[:n] = Behavior.DAY_NIGHT['ANT_NIGHT_PERCEPTION']
+
+        # Ants that strayed too far at night head back home
+        delta = self.home_position[:n] - self.position[:n]
+        dist = np.hypot(delta[:, 0], delta[:, 1])  # NaN without a home
+        straying = np.flatnonzero(dist > DAY_NIGHT['NIGHT_VISIBILITY'])
+        self.direction[straying] = delta[straying] / dist[straying, None]
+
+    def carrying_count(self):
+        """Number of ants currently carrying any resource"""
+        return int(self.carried[:self.count].any(axis=1).sum())
+
+def _nearest_in_cells(grid, points, radius):
+    """Nearest object of a SpatialHash to each point, looking only nearby
+
+    Only the grid cells within radius of each point's cell are searched,
+    so the work grows with the points times the objects around them
+    rather than with every object on the map. The grid's objects are
+    sorted by cell once; each point finds its neighbouring buckets with
+    searchsorted, and all (point, candidate) pairs are measured in one
+    flat array.
+
+    Returns (objects, positions, nearest, dist): the grid's objects and
+    their positions, and for each point the index of its nearest object
+    and the distance to it. When nothing is within radius the distance
+    is at least radius (inf if no object was looked at).
+    """
+    objects = list(grid.locations)
+    positions = np.array([obj.position for obj in objects], dtype=float).reshape(-1, 2)
+    if len(points) * len(objects) <= DENSE_PAIRS:
+        # Too few pairs for the bucketing to pay off
+        delta = positions[None, :, :] - points[:, None, :]
+        dist = np.hypot(delta[..., 0], delta[..., 1])
+        nearest = dist.argmin(axis=1)
+        return objects, positions, nearest, dist[np.arange(len(points)), nearest]
+
+    cells = np.array(list(grid.locations.values()), dtype=np.int64).reshape(-1, 2)
+    keys = cells[:, 0] * CELL_STRIDE + cells[:, 1]
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+
+    n = len(points)
+    nearest = np.zeros(n, dtype=np.int64)
+    best = np.full(n, np.inf)
+    reach = int(math.ceil(radius / grid.cell_size))
+    offsets = np.array([(dx, dy) for dx in range(-reach, reach + 1)
+                        for dy in range(-reach, reach + 1)])
+    point_cells = np.floor_divide(points, grid.cell_size).astype(np.int64)
+    wanted = ((point_cells[:, None, 0] + offsets[None, :, 0]) * CELL_STRIDE +
+              point_cells[:, None, 1] + offsets[None, :, 1]).ravel()
+    start = np.searchsorted(keys, wanted, side='left')
+    count = np.searchsorted(keys, wanted, side='right') - start
+    total = int(count.sum())
+    if total == 0:
+        return objects, positions, nearest, best
+
+    # One entry per (point, candidate) pair, grouped by point
+    bucket = np.repeat(np.arange(len(count)), count)
+    rank = np.arange(total) - (np.cumsum(count) - count)[bucket]
+    candidate = order[start[bucket] + rank]
+    point = bucket // len(offsets)
+    delta = positions[candidate] - points[point]
+    dist = np.hypot(delta[:, 0], delta[:, 1])
+
+    per_point = count.reshape(n, -1).sum(axis=1)
+    found = np.flatnonzero(per_point)
+    best[found] = np.minimum.reduceat(dist, (np.cumsum(per_point) - per_point)[found])
+    closest = np.flatnonzero(dist == best[point])
+    points_hit, first = np.unique(point[closest], return_index=True)
+    nearest[points_hit] = candidate[closest[first]]
+    return objects, positions, nearest, best
+
+class _CarriedResources:
+    """Dict-like view of one ant's carried minerals and plants"""
+    KEYS = ('minerals', 'plants')
+
+    def __init__(self, ant):
+        self.ant = ant
+
+    def __getitem__(self, key):
+        return int(self.ant.swarm.carried[self.ant.row, self.KEYS.index(key)])
+
+    def __setitem__(self, key, value):
+        self.ant.swarm.carried[self.ant.row, self.KEYS.index(key)] = value
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def keys(self):
+        return self.KEYS
+
+    def items(self):
+        return [(key, self[key]) for key in self.KEYS]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+class _DetachedRow:
+    """One ant's columns copied out of a swarm, for a view that left it"""
+    def __init__(self, swarm, row):
+        for name in swarm._columns():
+            setattr(self, name, getattr(swarm, name)[row:row + 1].copy())
+        self.home_colonies = [swarm.home_colonies[row]]
+        self.target_resources = [swarm.target_resources[row]]
+
+def _column(name):
+    """Property reading and writing one scalar column of the swarm"""
+    def get(self):
+        return getattr(self.swarm, name)[self.row].item()
+
+    def set(self, value):
+        getattr(self.swarm, name)[self.row] = value
+    return property(get, set)
+
+class SwarmAnt(Ant):
+    """Per-ant view into an AntSwarm row
+
+    Reuses Ant's drawing and per-ant behaviour (collect_resources,
+    start_jump, ...) on top of the swarm's arrays, so code written
+    against Ant objects works unchanged.
+    """
+    __slots__ = ('swarm', 'row')
+
+    def __init__(self, game):
+        # Ant.__init__ is skipped: the state lives in the swarm
+        self.game = game
+        self.swarm = None
+        self.row = None
+
+    speed = _column('speed')
+    perception_radius = _column('perception_radius')
+    jump_height = _column('jump_height')
+    jump_count = _column('jump_count')
+    is_jumping = _column('is_jumping')
+    carry_capacity = _column('carry_capacity')
+    web_slow_timer = _column('web_slow_timer')
+    scuttle_offset = _column('scuttle_offset')
+
+    @property
+    def position(self):
+        x, y = self.swarm.position[self.row]
+        return (float(x), float(y))
+
+    @position.setter
+    def position(self, value):
+        self.swarm.position[self.row] = value
+
+    @property
+    def direction(self):
+        # A row view, so in-place edits like direction[0] = ... stick
+        return self.swarm.direction[self.row]
+
+    @direction.setter
+    def direction(self, value):
+        self.swarm.direction[self.row] = value
+
+    @property
+    def resources(self):
+        return _CarriedResources(self)
+
+    @resources.setter
+    def resources(self, value):
+        self.swarm.carried[self.row] = (value['minerals'], value['plants'])
+
+    @property
+    def state(self):
+        return STATE_NAMES[self.swarm.state[self.row]]
+
+    @state.setter
+    def state(self, value):
+        self.swarm.state[self.row] = STATE_CODES[value]
+
+    @property
+    def home_colony(self):
+        return self.swarm.home_colonies[self.row]
+
+    @home_colony.setter
+    def home_colony(self, colony):
+        self.swarm.home_colonies[self.row] = colony
+        self.swarm.home_position[self.row] = colony.position if colony is not None else (np.nan, np.nan)
+
+    @property
+    def target_resource(self):
+        return self.swarm.target_resources[self.row]
+
+    @target_resource.setter
+    def target_resource(self, resource):
+        self.swarm.target_resources[self.row] = resource
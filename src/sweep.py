@@ -0,0 +1,219 @@
+"""
+Parallel balance sweeps over the Economy and Behavior constants
+
+Every combination of a parameter grid is simulated once per seed in its
+own headless game, and the runs are spread over a ProcessPoolExecutor
+with one worker per core. Runs share nothing, so throughput grows with
+the number of cores. Metrics are sampled at fixed simulated intervals
+and written to a single columnar .npz file: one row per (run, sample),
+with a column per swept parameter and per metric. A run that raises is
+recorded in the failed_* arrays instead of stopping the sweep. --coarse
+runs each game with the offline-progress model for long sweeps (see
+headless.py for what that trades away).
+
+Usage:
+    python src/sweep.py --param Economy.Costs.ANT_MINERALS=4,8,16 \\
+        --param Behavior.DAY_NIGHT.ANT_NIGHT_SPEED=0.4,0.6 \\
+        --seeds 4 --days 3 --output sweep.npz
+
+    results = np.load('sweep.npz')
+    cheap = results['Economy.Costs.ANT_MINERALS'] == 4
+    results['ants'][cheap]
+"""
+
+import argparse
+import ast
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import numpy as np
+import constants
+from headless import advance_coarse, auto_expand, create_headless_game, summarize
+from constants import DAY_NIGHT
+
+# Columns sampled from headless.summarize() for every row
+METRICS = ('simulated_ms', 'ants', 'minerals', 'plants', 'snake_kills',
+           'colonies', 'rocks', 'trees', 'bushes')
+
+def resolve(path):
+    """(container, key) for a dotted constants path like Economy.Costs.ANT_PLANTS
+
+    Classes are walked by attribute and dicts (such as Behavior.DAY_NIGHT)
+    by key. Raises KeyError if the constant does not exist.
+    """
+    container = constants
+    *parents, name = path.split('.')
+    try:
+        for part in parents:
+            container = container[part] if isinstance(container, dict) else getattr(container, part)
+    except (AttributeError, KeyError):
+        raise KeyError(path) from None
+    exists = name in container if isinstance(container, dict) else hasattr(container, name)
+    if not parents or not exists:
+        raise KeyError(path)
+    return container, name
+
+@contextmanager
+def overridden(overrides):
+    """Temporarily set constants, restoring them afterwards
+
+    Worker processes run many simulations in turn, so every override is
+    undone before the next run starts.
+    """
+    saved = []
+    try:
+        for path, value in overrides.items():
+            container, name = resolve(path)
+            if isinstance(container, dict):
+                saved.append((container, name, container[name]))
+                container[name] = value
+            else:
+                saved.append((container, name, getattr(container, name)))
+                setattr(container, name, value)
+        yield
+    finally:
+        for container, name, value in reversed(saved):
+            if isinstance(container, dict):
+                container[name] = value
+            else:
+                setattr(container, name, value)
+
+def simulate(overrides, seed, days, sample_ms, swarm=False, expand=True, coarse=False):
+    """Run one seeded headless game, returning a metrics row per sample"""
+    with overridden(overrides):
+        game = create_headless_game(seed, swarm=swarm)
+        end_time = days * DAY_NIGHT['CYCLE_DURATION']
+        next_sample = sample_ms
+        rows = []
+
+        def after_tick(game):
+            nonlocal next_sample
+            if expand:
+                auto_expand(game)
+            if game.clock.get_ticks() >= next_sample:
+                metrics = summarize(game)
+                rows.append([metrics[name] for name in METRICS])
+                next_sample += sample_ms
+
+        if coarse:
+            advance_coarse(game, end_time, after_tick)
+        else:
+            while game.clock.get_ticks() < end_time and game.running:
+                game.step()
+                after_tick(game)
+    return rows
+
+def parse_param(text):
+    """'Economy.Costs.ANT_MINERALS=4,8,16' -> (path, [4, 8, 16])"""
+    path, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected PATH=V1,V2,... but got {text!r}")
+    try:
+        resolve(path)
+        return path, [ast.literal_eval(value.strip()) for value in values.split(',')]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"unknown constant {path!r}") from None
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"values must be numbers: {values!r}") from None
+
+def run_sweep(grid, seeds, days, sample_ms, workers=None, swarm=False, expand=True,
+              coarse=False):
+    """Simulate every grid combination for every seed in parallel
+
+    Args:
+        grid: List of (constant path, values) pairs
+        seeds: Seeds each combination is run with
+        days: Day/night cycles simulated per run
+        sample_ms: Simulated time between metric samples
+        coarse: Advance with the offline-progress model (see headless.py)
+
+    Returns a dict of equal-length columns: run, seed, one per parameter
+    and one per metric. Runs that raised contribute no rows; they are
+    listed in the failed_run, failed_seed and failed_error arrays.
+    """
+    paths = [path for path, _ in grid]
+    combinations = list(itertools.product(*(values for _, values in grid)))
+    tasks = [(dict(zip(paths, combination)), seed)
+             for combination in combinations for seed in seeds]
+
+    results = [[] for _ in tasks]
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(simulate, overrides, seed, days, sample_ms, swarm, expand,
+                                   coarse): run
+                   for run, (overrides, seed) in enumerate(tasks)}
+        for done, future in enumerate(as_completed(futures), 1):
+            run = futures[future]
+            try:
+                results[run] = future.result()
+            except Exception as e:
+                # Keep the finished runs; one crash should not lose the sweep
+                error = f"{type(e).__name__}: {e}"
+                failures.append((run, tasks[run][1], error))
+                print(f"\nRun {run} (seed {tasks[run][1]}) failed: {error}")
+            print(f"\r{done}/{len(tasks)} runs finished", end='', flush=True)
+    print()
+
+    columns = {'run': [], 'seed': []}
+    columns.update((path, []) for path in paths)
+    metrics = []
+    for run, ((overrides, seed), rows) in enumerate(zip(tasks, results)):
+        columns['run'].extend([run] * len(rows))
+        columns['seed'].extend([seed] * len(rows))
+        for path in paths:
+            columns[path].extend([overrides[path]] * len(rows))
+        metrics.extend(rows)
+    metrics = np.array(metrics, dtype=float).reshape(-1, len(METRICS))
+    columns = {name: np.array(values) for name, values in columns.items()}
+    columns.update((name, metrics[:, i]) for i, name in enumerate(METRICS))
+    failures.sort()
+    columns['failed_run'] = np.array([run for run, _, _ in failures], dtype=int)
+    columns['failed_seed'] = np.array([seed for _, seed, _ in failures], dtype=int)
+    columns['failed_error'] = np.array([error for _, _, error in failures], dtype=str)
+    return columns
+
+def print_summary(columns, paths):
+    """Mean final metrics per parameter combination, across seeds"""
+    final = np.r_[columns['run'][1:] != columns['run'][:-1], True]
+    keys = [tuple(row) for row in zip(*(columns[path][final] for path in paths))]
+    print('  '.join(paths + ['ants', 'minerals', 'plants', 'kills', 'colonies']))
+    for key in dict.fromkeys(keys):
+        mask = np.array([k == key for k in keys])
+        means = [columns[name][final][mask].mean()
+                 for name in ('ants', 'minerals', 'plants', 'snake_kills', 'colonies')]
+        print('  '.join([str(value) for value in key] + [f"{value:.1f}" for value in means]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep game constants over seeded headless runs")
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        metavar='PATH=V1,V2', help="Constant to sweep, e.g. Economy.Costs.ANT_PLANTS=10,15")
+    parser.add_argument('--seeds', type=int, default=4, help="Seeds per combination")
+    parser.add_argument('--days', type=float, default=3.0, help="Day/night cycles per run")
+    parser.add_argument('--sample-ms', type=float, default=DAY_NIGHT['CYCLE_DURATION'] / 4,
+                        help="Simulated milliseconds between samples")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--no-expand', action='store_true', help="Never build secondary colonies")
+    parser.add_argument('--swarm', action='store_true', help="Use the vectorized NumPy ant swarm")
+    parser.add_argument('--coarse', action='store_true',
+                        help="Advance in 1 s steps with the offline-progress model (see offline.py)")
+    parser.add_argument('--output', default='sweep.npz', help="Columnar results file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    start = time.perf_counter()
+    columns = run_sweep(args.param, range(args.seeds), args.days, args.sample_ms,
+                        args.workers, args.swarm, not args.no_expand, args.coarse)
+    elapsed = time.perf_counter() - start
+
+    np.savez(args.output, **columns)
+    if len(columns['run']):
+        print_summary(columns, [path for path, _ in args.param])
+    if len(columns['failed_run']):
+        print(f"{len(columns['failed_run'])} runs failed (see failed_run, failed_seed and failed_error)")
+    print(f"Wrote {len(columns['run'])} rows to {args.output} in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
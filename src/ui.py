@@ -4,6 +4,7 @@ from constants import (
     COLORS
 )
 import random
+from sprites import get_font, render_text
 
 # UI Constants
 UI_FONT_SIZE = UI.Tooltips.FONT_SIZE
@@ -402,8 +403,7 @@ class SettingsWindow:
         pygame.draw.rect(self.surface, (80, 80, 80, 255), (0, 0, self.width, self.height), 2)
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Settings", True, (255, 255, 255))
+        title = render_text("Settings", 24, (255, 255, 255))
         self.surface.blit(title, (self.width//2 - title.get_width()//2, 10))
         
         # Draw sliders
@@ -413,8 +413,7 @@ class SettingsWindow:
         screen.blit(self.surface, (self.x, self.y))
     
     def draw_slider(self, label, value, y):
-        font = pygame.font.Font(None, 20)
-        text = font.render(label, True, (255, 255, 255))
+        text = render_text(label, 20, (255, 255, 255))
         self.surface.blit(text, (10, y - 20))
         
         # Draw slider track
@@ -507,7 +506,6 @@ class SettingsMenu:
         
         # Add tooltip text
         self.tooltip_text = "Settings - Adjust music and sound effect volumes"
-        self.tooltip_font = pygame.font.Font(None, UI.Tooltips.FONT_SIZE)
         
         # Initialize pixel icons
         self.pixel_icons = {
@@ -517,17 +515,23 @@ class SettingsMenu:
         # Add tooltip corners
         self.tooltip_corners = self.generate_tooltip_corners()
 
-    def draw(self):
+    def bounds(self, mouse_pos):
+        """Screen area of the button, plus the band its tooltip uses on hover"""
+        if self.settings_button.collidepoint(mouse_pos):
+            top = self.settings_button.top - 60
+            return pygame.Rect(0, top, self.screen.get_width(), self.screen.get_height() - top)
+        return self.settings_button.inflate(2, 2)
+
+    def draw(self, mouse_pos):
         # Draw settings button and menu
         pygame.draw.rect(self.screen, (50, 50, 50), self.settings_button)
         settings_icon = self.pixel_icons['settings'].get_current_frame()
         self.screen.blit(settings_icon, self.settings_button)
         
         # Draw tooltip on hover
-        mouse_pos = pygame.mouse.get_pos()
         if self.settings_button.collidepoint(mouse_pos):
             # Use HUD's tooltip drawing method
-            HUD.draw_tooltip(self, self.screen, self.tooltip_text, self.settings_button, self.tooltip_font)
+            HUD.draw_tooltip(self, self.screen, self.tooltip_text, self.settings_button)
         
         # Draw settings window if visible
         if self.visible:
@@ -549,9 +553,8 @@ class SettingsMenu:
                            (sound_handle_x - 5, self.sound_slider_rect.y, 10, self.slider_height))
             
             # Draw labels
-            font = pygame.font.Font(None, 24)
-            music_label = font.render("Music", True, (200, 200, 200))
-            sound_label = font.render("Sound Effects", True, (200, 200, 200))
+            music_label = render_text("Music", 24, (200, 200, 200))
+            sound_label = render_text("Sound Effects", 24, (200, 200, 200))
             
             self.screen.blit(music_label, (self.window_rect.x + 50, self.music_slider_rect.y - 25))
             self.screen.blit(sound_label, (self.window_rect.x + 50, self.sound_slider_rect.y - 25))
@@ -670,7 +673,7 @@ class PixelLogo:
 
 class HUD:
     def __init__(self):
-        self.font = pygame.font.Font(None, UI.Tooltips.FONT_SIZE)
+        self.font = get_font(UI.Tooltips.FONT_SIZE)
         self.colors = COLORS
         self.tooltips = TOOLTIP_TEXTS
         self.tooltip_regions = {}
@@ -801,13 +804,10 @@ class HUD:
             
         return corners
 
-    def draw_tooltip(self, screen, text, anchor_rect, font=None):
+    def draw_tooltip(self, screen, text, anchor_rect, font_size=UI.Tooltips.FONT_SIZE):
         """Draw tooltip with decorative frame"""
-        if font is None:
-            font = self.font
-            
         # Create tooltip surface
-        tooltip_surface = font.render(text, True, UI.Tooltips.TEXT_COLOR)
+        tooltip_surface = render_text(text, font_size, UI.Tooltips.TEXT_COLOR)
         tooltip_rect = tooltip_surface.get_rect()
         
         # Calculate initial position (above the element)
@@ -861,7 +861,15 @@ class HUD:
                 self.active_tooltip = key
                 break
 
-    def draw(self, surface, colonies, ants):
+    def bounds(self, mouse_pos):
+        """Screen area of the top frame, widened while a tooltip may show"""
+        frame = self.top_frame.get_rect(topleft=(5, 5))
+        band = pygame.Rect(0, 0, WINDOW_WIDTH, frame.bottom + 60)
+        if band.collidepoint(mouse_pos):
+            return band
+        return frame
+
+    def draw(self, surface, colonies, ants, mouse_pos):
         main_colony = colonies[0] if colonies else None
         if main_colony:
             # Draw single top frame
@@ -906,7 +914,6 @@ class HUD:
                 value=self.kills)
 
             # Handle tooltips
-            mouse_pos = pygame.mouse.get_pos()
             self.handle_tooltips(surface, mouse_pos, main_colony, colonies, ants)
 
             # Draw tooltips for hovered elements
@@ -925,8 +932,8 @@ class HUD:
         surface.blit(icon.get_current_frame(), pos)
         
         # Draw label with shadow
-        label_shadow = self.font.render(label, True, (0, 0, 0, 128))
-        label_text = self.font.render(label, True, (255, 255, 255))
+        label_shadow = render_text(label, UI.Tooltips.FONT_SIZE, (0, 0, 0, 128))
+        label_text = render_text(label, UI.Tooltips.FONT_SIZE, (255, 255, 255))
         
         # Position label after icon
         surface.blit(label_shadow, (pos[0] + 45, pos[1] - 2))  # Slightly above center
@@ -934,8 +941,8 @@ class HUD:
         
         # Draw value with shadow
         value_text = str(value)
-        shadow_value = self.font.render(value_text, True, (0, 0, 0, 128))
-        value_surface = self.font.render(value_text, True, (255, 255, 255))
+        shadow_value = render_text(value_text, UI.Tooltips.FONT_SIZE, (0, 0, 0, 128))
+        value_surface = render_text(value_text, UI.Tooltips.FONT_SIZE, (255, 255, 255))
         
         # Position value below label
         surface.blit(shadow_value, (pos[0] + 45, pos[1] + 12))
@@ -950,8 +957,8 @@ class HUD:
         surface.blit(icon.get_current_frame(), pos)
         
         # Draw label with shadow
-        label_shadow = self.font.render(label, True, (0, 0, 0, 128))
-        label_text = self.font.render(label, True, (255, 255, 255))
+        label_shadow = render_text(label, UI.Tooltips.FONT_SIZE, (0, 0, 0, 128))
+        label_text = render_text(label, UI.Tooltips.FONT_SIZE, (255, 255, 255))
         
         # Position label after icon
         surface.blit(label_shadow, (pos[0] + 45, pos[1] - 2))  # Slightly above center
@@ -973,8 +980,8 @@ class HUD:
         
         # Draw value with shadow
         value_text = f"{value}"
-        shadow_value = self.font.render(value_text, True, (0, 0, 0, 128))
-        value_surface = self.font.render(value_text, True, (255, 255, 255))
+        shadow_value = render_text(value_text, UI.Tooltips.FONT_SIZE, (0, 0, 0, 128))
+        value_surface = render_text(value_text, UI.Tooltips.FONT_SIZE, (255, 255, 255))
         
         # Position value to the right of bar
         surface.blit(shadow_value, (pos[0] + 134, pos[1] + 12))
@@ -1025,4 +1032,18 @@ class HUD:
     def increment_kills(self):
         """Increment kill counter and trigger skull flash"""
         self.kills += 1
-        self.pixel_icons['skull'].trigger_flash() 
\ No newline at end of file
+        self.pixel_icons['skull'].trigger_flash()
+
+class HeadlessHUD:
+    """HUD stand-in for headless simulation: tracks kills, draws nothing"""
+    def __init__(self):
+        self.kills = 0
+
+    def update(self, mouse_pos):
+        pass
+
+    def trigger_icon_animation(self, icon_type):
+        pass
+
+    def increment_kills(self):
+        self.kills += 1
@@ -1,5 +1,9 @@
 import pygame
 import os
+from pathlib import Path
+
+# Generated assets (backgrounds, sound banks, ...) are cached here between runs
+CACHE_DIR_ENV = 'MUCHAS_CACAS_CACHE'
 
 def load_assets():
     """Load and return game assets (images, sprites, etc.)"""
@@ -13,4 +17,28 @@ def load_assets():
     # assets['images']['logo'] = pygame.image.load('assets/images/logo.png').convert_alpha()
     # assets['sprites']['ant'] = pygame.image.load('assets/sprites/ant.png').convert_alpha()
     
-    return assets 
\ No newline at end of file
+    return assets 
+
+def cache_dir():
+    """Directory for on-disk caches, or None if caching is disabled
+
+    Defaults to ~/.cache/muchas-cacas. Set MUCHAS_CACAS_CACHE to use a
+    different directory, or to an empty string to disable caching.
+    """
+    location = os.environ.get(CACHE_DIR_ENV)
+    if location is None:
+        location = Path.home() / '.cache' / 'muchas-cacas'
+    elif not location:
+        return None
+    path = Path(location)
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Cache directory unavailable: {e}")
+        return None
+    return path
+
+def cache_path(name):
+    """Path of a named cache file, or None if caching is disabled"""
+    directory = cache_dir()
+    return directory / name if directory else None
@@ -0,0 +1,179 @@
+"""
+Maps larger than the window
+
+The world keeps its own size (Game.width, Game.height) and the window
+shows a Camera's view of it. Everything is simulated and stored in world
+coordinates; the draw methods take the camera origin and subtract it.
+
+Terrain for such maps is split into World.CHUNK_SIZE squares generated
+from the same noise recipe as the single-screen background, each the
+first time it scrolls into view. Chunk surfaces are kept in an LRU cache
+of World.MAX_CACHED_CHUNKS, so exploring a large map never holds more
+than that many in memory; evicted chunks are read back from the disk
+cache when they come into view again.
+
+Only the region around the view (World.ACTIVE_MARGIN beyond each edge)
+is simulated at the normal level of detail. Ants outside it get a full
+update once every World.FAR_TICK_INTERVAL ticks and glide along their
+heading in between (see lod.py), which cuts their cost several times
+over while they keep gathering and delivering.
+
+Usage:
+    camera = Camera((1440, 2400))
+    camera.center_on(colony.position)
+    terrain = Terrain((1440, 2400))
+    terrain.compose(camera.rect, view_surface)
+"""
+
+import argparse
+from collections import OrderedDict
+import pygame
+from background import load_chunk
+from constants import World, WINDOW_WIDTH, WINDOW_HEIGHT
+
+# Held keys scroll the camera in these directions
+SCROLL_KEYS = {
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1)
+}
+
+def parse_world_size(text):
+    """'1440x2400' -> (1440, 2400), for --world options"""
+    width, _, height = text.lower().partition('x')
+    try:
+        size = (int(width), int(height))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT but got {text!r}") from None
+    if size[0] < WINDOW_WIDTH or size[1] < WINDOW_HEIGHT:
+        raise argparse.ArgumentTypeError(f"the world must be at least {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+    return size
+
+class Camera:
+    """Window-sized view onto the world, scrolled with the arrow keys or WASD
+
+    Held keys are tracked from KEYDOWN/KEYUP events rather than polled,
+    so recorded input (see replay.py) scrolls a replay the same way.
+    """
+    def __init__(self, world_size, view_size=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        self.world_width, self.world_height = world_size
+        self.width, self.height = view_size
+        self.x = 0
+        self.y = 0
+        self.held = set()
+
+    @property
+    def origin(self):
+        """World position of the window's top-left pixel"""
+        return (self.x, self.y)
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    @property
+    def fixed(self):
+        """True when the whole world fits in the window"""
+        return self.world_width <= self.width and self.world_height <= self.height
+
+    def move_to(self, x, y):
+        """Put the view's top-left at (x, y), kept inside the world
+
+        Returns True if the view moved.
+        """
+        x = int(max(0, min(x, self.world_width - self.width)))
+        y = int(max(0, min(y, self.world_height - self.height)))
+        moved = (x, y) != (self.x, self.y)
+        self.x, self.y = x, y
+        return moved
+
+    def center_on(self, position):
+        return self.move_to(position[0] - self.width // 2, position[1] - self.height // 2)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in SCROLL_KEYS:
+            self.held.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.held.discard(event.key)
+
+    def update(self, frame_ms):
+        """Scroll by the held keys for one frame; returns True if the view moved"""
+        if not self.held or self.fixed:
+            return False
+        step = World.SCROLL_SPEED * frame_ms
+        dx = sum(SCROLL_KEYS[key][0] for key in self.held)
+        dy = sum(SCROLL_KEYS[key][1] for key in self.held)
+        return self.move_to(self.x + round(dx * step), self.y + round(dy * step))
+
+    def to_world(self, position):
+        """World position under a window position (e.g. the cursor)"""
+        return (position[0] + self.x, position[1] + self.y)
+
+    def to_screen(self, position):
+        return (position[0] - self.x, position[1] - self.y)
+
+    def visible(self, items):
+        """The items whose bounds() overlap the view"""
+        if self.fixed:
+            return items
+        view = self.rect
+        return [item for item in items if view.colliderect(item.bounds())]
+
+    def active_rect(self):
+        """World area simulated at the normal level of detail (None when all of it is)"""
+        if self.fixed:
+            return None
+        margin = World.ACTIVE_MARGIN
+        return self.rect.inflate(margin * 2, margin * 2)
+
+class Terrain:
+    """Forest floor of a large map, generated in chunks as they come into view
+
+    Chunk surfaces live in an LRU cache: drawing a chunk marks it most
+    recently used, and past `capacity` the least recently used one is
+    dropped.
+    """
+    def __init__(self, world_size, chunk_size=World.CHUNK_SIZE, capacity=World.MAX_CACHED_CHUNKS):
+        self.world_width, self.world_height = world_size
+        self.chunk_size = chunk_size
+        self.capacity = capacity
+        self.surfaces = OrderedDict()  # (chunk_x, chunk_y) -> Surface
+        self.generated = 0  # Chunks built or loaded, to judge the cache size
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def chunk(self, key):
+        """Surface of one chunk, building it on first use"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        size = self.chunk_size
+        x, y = key[0] * size, key[1] * size
+        width = min(size, self.world_width - x)
+        height = min(size, self.world_height - y)
+        surface = load_chunk((self.world_width, self.world_height), (x, y), (width, height))
+        self.generated += 1
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def keys_in(self, rect):
+        """Chunks overlapping a world rect, row by row"""
+        size = self.chunk_size
+        last_x = (min(rect.right, self.world_width) - 1) // size
+        last_y = (min(rect.bottom, self.world_height) - 1) // size
+        return [(chunk_x, chunk_y)
+                for chunk_y in range(max(rect.top, 0) // size, last_y + 1)
+                for chunk_x in range(max(rect.left, 0) // size, last_x + 1)]
+
+    def compose(self, view, surface):
+        """Draw the terrain under the world rect view onto surface"""
+        size = self.chunk_size
+        for key in self.keys_in(view):
+            surface.blit(self.chunk(key), (key[0] * size - view.x, key[1] * size - view.y))
+        return surface